@@ -0,0 +1,18 @@
+import os
+
+from matchpredictor.evaluation.backtester import backtest, print_backtest
+from matchpredictor.league_predictor_report import CSV_LOCATION
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.results_store import open_results_store
+
+leagues = ['Barclays Premier League', 'English League Championship', 'Italy Serie A']
+seasons = [2019, 2020, 2021, 2022]
+
+# Keep the results in a local store, shared with the app and the reports, if RESULTS_STORE is set
+store = open_results_store(os.environ['RESULTS_STORE']) if os.environ.get('RESULTS_STORE') else None
+
+# Skip the rows of other leagues as the results are parsed, or look them up in the store
+results = load_results(CSV_LOCATION, ResultFilter(leagues=frozenset(leagues)), os.cpu_count() or 1, store)
+
+print_backtest(backtest(results, leagues, seasons))
@@ -0,0 +1,28 @@
+import argparse
+import os
+import sys
+
+from matchpredictor.app import MODEL_TRAINERS
+from matchpredictor.evaluation.benchmark import DATASET_SIZES, DEFAULT_THRESHOLD, find_regressions, load_baseline, \
+    print_benchmarks, run_benchmarks, save_baseline
+
+parser = argparse.ArgumentParser(description="Benchmarks the predictors against a stored baseline.")
+parser.add_argument("--baseline", default="benchmark_baseline.json", help="the JSON baseline file")
+parser.add_argument("--update", action="store_true", help="record the results as the new baseline")
+parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="the relative change flagged")
+parser.add_argument("--sizes", type=int, nargs="+", default=list(DATASET_SIZES), help="the training set sizes")
+parser.add_argument("--models", nargs="+", help="the models to benchmark, all by default")
+args = parser.parse_args()
+
+trainers = [trainer for trainer in MODEL_TRAINERS if args.models is None or trainer.name in args.models]
+results = run_benchmarks(args.sizes, trainers)
+
+if args.update or not os.path.exists(args.baseline):
+    print_benchmarks(results)
+    save_baseline(args.baseline, results)
+    print(f" Recorded the baseline in {args.baseline}")
+else:
+    regressions = find_regressions(load_baseline(args.baseline), results, args.threshold)
+    print_benchmarks(results, regressions)
+    # Fail, e.g. in CI, when anything regressed
+    sys.exit(1 if regressions else 0)
@@ -1,6 +1,8 @@
 import os
 
-from flask import Flask
+from flask import Flask, Response, request, stream_with_context
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
 
 # Create a Flask application
 app = Flask(__name__)
@@ -40,6 +42,27 @@ def handle_fixture() -> str:
     """
     return fixture()
 
+
+@app.route('/synthetic.csv')
+def synthetic() -> Response:
+    """
+    Handle the "/synthetic.csv" endpoint and stream a synthetic spi_matches-compatible CSV, configured by the
+    leagues, teams, seasons, first_season, seed and rows query parameters.
+
+    Returns:
+        Response: A streamed response containing the CSV.
+    """
+    dataset = SyntheticDataset(
+        leagues=request.args.get('leagues', default=1, type=int),
+        teams=request.args.get('teams', default=20, type=int),
+        seasons=request.args.get('seasons', default=1, type=int),
+        first_season=request.args.get('first_season', default=2016, type=int),
+        seed=request.args.get('seed', default=0, type=int),
+        rows=request.args.get('rows', type=int),
+    )
+    return Response(stream_with_context(synthetic_csv(dataset)), mimetype='text/csv')
+
+
 # Run the Flask application with debug mode enabled on host "0.0.0.0" and port specified in the environment variable "PORT" (default: 5002)
 app.run(debug=True, host="0.0.0.0", port=int(os.environ.get('PORT', 5002)))
 
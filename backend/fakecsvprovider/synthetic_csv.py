@@ -0,0 +1,203 @@
+import csv
+import datetime
+import io
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from matchpredictor.evaluation.benchmark import poisson_goals
+
+# The columns of fivethirtyeight's spi_matches.csv
+COLUMNS = [
+    "season", "date", "league_id", "league", "team1", "team2", "spi1", "spi2", "prob1", "prob2", "probtie",
+    "proj_score1", "proj_score2", "importance1", "importance2", "score1", "score2", "xg1", "xg2", "nsxg1", "nsxg2",
+    "adj_score1", "adj_score2",
+]
+
+# The number of rows written per chunk of a streamed CSV
+CHUNK_ROWS = 1_000
+
+# The average goals of a home and an away team, as in the top European leagues
+HOME_GOALS = 1.55
+AWAY_GOALS = 1.20
+
+# The most goals considered when computing outcome probabilities; more are vanishingly rare
+MAX_GOALS = 10
+
+
+@dataclass(frozen=True)
+class SyntheticDataset(object):
+    """
+    Describes a synthetic dataset.
+
+    Attributes:
+        leagues (int): The number of leagues.
+        teams (int): The number of teams per league.
+        seasons (int): The number of seasons, each a double round robin of every league.
+        first_season (int): The first season.
+        seed (int): The seed of the generator. The same dataset and seed always generate the same rows.
+        rows (Optional[int]): The most rows generated. Defaults to None, in which case every season is.
+    """
+    leagues: int = 1
+    teams: int = 20
+    seasons: int = 1
+    first_season: int = 2016
+    seed: int = 0
+    rows: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class _Team(object):
+    name: str
+    attack: float
+    defense: float
+
+    def spi(self) -> float:
+        # Soccer Power Index, out of 100, rising with attack and falling with the goals conceded
+        return max(0.0, min(100.0, 50 + 25 * math.log(self.attack / self.defense)))
+
+
+def synthetic_csv(dataset: SyntheticDataset) -> Iterator[str]:
+    """
+    Generates an spi_matches-compatible CSV, in chunks, so that millions of rows can be streamed without
+    being held in memory.
+
+    Each team has an attack and a defense strength. The goals of a match are drawn from Poisson distributions
+    whose means are the average home or away goals, scaled by the strengths of the teams, and the outcome
+    probabilities, projected scores and expected goals follow from the same means.
+
+    Args:
+        dataset (SyntheticDataset): The dataset to generate.
+
+    Returns:
+        Iterator[str]: The CSV, the header first, then CHUNK_ROWS rows per chunk.
+    """
+    generator = random.Random(dataset.seed)
+    leagues = [_league(generator, index, dataset.teams) for index in range(dataset.leagues)]
+    probabilities: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    rows = 0
+
+    for season in range(dataset.first_season, dataset.first_season + dataset.seasons):
+        for league_index, (league, teams) in enumerate(leagues):
+            for round_index, matches in enumerate(_double_round_robin(teams)):
+                date = datetime.date(season, 8, 1) + datetime.timedelta(weeks=round_index)
+                for home, away in matches:
+                    if dataset.rows is not None and rows >= dataset.rows:
+                        yield buffer.getvalue()
+                        return
+
+                    home_mean = HOME_GOALS * home.attack * away.defense
+                    away_mean = AWAY_GOALS * away.attack * home.defense
+                    home_goals, away_goals = poisson_goals(generator, home_mean), poisson_goals(generator, away_mean)
+                    # The probabilities only depend on the teams, so they are computed once per pairing
+                    pairing = (home.name, away.name)
+                    if pairing not in probabilities:
+                        probabilities[pairing] = _outcome_probabilities(home_mean, away_mean)
+                    prob1, prob2, probtie = probabilities[pairing]
+                    xg1 = max(0.0, generator.gauss(home_mean, 0.4))
+                    xg2 = max(0.0, generator.gauss(away_mean, 0.4))
+
+                    writer.writerow([
+                        season, date.isoformat(), league_index, league, home.name, away.name,
+                        f"{home.spi():.2f}", f"{away.spi():.2f}", f"{prob1:.4f}", f"{prob2:.4f}", f"{probtie:.4f}",
+                        f"{home_mean:.2f}", f"{away_mean:.2f}", f"{generator.uniform(0, 100):.1f}",
+                        f"{generator.uniform(0, 100):.1f}", home_goals, away_goals, f"{xg1:.2f}", f"{xg2:.2f}",
+                        f"{xg1 * 0.9:.2f}", f"{xg2 * 0.9:.2f}", f"{home_goals:.2f}", f"{away_goals:.2f}",
+                    ])
+                    rows += 1
+
+                    if rows % CHUNK_ROWS == 0:
+                        yield buffer.getvalue()
+                        buffer.seek(0)
+                        buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def league_name(index: int) -> str:
+    """
+    Names a league of the synthetic datasets, so that other fakes can refer to the same leagues.
+
+    Args:
+        index (int): The index of the league, from 0.
+
+    Returns:
+        str: The name of the league.
+    """
+    return f"Synthetic League {index + 1}"
+
+
+def team_name(league_index: int, index: int) -> str:
+    """
+    Names a team of the synthetic datasets, so that other fakes can refer to the same teams.
+
+    Args:
+        league_index (int): The index of the team's league, from 0.
+        index (int): The index of the team in its league, from 0.
+
+    Returns:
+        str: The name of the team.
+    """
+    return f"{league_name(league_index)} Team {index + 1:02d}"
+
+
+def _league(generator: random.Random, index: int, teams: int) -> Tuple[str, List[_Team]]:
+    # Strengths are log-normal around 1, so most teams are average and a few dominate or struggle
+    return league_name(index), [
+        _Team(team_name(index, number), generator.lognormvariate(0, 0.25), generator.lognormvariate(0, 0.2))
+        for number in range(teams)
+    ]
+
+
+def _double_round_robin(teams: List[_Team]) -> List[List[Tuple[_Team, _Team]]]:
+    """
+    Schedules a double round robin with the circle method: every team plays every other team at home and away,
+    once per round at most.
+
+    Args:
+        teams (List[_Team]): The teams.
+
+    Returns:
+        List[List[Tuple[_Team, _Team]]]: The home and away team of each match, per round.
+    """
+    # With an odd number of teams, the team drawn against None has a bye
+    rotation: List[Optional[_Team]] = list(teams) + ([None] if len(teams) % 2 == 1 else [])
+    rounds: List[List[Tuple[_Team, _Team]]] = []
+
+    for _ in range(len(rotation) - 1):
+        matches = []
+        for i in range(len(rotation) // 2):
+            home, away = rotation[i], rotation[-1 - i]
+            if home is not None and away is not None:
+                matches.append((home, away))
+        rounds.append(matches)
+        # Keep the first team in place and rotate the others
+        rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+
+    # The second half of the season swaps home and away
+    return rounds + [[(away, home) for home, away in matches] for matches in rounds]
+
+
+def _outcome_probabilities(home_mean: float, away_mean: float) -> Tuple[float, float, float]:
+    """
+    Computes the probabilities of a home win, an away win and a draw, for independent Poisson goals.
+
+    Args:
+        home_mean (float): The mean goals of the home team.
+        away_mean (float): The mean goals of the away team.
+
+    Returns:
+        Tuple[float, float, float]: The probabilities of a home win, an away win and a draw.
+    """
+    def distribution(mean: float) -> List[float]:
+        return [math.exp(-mean) * mean ** goals / math.factorial(goals) for goals in range(MAX_GOALS + 1)]
+
+    home, away = distribution(home_mean), distribution(away_mean)
+    home_win = sum(home[h] * away[a] for h in range(MAX_GOALS + 1) for a in range(h))
+    away_win = sum(home[h] * away[a] for a in range(MAX_GOALS + 1) for h in range(a))
+    return home_win, away_win, max(0.0, 1 - home_win - away_win)
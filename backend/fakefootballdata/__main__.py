@@ -0,0 +1,18 @@
+import os
+
+from fakefootballdata.fake_server import FakeSettings, create_fake_server
+
+# Configure the initial matches and faults from the environment; they can be changed at /admin/settings
+settings = FakeSettings(
+    matches=int(os.environ.get('MATCHES', 10)),
+    leagues=int(os.environ.get('LEAGUES', 1)),
+    teams=int(os.environ.get('TEAMS', 20)),
+    seed=int(os.environ.get('SEED', 0)),
+    latency_ms=float(os.environ.get('LATENCY_MS', 0)),
+    jitter_ms=float(os.environ.get('JITTER_MS', 0)),
+    error_rate=float(os.environ.get('ERROR_RATE', 0)),
+    rate_limit_rate=float(os.environ.get('RATE_LIMIT_RATE', 0)),
+)
+
+# Run the fake server threaded, so that injected latency delays requests rather than queueing them
+create_fake_server(settings).run(host="0.0.0.0", port=int(os.environ.get('PORT', 5003)), threaded=True)
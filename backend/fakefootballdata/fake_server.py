@@ -0,0 +1,199 @@
+import random
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+from flask import Flask, Response, jsonify, request
+
+from fakecsvprovider.synthetic_csv import league_name, team_name
+
+
+@dataclass(frozen=True)
+class FakeSettings(object):
+    """
+    Describes the matches the fake football-data server lists and the faults it injects.
+
+    Attributes:
+        matches (int): The number of upcoming matches listed.
+        leagues (int): The number of leagues the matches are drawn from, named as in the synthetic CSV.
+        teams (int): The number of teams per league.
+        seed (int): The seed of the match list. The same settings always list the same matches.
+        latency_ms (float): How long every response is delayed, in milliseconds.
+        jitter_ms (float): The most extra delay added at random, in milliseconds.
+        error_rate (float): The share of the requests answered with a 500.
+        rate_limit_rate (float): The share of the requests answered with a 429, as when the request limit is reached.
+    """
+    matches: int = 10
+    leagues: int = 1
+    teams: int = 20
+    seed: int = 0
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+
+
+def fake_matches(settings: FakeSettings) -> List[Dict[str, Any]]:
+    """
+    Generates the upcoming matches, in the format of the football-data matches endpoint.
+
+    Args:
+        settings (FakeSettings): The settings of the fake server.
+
+    Returns:
+        List[Dict[str, Any]]: The matches.
+    """
+    generator = random.Random(settings.seed)
+
+    def team(league_index: int, index: int) -> Dict[str, Any]:
+        name = team_name(league_index, index)
+        return {"name": name, "shortName": name, "tla": f"T{index + 1:02d}"}
+
+    matches: List[Dict[str, Any]] = []
+    for match_id in range(settings.matches):
+        league_index = generator.randrange(settings.leagues)
+        home, away = generator.sample(range(settings.teams), 2)
+        matches.append({
+            "id": match_id + 1,
+            "area": {"name": "Synthetic", "code": "SYN"},
+            "competition": {"name": league_name(league_index), "code": f"SL{league_index + 1}", "type": "LEAGUE"},
+            "status": "SCHEDULED",
+            "homeTeam": team(league_index, home),
+            "awayTeam": team(league_index, away),
+        })
+    return matches
+
+
+class FakeState(object):
+    """
+    Holds the settings of the fake server and the matches they generate, which change together.
+    """
+
+    def __init__(self, settings: FakeSettings) -> None:
+        """
+        Initializes the FakeState, generating the matches of the initial settings.
+
+        Args:
+            settings (FakeSettings): The initial settings.
+        """
+        self.__lock = Lock()
+        self.__settings = settings
+        self.__matches = fake_matches(settings)
+        self.__faults = random.Random(settings.seed)
+
+    def settings(self) -> FakeSettings:
+        """
+        Retrieves the settings.
+
+        Returns:
+            FakeSettings: The current settings.
+        """
+        with self.__lock:
+            return self.__settings
+
+    def update(self, changes: Dict[str, Any]) -> FakeSettings:
+        """
+        Changes some of the settings, and generates the matches again.
+
+        Args:
+            changes (Dict[str, Any]): The new values, keyed by setting name.
+
+        Returns:
+            FakeSettings: The new settings.
+
+        Raises:
+            TypeError: If a setting is unknown or has a value of the wrong type.
+            ValueError: If the settings cannot generate matches, e.g. with fewer than two teams.
+        """
+        with self.__lock:
+            # Generate the matches before changing anything, so that invalid settings leave the state as it was
+            settings = replace(self.__settings, **changes)
+            matches = fake_matches(settings)
+            self.__settings, self.__matches = settings, matches
+            return settings
+
+    def next_request(self) -> Tuple[FakeSettings, List[Dict[str, Any]], float, float]:
+        """
+        Draws the fate of a request.
+
+        Returns:
+            Tuple[FakeSettings, List[Dict[str, Any]], float, float]: The settings, the matches, a uniform draw that
+            decides whether a fault is injected and the delay of the response, in seconds.
+        """
+        with self.__lock:
+            settings = self.__settings
+            delay = (settings.latency_ms + self.__faults.random() * settings.jitter_ms) / 1000
+            return settings, self.__matches, self.__faults.random(), delay
+
+
+def create_fake_server(settings: FakeSettings = FakeSettings()) -> Flask:
+    """
+    Creates a local stand-in for the football-data API, which lists generated matches and injects latency,
+    errors and rate-limit responses on demand, so that the app can be load tested offline.
+
+    The settings can be changed while the server runs, with a PUT of some of them as JSON to /admin/settings.
+
+    Args:
+        settings (FakeSettings): The initial settings.
+
+    Returns:
+        Flask: The fake server.
+    """
+    app = Flask(__name__)
+    state = FakeState(settings)
+
+    @app.route('/v4/matches')
+    def matches() -> Response:
+        """
+        Lists the upcoming matches, unless a fault is injected.
+
+        Returns:
+            Response: The matches as JSON, or an error.
+        """
+        current, listed, draw, delay = state.next_request()
+        time.sleep(delay)
+
+        if 'X-Auth-Token' not in request.headers:
+            return Response('{"message": "The resource you are looking for is restricted.", "errorCode": 403}',
+                            403, mimetype='application/json')
+        if draw < current.rate_limit_rate:
+            return Response('{"message": "You reached your request limit. Wait 60 seconds.", "errorCode": 429}',
+                            429, headers={'X-RequestCounter-Reset': '60'}, mimetype='application/json')
+        if draw < current.rate_limit_rate + current.error_rate:
+            return Response('Internal Server Error', 500)
+
+        return jsonify({"resultSet": {"count": len(listed)}, "matches": listed})
+
+    @app.route('/admin/settings', methods=['GET'])
+    def get_settings() -> Response:
+        """
+        Retrieves the settings.
+
+        Returns:
+            Response: The settings as JSON.
+        """
+        return jsonify(asdict(state.settings()))
+
+    @app.route('/admin/settings', methods=['PUT'])
+    def put_settings() -> Response:
+        """
+        Changes some of the settings, e.g. {"latency_ms": 2000} to make every request slow.
+
+        Returns:
+            Response: The new settings as JSON, or a 400 if they are invalid.
+        """
+        changes: Any = request.get_json(force=True)
+        if not isinstance(changes, dict):
+            return Response("The settings must be a JSON object", 400)
+
+        unknown = set(changes) - {field.name for field in fields(FakeSettings)}
+        if unknown:
+            return Response(f"Unknown settings: {', '.join(sorted(unknown))}", 400)
+
+        try:
+            return jsonify(asdict(state.update(changes)))
+        except (TypeError, ValueError) as e:
+            return Response(f"Invalid settings: {e}", 400)
+
+    return app
@@ -0,0 +1,41 @@
+import argparse
+import logging
+from threading import Thread
+
+from werkzeug.serving import make_server
+
+from matchpredictor.loadtest.load_generator import DEFAULT_CONCURRENCY, print_load_report, run_load, summarize
+from matchpredictor.loadtest.request_mix import SYNTHETIC_MIX, fetch_catalog, load_request_log, parse_mix, \
+    synthetic_requests
+
+parser = argparse.ArgumentParser(description="Replays recorded or synthetic request mixes against the app.")
+parser.add_argument("--url", help="the base URL of a running app; by default one is started from the environment")
+parser.add_argument("--log", help="a requests.http file or JSON lines log to replay, instead of a synthetic mix")
+parser.add_argument("--mix", help="the weights of the synthetic mix, e.g. forecast=6,forecast-in-progress=2,teams=1")
+parser.add_argument("--requests", type=int, default=1000, help="the number of requests to send")
+parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="the number of requests in flight")
+parser.add_argument("--rate", type=float, help="the requests per second; as fast as possible by default")
+parser.add_argument("--seed", type=int, default=0, help="the seed of the synthetic mix")
+args = parser.parse_args()
+
+base_url = args.url
+if base_url is None:
+    # Start the app locally, as configured by the environment, e.g. against the fake CSV provider
+    from matchpredictor.app import create_app
+    from matchpredictor.environment import app_environment_from_env
+
+    # Keep the app's access log out of the report
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, create_app(app_environment_from_env()), threaded=True)
+    Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+if args.log is not None:
+    load_requests = load_request_log(args.log)
+else:
+    teams, models = fetch_catalog(base_url)
+    mix = parse_mix(args.mix) if args.mix is not None else SYNTHETIC_MIX
+    load_requests = synthetic_requests(args.requests, teams, models, mix, args.seed)
+
+timings, elapsed = run_load(base_url, load_requests, args.requests, args.concurrency, args.rate)
+print_load_report(summarize(timings, elapsed))
@@ -0,0 +1,4 @@
+import time
+
+# When the app started importing, so that the startup timeline can tell how long the imports took
+IMPORT_STARTED = time.perf_counter()
@@ -1,57 +1,162 @@
-from dataclasses import dataclass
-from typing import List
+import atexit
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 
 from flask import Flask
 
+from matchpredictor import IMPORT_STARTED
+from matchpredictor.forecast.bulkhead import BulkheadLimit, Bulkheads
 from matchpredictor.forecast.forecast_api import forecast_api
 from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.forecast.prediction_pool import PredictionPool
 from matchpredictor.health import health_api
 from matchpredictor.matchresults.result import Result
-from matchpredictor.matchresults.results_provider import training_results
-from matchpredictor.model.model_provider import ModelProvider, Model
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_provider import training_results, results_version
+from matchpredictor.matchresults.results_store import open_results_store
+from matchpredictor.metrics.collectors import caches_collector, forecaster_collector, models_collector, \
+    process_collector
+from matchpredictor.metrics.metrics_api import instrument_app, metrics_api
+from matchpredictor.metrics.registry import MetricsRegistry
+from matchpredictor.model.model_provider import ModelProvider, Model, ModelCost
 from matchpredictor.model.models_api import models_api
 from matchpredictor.predictors.alphabet_predictor import AlphabetPredictor
 from matchpredictor.predictors.home_predictor import HomePredictor
-from matchpredictor.predictors.linear_regression_predictor import train_regression_predictor
-from matchpredictor.predictors.past_results_predictor import train_results_predictor
-from matchpredictor.predictors.support_vector_predictor import train_random_support_vector_predictor
-from matchpredictor.predictors.simulation_predictor import train_offense_and_defense_predictor, train_offense_predictor
+from matchpredictor.predictors.past_results_predictor import IncrementalResultsTrainer, train_results_predictor
+from matchpredictor.predictors.predictor import IncrementalTrainer, Predictor
+from matchpredictor.predictors.simulation_predictor import IncrementalSimulationTrainer, \
+    train_offense_and_defense_predictor, train_offense_predictor
+from matchpredictor.predictors.simulators.simulator import offense_and_defense_simulator, offense_simulator
+from matchpredictor.profiling.profiling_api import profiling_api
+from matchpredictor.profiling.request_tracing import trace_requests
+from matchpredictor.profiling.spans import recording_spans, span
+from matchpredictor.profiling.startup_api import startup_api
+from matchpredictor.profiling.startup_timeline import log_startup_timeline, startup_timeline
+from matchpredictor.profiling.tracing import Tracer, exporter_for, using_tracer
+from matchpredictor.teams.team_name_resolver import TeamNameResolver
 from matchpredictor.teams.teams_api import teams_api
 from matchpredictor.teams.teams_provider import TeamsProvider
-from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient
+from matchpredictor.upcominggames.football_data_api_client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, \
+    FootballDataApiClient
+from matchpredictor.upcominggames.upcoming_forecasts import UpcomingForecasts
 from matchpredictor.upcominggames.upcoming_games_api import upcoming_games_api
 
 
-def build_model_provider(training_data: List[Result]) -> ModelProvider:
+@dataclass(frozen=True)
+class ModelTrainer(object):
+    """
+    Represents how to train a model.
+
+    Attributes:
+        name (str): The name of the model.
+        train (Callable[[List[Result]], Predictor]): Trains the model's predictor on the training data.
+        cost (ModelCost): How expensive the predictor's predictions are to compute.
+        incremental (Optional[Callable[[], IncrementalTrainer]]): Creates a trainer that trains the same predictor
+            incrementally, for models that support it, e.g. when backtesting over a sliding window of seasons.
+    """
+    name: str
+    train: Callable[[List[Result]], Predictor]
+    cost: ModelCost = ModelCost.CHEAP
+    incremental: Optional[Callable[[], IncrementalTrainer]] = None
+
+
+def train_support_vector_predictor(training_data: List[Result]) -> Predictor:
+    """
+    Trains the support vector predictor, importing scikit-learn only when it is needed, as importing it takes
+    longer than the rest of the app's imports together.
+
+    Args:
+        training_data (List[Result]): The training data.
+
+    Returns:
+        Predictor: The trained support vector predictor.
+    """
+    from matchpredictor.predictors.support_vector_predictor import train_random_support_vector_predictor
+    return train_random_support_vector_predictor(training_data)
+
+
+def train_linear_regression_predictor(training_data: List[Result]) -> Predictor:
+    """
+    Trains the linear regression predictor, importing scikit-learn only when it is needed.
+
+    Args:
+        training_data (List[Result]): The training data.
+
+    Returns:
+        Predictor: The trained linear regression predictor.
+    """
+    from matchpredictor.predictors.linear_regression_predictor import train_regression_predictor
+    return train_regression_predictor(training_data)
+
+
+MODEL_TRAINERS: List[ModelTrainer] = [
+    # Model for home prediction
+    ModelTrainer("Home", lambda training_data: HomePredictor()),
+    # Model based on past results
+    ModelTrainer("Points", train_results_predictor, incremental=IncrementalResultsTrainer),
+    # Fast offense simulation model
+    ModelTrainer("Offense simulator (fast)", lambda training_data: train_offense_predictor(training_data, 1_000),
+                 ModelCost.EXPENSIVE, lambda: IncrementalSimulationTrainer(offense_simulator, 1_000)),
+    # Offense simulation model
+    ModelTrainer("Offense simulator", lambda training_data: train_offense_predictor(training_data, 10_000),
+                 ModelCost.EXPENSIVE, lambda: IncrementalSimulationTrainer(offense_simulator, 10_000)),
+    # Fast offense and defense simulation model
+    ModelTrainer("Full simulator (fast)",
+                 lambda training_data: train_offense_and_defense_predictor(training_data, 1_000), ModelCost.EXPENSIVE,
+                 lambda: IncrementalSimulationTrainer(offense_and_defense_simulator, 1_000)),
+    # Offense and defense simulation model
+    ModelTrainer("Full simulator",
+                 lambda training_data: train_offense_and_defense_predictor(training_data, 10_000), ModelCost.EXPENSIVE,
+                 lambda: IncrementalSimulationTrainer(offense_and_defense_simulator, 10_000)),
+    # The linear regression model uses scikit learn, so can cause issues on some machines
+    # ModelTrainer("Linear regression", train_linear_regression_predictor),
+    # Model for alphabet prediction
+    ModelTrainer("Alphabet simulator", lambda training_data: AlphabetPredictor()),
+    # Model for support vector prediction
+    ModelTrainer("Support vector simulator", train_support_vector_predictor, ModelCost.EXPENSIVE),
+]
+
+
+def build_model_provider(training_data: List[Result], model_names: Optional[List[str]] = None) -> ModelProvider:
     """
     Builds the model provider based on the training data.
 
+    Each model records how long it took to train and the version of the data it was trained on.
+
     Args:
         training_data (List[Result]): The training data used to build the models.
+        model_names (Optional[List[str]]): The names of the models to build. Defaults to None, in which case all
+            models are built. Models that are not built are not trained, and their dependencies not imported.
 
     Returns:
         ModelProvider: The model provider containing the built models.
+
+    Raises:
+        ValueError: If a model name is unknown.
     """
-    return ModelProvider([
-        # Model for home prediction
-        Model("Home", HomePredictor()),
-        # Model based on past results
-        Model("Points", train_results_predictor(training_data)),
-        # Fast offense simulation model
-        Model("Offense simulator (fast)", train_offense_predictor(training_data, 1_000)),
-        # Offense simulation model
-        Model("Offense simulator", train_offense_predictor(training_data, 10_000)),
-        # Fast offense and defense simulation model
-        Model("Full simulator (fast)", train_offense_and_defense_predictor(training_data, 1_000)),
-        # Offense and defense simulation model
-        Model("Full simulator", train_offense_and_defense_predictor(training_data, 10_000)),
-        # The linear regression model uses scikit learn, so can cause issues on some machines
-        # Model("Linear regression", train_regression_predictor(training_data)),
-        # Model for alphabet prediction
-        Model("Alphabet simulator", AlphabetPredictor()),
-        # Model for support vector prediction
-        Model("Support vector simulator", train_random_support_vector_predictor(training_data)),
-    ])
+    unknown = set(model_names or []) - {trainer.name for trainer in MODEL_TRAINERS}
+    if unknown:
+        raise ValueError(f"Unknown models: {', '.join(sorted(unknown))}")
+
+    version = results_version(training_data)
+    models: List[Model] = []
+
+    for trainer in MODEL_TRAINERS:
+        if model_names is not None and trainer.name not in model_names:
+            continue
+        started = time.perf_counter()
+        with span("train", model=trainer.name):
+            predictor = trainer.train(training_data)
+        models.append(Model(
+            trainer.name,
+            predictor,
+            trainer.cost,
+            version=version,
+            training_seconds=time.perf_counter() - started,
+        ))
+
+    return ModelProvider(models)
 
 
 @dataclass
@@ -63,11 +168,111 @@ class AppEnvironment:
         csv_location (str): The location of the CSV file containing match data.
         season (int): The current season.
         football_data_api_key (str): The API key for accessing football data.
+        prediction_processes (int): The number of processes expensive models predict in.
+            Zero, the default, predicts in the request threads.
+        bulkhead_limits (Dict[str, BulkheadLimit]): The limits on concurrent predictions, keyed by model name
+            or cost class. Models without a limit are not restricted.
+        profiling_token (Optional[str]): The token that requests must present to be profiled.
+            Defaults to None, in which case profiling is disabled.
+        trace_export (Optional[str]): Where to export tracing spans: "stdout" or the path of a JSON lines file.
+            Defaults to None, in which case tracing is disabled.
+        trace_sample_ratio (float): The share of the traces started by the app that are exported.
+        model_names (Optional[List[str]]): The names of the models to serve. Defaults to None, in which case
+            all models are served.
+        football_data_base_url (str): The base URL of the football data API, e.g. of a fake one for load tests.
+        football_data_timeout (float): How long to wait for the football data API, in seconds.
+        parse_processes (int): The number of processes the results are parsed in. One, the default, parses them
+            in the app's process.
+        results_store (Optional[str]): The path of the results store, which keeps the results loaded from the CSV
+            file on disk, shared with other processes: a SQLite database if it ends in .sqlite or .db, a directory
+            of season and league partitions otherwise. Defaults to None, in which case there is none.
     """
 
     csv_location: str
     season: int
     football_data_api_key: str
+    prediction_processes: int = 0
+    bulkhead_limits: Dict[str, BulkheadLimit] = field(default_factory=dict)
+    profiling_token: Optional[str] = None
+    trace_export: Optional[str] = None
+    trace_sample_ratio: float = 1.0
+    model_names: Optional[List[str]] = None
+    football_data_base_url: str = DEFAULT_BASE_URL
+    football_data_timeout: float = DEFAULT_TIMEOUT
+    parse_processes: int = 1
+    results_store: Optional[str] = None
+
+
+def configure_app(app: Flask, env: AppEnvironment) -> None:
+    """
+    Loads the training data, trains the models and registers the APIs of an app.
+
+    Args:
+        app (Flask): The app to configure.
+        env (AppEnvironment): The application environment configuration.
+    """
+    # Create the registry of the metrics exposed at /metrics, and count the requests to every endpoint
+    registry = MetricsRegistry()
+    instrument_app(app, registry)
+
+    # Get the training results of the last two years, with a declarative filter, so that the rows of other
+    # seasons are skipped as they are parsed
+    last_two_years = ResultFilter(first_season=env.season - 2)
+    store = open_results_store(env.results_store) if env.results_store else None
+    results = training_results(env.csv_location, env.season, last_two_years, env.parse_processes, store)
+    registry.gauge("dataset_rows", "Rows loaded per dataset", ("dataset",)).set(len(results), dataset="training")
+    # Extract fixtures from results
+    fixtures = list(map(lambda r: r.fixture, results))
+
+    # Create teams provider
+    teams_provider = TeamsProvider(fixtures)
+    # Index the known team names, so that upstream names can be resolved to them
+    team_name_resolver = TeamNameResolver(team for f in fixtures for team in (f.home_team, f.away_team))
+    # Build model provider
+    models_provider = build_model_provider(results, env.model_names)
+    # Create the pool that expensive models predict in, if configured
+    prediction_pool = PredictionPool(models_provider, env.prediction_processes) \
+        if env.prediction_processes > 0 else None
+    # Create forecaster
+    forecaster = Forecaster(models_provider, prediction_pool, Bulkheads(env.bulkhead_limits), registry)
+    # Cache the forecasts of the upcoming games
+    upcoming_forecasts = UpcomingForecasts(forecaster)
+    # Create Football Data API client
+    football_data_api_client = FootballDataApiClient(
+        env.football_data_api_key,
+        env.football_data_base_url,
+        env.football_data_timeout,
+    )
+
+    with span("register_blueprints"):
+        # Register forecast API blueprint
+        app.register_blueprint(forecast_api(forecaster))
+        # Register teams API blueprint
+        app.register_blueprint(teams_api(teams_provider))
+        # Register models API blueprint
+        app.register_blueprint(models_api(models_provider))
+        # Register upcoming games API blueprint
+        app.register_blueprint(upcoming_games_api(
+            football_data_api_client,
+            team_name_resolver,
+            upcoming_forecasts,
+        ))
+        # Register health API
+        app.register_blueprint(health_api())
+
+        # Collect the metrics that are tracked elsewhere when they are scraped
+        registry.collector(process_collector)
+        registry.collector(models_collector(models_provider))
+        registry.collector(forecaster_collector(forecaster))
+        registry.collector(caches_collector({
+            "upcoming_forecasts": upcoming_forecasts.stats,
+            "team_names": team_name_resolver.stats,
+        }))
+        # Register metrics API
+        app.register_blueprint(metrics_api(registry))
+        # Register profiling API, if profiling is enabled
+        if env.profiling_token:
+            app.register_blueprint(profiling_api(env.profiling_token))
 
 
 def create_app(env: AppEnvironment) -> Flask:
@@ -80,45 +285,24 @@ def create_app(env: AppEnvironment) -> Flask:
     Returns:
         Flask: The configured Flask app.
     """
+    app_started = time.perf_counter()
 
     app = Flask(__name__)
 
-    # Check if the result belongs to the last two years
-    def last_two_years(result: Result) -> bool:
-        """
-        Checks if a result belongs to the last two years based on the provided season.
-
-        Args:
-            result (Result): The result to check.
-
-        Returns:
-            bool: True if the result belongs to the last two years, False otherwise.
-        """
-        return result.season >= env.season - 2
+    # Trace the startup and the requests with a tracer of the app's own, if tracing is enabled, and close its
+    # export file when the process exits
+    tracer = Tracer(exporter_for(env.trace_export), env.trace_sample_ratio) if env.trace_export else None
+    if tracer is not None:
+        trace_requests(app, tracer)
+        atexit.register(tracer.close)
 
-    # Get training results
-    results = training_results(env.csv_location, env.season, last_two_years)
-    # Extract fixtures from results
-    fixtures = list(map(lambda r: r.fixture, results))
+    # Group the spans of the startup into a single trace, and record them for the startup timeline
+    with using_tracer(tracer), span("startup"), recording_spans() as startup_spans:
+        configure_app(app, env)
 
-    # Create teams provider
-    teams_provider = TeamsProvider(fixtures)
-    # Build model provider
-    models_provider = build_model_provider(results)
-    # Create forecaster
-    forecaster = Forecaster(models_provider)
-    # Create Football Data API client
-    football_data_api_client = FootballDataApiClient(env.football_data_api_key)
-
-    # Register forecast API blueprint
-    app.register_blueprint(forecast_api(forecaster))
-    # Register teams API blueprint
-    app.register_blueprint(teams_api(teams_provider))
-    # Register models API blueprint
-    app.register_blueprint(models_api(models_provider))
-    # Register upcoming games API blueprint
-    app.register_blueprint(upcoming_games_api(football_data_api_client))
-    # Register health API
-    app.register_blueprint(health_api())
+    # Report where the time of the startup went, in the logs and at /startup
+    timeline = startup_timeline(IMPORT_STARTED, app_started, time.perf_counter(), startup_spans)
+    log_startup_timeline(timeline)
+    app.register_blueprint(startup_api(timeline))
 
     return app
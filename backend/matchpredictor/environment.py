@@ -0,0 +1,63 @@
+import os
+from typing import List, Optional
+
+from matchpredictor.app import AppEnvironment
+from matchpredictor.forecast.bulkhead import parse_bulkhead_limits
+from matchpredictor.upcominggames.football_data_api_client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT
+
+
+def require_env(name: str) -> str:
+    """
+    Retrieves the value of the specified environment variable.
+
+    Args:
+        name (str): The name of the environment variable.
+
+    Returns:
+        str: The value of the environment variable.
+
+    Raises:
+        Exception: If the environment variable is not set.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        raise Exception(f"Failed to read {name} from the environment")
+    return value
+
+
+def parse_model_names(value: str) -> Optional[List[str]]:
+    """
+    Parses the names of the models to serve, e.g. "Home,Points".
+
+    Args:
+        value (str): The comma-separated model names.
+
+    Returns:
+        Optional[List[str]]: The model names, or None if there are none, in which case all models are served.
+    """
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    return names or None
+
+
+def app_environment_from_env() -> AppEnvironment:
+    """
+    Creates the AppEnvironment from the environment variables.
+
+    Returns:
+        AppEnvironment: The application environment configuration.
+    """
+    return AppEnvironment(
+        csv_location=os.environ.get('CSV_LOCATION', 'https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv'),
+        season=2023,
+        football_data_api_key=require_env('FOOTBALL_DATA_API_KEY'),
+        prediction_processes=int(os.environ.get('PREDICTION_PROCESSES', 0)),
+        bulkhead_limits=parse_bulkhead_limits(os.environ.get('BULKHEAD_LIMITS', '')),
+        profiling_token=os.environ.get('PROFILING_TOKEN'),
+        trace_export=os.environ.get('TRACE_EXPORT'),
+        trace_sample_ratio=float(os.environ.get('TRACE_SAMPLE_RATIO', 1.0)),
+        model_names=parse_model_names(os.environ.get('MODELS', '')),
+        football_data_base_url=os.environ.get('FOOTBALL_DATA_BASE_URL', DEFAULT_BASE_URL),
+        football_data_timeout=float(os.environ.get('FOOTBALL_DATA_TIMEOUT', DEFAULT_TIMEOUT)),
+        parse_processes=int(os.environ.get('PARSE_PROCESSES', 1)),
+        results_store=os.environ.get('RESULTS_STORE'),
+    )
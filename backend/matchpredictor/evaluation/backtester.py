@@ -0,0 +1,239 @@
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from matchpredictor.app import MODEL_TRAINERS, ModelTrainer
+from matchpredictor.evaluation.evaluator import Evaluator
+from matchpredictor.matchresults.result import Result
+from matchpredictor.predictors.predictor import Predictor
+
+# The number of seasons each fold trains on
+DEFAULT_WINDOW = 3
+
+# The results of each league grouped by season, and the trainers by name, installed in the backtest's worker
+# processes when they start
+_installed_seasons: Optional[Dict[str, Dict[int, List[Result]]]] = None
+_installed_trainers: Optional[Dict[str, ModelTrainer]] = None
+
+
+@dataclass(frozen=True)
+class FoldReport(object):
+    """
+    Represents how a model did on a fold of a backtest: trained on the seasons before one, validated on it.
+
+    Attributes:
+        league (str): The league of the fold.
+        season (int): The season validated on.
+        model (str): The name of the model.
+        training_matches (int): The number of matches trained on.
+        validation_matches (int): The number of matches validated on.
+        accuracy (float): The share of the validation matches whose outcome was predicted correctly.
+        training_seconds (float): How long training took. For incremental models, only the update from the
+            previous fold counts.
+        evaluation_seconds (float): How long predicting the validation matches took.
+        incremental (bool): Whether the model was trained incrementally.
+    """
+    league: str
+    season: int
+    model: str
+    training_matches: int
+    validation_matches: int
+    accuracy: float
+    training_seconds: float
+    evaluation_seconds: float
+    incremental: bool
+
+
+def backtest(
+        results: Iterable[Result],
+        leagues: Sequence[str],
+        seasons: Sequence[int],
+        window: int = DEFAULT_WINDOW,
+        trainers: Optional[Sequence[ModelTrainer]] = None,
+        processes: Optional[int] = None,
+) -> List[FoldReport]:
+    """
+    Backtests models walking forward through seasons: for each league and season, every model is trained on the
+    preceding window of seasons and validated on the season.
+
+    Folds are independent, so they run in parallel in a process pool that shares the results through fork.
+    Models that can be trained incrementally walk forward through the seasons of a league in a single task
+    instead, adding the season that enters the window and removing the one that leaves it, rather than
+    retraining on the whole window.
+
+    Args:
+        results (Iterable[Result]): The results of all leagues and seasons.
+        leagues (Sequence[str]): The leagues to backtest.
+        seasons (Sequence[int]): The seasons to validate on. Seasons of a league without results are skipped.
+        window (int): The number of seasons each fold trains on.
+        trainers (Optional[Sequence[ModelTrainer]]): The models to backtest. Defaults to None, in which case all
+            models are.
+        processes (Optional[int]): The number of worker processes. Defaults to None, in which case there is one
+            per CPU.
+
+    Returns:
+        List[FoldReport]: The report of each fold, ordered by league, as given, then season, then model.
+    """
+    trainers = list(trainers if trainers is not None else MODEL_TRAINERS)
+    seasons = sorted(seasons)
+
+    # Group the results once, before the workers are forked, so they share them
+    grouped: Dict[str, Dict[int, List[Result]]] = {league: defaultdict(list) for league in leagues}
+    for result in results:
+        if result.fixture.league in grouped:
+            grouped[result.fixture.league][result.season].append(result)
+
+    league_seasons = {league: [s for s in seasons if len(grouped[league][s]) > 0] for league in leagues}
+
+    with ProcessPoolExecutor(
+            max_workers=processes or os.cpu_count(),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_install,
+            initargs=(grouped, {trainer.name: trainer for trainer in trainers}),
+    ) as executor:
+        # Submit every task before waiting on any
+        futures: Dict[Tuple[str, str], List[Future[List[FoldReport]]]] = {}
+        for league in leagues:
+            for trainer in trainers:
+                if trainer.incremental is not None:
+                    futures[(league, trainer.name)] = [
+                        executor.submit(_walk_forward, league, trainer.name, league_seasons[league], window)
+                    ]
+                else:
+                    futures[(league, trainer.name)] = [
+                        executor.submit(_fold, league, trainer.name, season, window)
+                        for season in league_seasons[league]
+                    ]
+
+        folds = {
+            (fold.league, fold.season, fold.model): fold
+            for tasks in futures.values() for task in tasks for fold in task.result()
+        }
+
+    # Order the folds deterministically, however the tasks finished
+    return [
+        folds[(league, season, trainer.name)]
+        for league in leagues for season in league_seasons[league] for trainer in trainers
+    ]
+
+
+def print_backtest(reports: Sequence[FoldReport]) -> None:
+    """
+    Prints the accuracy and timing of each fold, grouped by league, followed by a summary per model.
+
+    Args:
+        reports (Sequence[FoldReport]): The reports of the folds.
+    """
+    header = " {:<8} | {:<30} | {:>6} | {:>8} | {:<8} | {:>9} | {:>9}".format(
+        "Season", "Predictor", "Train", "Validate", "Accuracy", "Training", "Predict")
+    rule = "-" * 10 + "+" + "-" * 32 + "+" + "-" * 8 + "+" + "-" * 10 + "+" + "-" * 10 + "+" + "-" * 11 + "+" + "-" * 11
+    format_line = " {:<8} | {:<30} | {:>6} | {:>8} | {:<8.6f} | {:>8.3f}s | {:>8.3f}s"
+
+    for league in dict.fromkeys(r.league for r in reports):
+        print()
+        print("=" * (len(league) + 2))
+        print(f" {league} ")
+        print("=" * (len(league) + 2))
+        print()
+        print(header)
+        print(rule)
+        for r in (r for r in reports if r.league == league):
+            label = r.model + (" *" if r.incremental else "")
+            print(format_line.format(r.season, label, r.training_matches, r.validation_matches, r.accuracy,
+                                     r.training_seconds, r.evaluation_seconds))
+        print()
+
+    # Weigh the accuracy of each fold by its number of matches
+    print(" {:<30} | {:<8} | {:>6} | {:>9} | {:>9}".format("Predictor", "Accuracy", "Folds", "Training", "Predict"))
+    print("-" * 32 + "+" + "-" * 10 + "+" + "-" * 8 + "+" + "-" * 11 + "+" + "-" * 11)
+    for model in dict.fromkeys(r.model for r in reports):
+        folds = [r for r in reports if r.model == model]
+        matches = sum(r.validation_matches for r in folds)
+        accuracy = sum(r.accuracy * r.validation_matches for r in folds) / matches if matches > 0 else 0.0
+        print(" {:<30} | {:<8.6f} | {:>6} | {:>8.3f}s | {:>8.3f}s".format(
+            model, accuracy, len(folds),
+            sum(r.training_seconds for r in folds), sum(r.evaluation_seconds for r in folds)))
+    print()
+    print(" * trained incrementally")
+    print()
+
+
+def _install(seasons: Dict[str, Dict[int, List[Result]]], trainers: Dict[str, ModelTrainer]) -> None:
+    """
+    Installs the results and trainers in a worker process. They are inherited through fork, not pickled.
+
+    Args:
+        seasons (Dict[str, Dict[int, List[Result]]]): The results of each league, grouped by season.
+        trainers (Dict[str, ModelTrainer]): The trainers, keyed by model name.
+    """
+    global _installed_seasons, _installed_trainers
+    _installed_seasons = seasons
+    _installed_trainers = trainers
+
+
+def _installed() -> Tuple[Dict[str, Dict[int, List[Result]]], Dict[str, ModelTrainer]]:
+    if _installed_seasons is None or _installed_trainers is None:
+        raise RuntimeError("No results installed in the backtest worker")
+    return _installed_seasons, _installed_trainers
+
+
+def _evaluate(
+        league: str,
+        season: int,
+        model_name: str,
+        predictor: Predictor,
+        training_matches: int,
+        training_seconds: float,
+        incremental: bool,
+) -> FoldReport:
+    seasons, _ = _installed()
+    validation_data = seasons[league][season]
+    # Only accuracy and timing are reported, so no latency sample is taken
+    evaluation = Evaluator(predictor, latency_sample_size=0).evaluate(validation_data)
+    return FoldReport(league, season, model_name, training_matches, len(validation_data), evaluation.accuracy,
+                      training_seconds, evaluation.time_elapsed, incremental)
+
+
+# The functions below run in the worker processes, so they are referenced by name and cannot be name-mangled
+def _fold(league: str, model_name: str, season: int, window: int) -> List[FoldReport]:
+    seasons, trainers = _installed()
+    training_data = [r for s in range(season - window, season) for r in seasons[league].get(s, [])]
+
+    started = time.perf_counter()
+    predictor = trainers[model_name].train(training_data)
+    training_seconds = time.perf_counter() - started
+
+    return [_evaluate(league, season, model_name, predictor, len(training_data), training_seconds, False)]
+
+
+def _walk_forward(league: str, model_name: str, validation_seasons: List[int], window: int) -> List[FoldReport]:
+    seasons, trainers = _installed()
+    create_trainer = trainers[model_name].incremental
+    if create_trainer is None:
+        raise ValueError(f"Model {model_name} cannot be trained incrementally")
+
+    trainer = create_trainer()
+    trained: Set[int] = set()
+    reports: List[FoldReport] = []
+
+    for season in validation_seasons:
+        window_seasons = set(range(season - window, season))
+
+        started = time.perf_counter()
+        # Forget the seasons that left the window and train on those that entered it
+        for old_season in sorted(trained - window_seasons):
+            trainer.remove(seasons[league].get(old_season, []))
+        for new_season in sorted(window_seasons - trained):
+            trainer.add(seasons[league].get(new_season, []))
+        predictor = trainer.predictor()
+        training_seconds = time.perf_counter() - started
+        trained = window_seasons
+
+        training_matches = sum(len(seasons[league].get(s, [])) for s in window_seasons)
+        reports.append(_evaluate(league, season, model_name, predictor, training_matches, training_seconds, True))
+
+    return reports
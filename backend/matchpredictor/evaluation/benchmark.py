@@ -0,0 +1,291 @@
+import json
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence
+
+from matchpredictor.app import MODEL_TRAINERS, ModelTrainer
+from matchpredictor.evaluation.evaluator import Evaluator, traced_peak_memory
+from matchpredictor.matchresults.result import Fixture, Result, Team, match_outcome
+
+# The numbers of training matches the models are benchmarked at
+DATASET_SIZES = (1_000, 4_000, 16_000)
+
+# The number of matches predicted at each size. The simulators take a fifth of a second per prediction, so it is
+# kept small; prediction costs do not depend on the size of the training data
+PREDICTION_MATCHES = 50
+
+# The number of the predicted matches whose latency is measured one at a time
+LATENCY_SAMPLE_SIZE = 25
+
+# The seed of the benchmark dataset, which is generated rather than downloaded, so that benchmarks run offline
+# and every run sees exactly the same matches
+DATASET_SEED = 2023
+
+# The number of teams in the benchmark league
+TEAMS = 20
+
+# The relative change beyond which a metric is flagged as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Changes of timings below this many seconds, or of memory below this many bytes, are noise, whatever their
+# relative size
+NOISE_FLOOR_SECONDS = 0.001
+NOISE_FLOOR_BYTES = 64 * 1024
+
+# The metrics compared against the baseline, and whether higher values are better
+METRICS: Dict[str, bool] = {
+    "training_seconds": False,
+    "training_peak_memory_bytes": False,
+    "latency_p50_ms": False,
+    "latency_p95_ms": False,
+    "throughput": True,
+    "prediction_peak_memory_bytes": False,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult(object):
+    """
+    Represents how a model performed at a dataset size.
+
+    Attributes:
+        model (str): The name of the model.
+        size (int): The number of matches the model was trained on.
+        training_seconds (float): How long training took.
+        training_peak_memory_bytes (int): The most memory allocated at once while training.
+        latency_p50_ms (float): The median latency of a single prediction, in milliseconds.
+        latency_p95_ms (float): The 95th percentile latency of a single prediction, in milliseconds.
+        throughput (float): The number of matches predicted per second, as a batch.
+        prediction_peak_memory_bytes (int): The most memory allocated at once while predicting a batch.
+    """
+    model: str
+    size: int
+    training_seconds: float
+    training_peak_memory_bytes: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    throughput: float
+    prediction_peak_memory_bytes: int
+
+
+@dataclass(frozen=True)
+class Regression(object):
+    """
+    Represents a metric that got worse than its baseline by more than the threshold.
+
+    Attributes:
+        model (str): The name of the model.
+        size (int): The dataset size.
+        metric (str): The name of the metric.
+        baseline (float): The value of the metric in the baseline.
+        current (float): The value of the metric now.
+        change (float): The relative change, e.g. 0.5 for 50% slower.
+    """
+    model: str
+    size: int
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def poisson_goals(generator: random.Random, mean: float) -> int:
+    """
+    Draws the goals of a team from a Poisson distribution, with Knuth's algorithm, as it only needs uniform draws
+    from the seeded generator.
+
+    Args:
+        generator (random.Random): The seeded generator.
+        mean (float): The mean goals of the team.
+
+    Returns:
+        int: The goals.
+    """
+    threshold, count, product = math.exp(-mean), 0, generator.random()
+    while product > threshold:
+        count += 1
+        product *= generator.random()
+    return count
+
+
+def benchmark_dataset(size: int, seed: int = DATASET_SEED) -> List[Result]:
+    """
+    Generates the benchmark dataset: a league of teams of fixed strengths playing each other, with goals drawn
+    from Poisson distributions. The same size and seed always generate the same matches.
+
+    Args:
+        size (int): The number of matches.
+        seed (int): The seed of the generator.
+
+    Returns:
+        List[Result]: The matches, 380 per season.
+    """
+    generator = random.Random(seed)
+    teams = [Team(f"Team {index + 1:02d}") for index in range(TEAMS)]
+    scoring_rates = {team: generator.uniform(0.6, 2.2) for team in teams}
+
+    results: List[Result] = []
+    for index in range(size):
+        home, away = generator.sample(teams, 2)
+        home_goals = poisson_goals(generator, scoring_rates[home] * 1.1)
+        away_goals = poisson_goals(generator, scoring_rates[away] * 0.9)
+        results.append(Result(Fixture(home, away, "Benchmark League"), match_outcome(home_goals, away_goals),
+                              home_goals, away_goals, 2000 + index // 380))
+    return results
+
+
+def run_benchmarks(
+        sizes: Sequence[int] = DATASET_SIZES,
+        trainers: Optional[Sequence[ModelTrainer]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Benchmarks the training and prediction of models at several dataset sizes.
+
+    Each model is trained twice, once timed and once under tracemalloc, so that tracing does not slow down the
+    timed run. Its predictions are measured on matches generated after the training matches.
+
+    Args:
+        sizes (Sequence[int]): The numbers of training matches.
+        trainers (Optional[Sequence[ModelTrainer]]): The models to benchmark. Defaults to None, in which case all
+            models are.
+
+    Returns:
+        List[BenchmarkResult]: The result of each model at each size, ordered by size, then model.
+    """
+    benchmarks: List[BenchmarkResult] = []
+
+    for size in sizes:
+        dataset = benchmark_dataset(size + PREDICTION_MATCHES)
+        training_data, prediction_data = dataset[:size], dataset[size:]
+
+        for trainer in trainers if trainers is not None else MODEL_TRAINERS:
+            started = time.perf_counter()
+            predictor = trainer.train(training_data)
+            training_seconds = time.perf_counter() - started
+            training_peak_memory = traced_peak_memory(lambda: trainer.train(training_data))
+
+            evaluation = Evaluator(predictor, LATENCY_SAMPLE_SIZE).evaluate(prediction_data)
+            benchmarks.append(BenchmarkResult(
+                model=trainer.name,
+                size=size,
+                training_seconds=training_seconds,
+                training_peak_memory_bytes=training_peak_memory,
+                latency_p50_ms=evaluation.latency_p50_ms,
+                latency_p95_ms=evaluation.latency_p95_ms,
+                throughput=evaluation.throughput,
+                prediction_peak_memory_bytes=evaluation.peak_memory_bytes,
+            ))
+
+    return benchmarks
+
+
+def find_regressions(
+        baseline: Sequence[BenchmarkResult],
+        current: Sequence[BenchmarkResult],
+        threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Compares benchmark results with a baseline.
+
+    Args:
+        baseline (Sequence[BenchmarkResult]): The baseline results.
+        current (Sequence[BenchmarkResult]): The current results. Models and sizes missing from the baseline are
+            not compared.
+        threshold (float): The relative change beyond which a metric is flagged, e.g. 0.25 for 25% worse.
+
+    Returns:
+        List[Regression]: The metrics that got worse by more than the threshold.
+    """
+    baselines = {(result.model, result.size): result for result in baseline}
+    regressions: List[Regression] = []
+
+    for result in current:
+        previous = baselines.get((result.model, result.size))
+        if previous is None:
+            continue
+
+        for metric, higher_is_better in METRICS.items():
+            before, after = float(getattr(previous, metric)), float(getattr(result, metric))
+            if before <= 0 or math.isinf(before) or math.isinf(after):
+                continue
+            if abs(after - before) < noise_floor(metric):
+                continue
+
+            change = (after - before) / before
+            if (change < -threshold) if higher_is_better else (change > threshold):
+                regressions.append(Regression(result.model, result.size, metric, before, after, change))
+
+    return regressions
+
+
+def noise_floor(metric: str) -> float:
+    """
+    Finds the smallest change of a metric that is not noise.
+
+    Args:
+        metric (str): The name of the metric, whose suffix gives its unit.
+
+    Returns:
+        float: The smallest change, in the unit of the metric.
+    """
+    if metric.endswith("_seconds"):
+        return NOISE_FLOOR_SECONDS
+    if metric.endswith("_ms"):
+        return NOISE_FLOOR_SECONDS * 1000
+    if metric.endswith("_bytes"):
+        return NOISE_FLOOR_BYTES
+    return 0.0
+
+
+def save_baseline(path: str, results: Sequence[BenchmarkResult]) -> None:
+    """
+    Records benchmark results as the baseline.
+
+    Args:
+        path (str): The path of the JSON baseline file.
+        results (Sequence[BenchmarkResult]): The results.
+    """
+    with open(path, "w") as baseline_file:
+        json.dump({"results": [asdict(result) for result in results]}, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+
+def load_baseline(path: str) -> List[BenchmarkResult]:
+    """
+    Reads the baseline recorded by save_baseline.
+
+    Args:
+        path (str): The path of the JSON baseline file.
+
+    Returns:
+        List[BenchmarkResult]: The baseline results.
+    """
+    with open(path) as baseline_file:
+        return [BenchmarkResult(**result) for result in json.load(baseline_file)["results"]]
+
+
+def print_benchmarks(results: Sequence[BenchmarkResult], regressions: Sequence[Regression] = ()) -> None:
+    """
+    Prints benchmark results, followed by the regressions, if any.
+
+    Args:
+        results (Sequence[BenchmarkResult]): The results.
+        regressions (Sequence[Regression]): The regressions found against the baseline.
+    """
+    print()
+    print(" {:<28} | {:>6} | {:>10} | {:>10} | {:>10} | {:>10} | {:>12} | {:>10}".format(
+        "Predictor", "Size", "Training", "Train mem", "p50", "p95", "Matches/s", "Pred mem"))
+    print("-" * 30 + "+" + "-" * 8 + ("+" + "-" * 12) * 4 + "+" + "-" * 14 + "+" + "-" * 12)
+    for r in results:
+        print(" {:<28} | {:>6} | {:>9.3f}s | {:>8.1f}KB | {:>8.3f}ms | {:>8.3f}ms | {:>12.1f} | {:>8.1f}KB".format(
+            r.model, r.size, r.training_seconds, r.training_peak_memory_bytes / 1024, r.latency_p50_ms,
+            r.latency_p95_ms, r.throughput, r.prediction_peak_memory_bytes / 1024))
+    print()
+
+    for regression in regressions:
+        print(f" Regression: {regression.model} at {regression.size} matches, {regression.metric} "
+              f"{regression.baseline:.6g} -> {regression.current:.6g} ({regression.change:+.0%})")
+    if regressions:
+        print()
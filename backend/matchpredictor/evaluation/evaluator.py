@@ -1,23 +1,57 @@
+import math
 import time
-from typing import Iterable, Tuple
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Sequence, Tuple
 
-from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.result import Fixture, Result
 from matchpredictor.predictors.predictor import Predictor
 
+# The number of fixtures predicted one at a time to measure the latency percentiles, and under tracemalloc to
+# measure the peak memory, as both slow down the evaluation of the expensive models
+LATENCY_SAMPLE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Evaluation(object):
+    """
+    Represents how accurate and how fast a predictor was on the validation data.
+
+    Attributes:
+        accuracy (float): The share of the matches whose outcome was predicted correctly.
+        matches (int): The number of matches predicted.
+        time_elapsed (float): How long predicting all matches took, in seconds.
+        throughput (float): The number of matches predicted per second.
+        latency_p50_ms (float): The median latency of a single prediction, in milliseconds.
+        latency_p95_ms (float): The 95th percentile latency of a single prediction, in milliseconds.
+        latency_p99_ms (float): The 99th percentile latency of a single prediction, in milliseconds.
+        peak_memory_bytes (int): The most memory allocated at once while predicting a batch of the sample.
+    """
+    accuracy: float
+    matches: int
+    time_elapsed: float
+    throughput: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    peak_memory_bytes: int
+
 
 class Evaluator(object):
     """
     Evaluator class to measure the accuracy of a predictor.
     """
 
-    def __init__(self, predictor: Predictor) -> None:
+    def __init__(self, predictor: Predictor, latency_sample_size: int = LATENCY_SAMPLE_SIZE) -> None:
         """
         Initializes the Evaluator with a Predictor.
 
         Args:
             predictor (Predictor): The predictor to be evaluated.
+            latency_sample_size (int): The number of matches whose latency and memory are measured.
         """
         self.predictor = predictor
+        self.latency_sample_size = latency_sample_size
 
     def measure_accuracy(self, validation_data: Iterable[Result]) -> Tuple[float, float]:
         """
@@ -39,6 +73,46 @@ class Evaluator(object):
         # Return the accuracy and time elapsed
         return correct_predictions / len(results), time_elapsed
 
+    def evaluate(self, validation_data: Iterable[Result]) -> Evaluation:
+        """
+        Measures the accuracy, throughput, latency and memory of the predictor on the provided validation data.
+
+        Unlike measure_accuracy, this also runs the latency and tracemalloc passes, which take longer.
+
+        All matches are predicted in a single batch, so that predictors that vectorize their work are measured
+        doing so. The latency percentiles come from predicting a sample of the matches one at a time, and the peak
+        memory from predicting the sample as a batch under tracemalloc.
+
+        Args:
+            validation_data (Iterable[Result]): Iterable collection of Result objects representing the validation data.
+
+        Returns:
+            Evaluation: The accuracy and performance of the predictor.
+        """
+        results = validation_data if isinstance(validation_data, Sequence) else list(validation_data)
+        fixtures = [result.fixture for result in results]
+
+        start_time = time.perf_counter()
+        predictions = self.predictor.predict_all(fixtures)
+        time_elapsed = time.perf_counter() - start_time
+
+        # Count the number of correct predictions
+        correct_predictions = sum(p.outcome == r.outcome for p, r in zip(predictions, results))
+
+        sample = fixtures[:self.latency_sample_size]
+        latencies = self.__latencies_ns(sample)
+
+        return Evaluation(
+            accuracy=correct_predictions / len(results),
+            matches=len(results),
+            time_elapsed=time_elapsed,
+            throughput=len(results) / time_elapsed if time_elapsed > 0 else math.inf,
+            latency_p50_ms=percentile(latencies, 50) / 1_000_000,
+            latency_p95_ms=percentile(latencies, 95) / 1_000_000,
+            latency_p99_ms=percentile(latencies, 99) / 1_000_000,
+            peak_memory_bytes=self.__peak_memory(sample),
+        )
+
     def __is_correct(self, result: Result) -> bool:
         """
         Helper method to check if a prediction is correct.
@@ -51,3 +125,74 @@ class Evaluator(object):
         """
         prediction = self.predictor.predict(result.fixture)
         return prediction.outcome == result.outcome
+
+    def __latencies_ns(self, fixtures: Sequence[Fixture]) -> List[int]:
+        """
+        Measures the latency of predicting each fixture on its own.
+
+        Args:
+            fixtures (Sequence[Fixture]): The fixtures to predict.
+
+        Returns:
+            List[int]: The latencies, in nanoseconds, sorted.
+        """
+        latencies: List[int] = []
+        for fixture in fixtures:
+            started = time.perf_counter_ns()
+            self.predictor.predict(fixture)
+            latencies.append(time.perf_counter_ns() - started)
+        return sorted(latencies)
+
+    def __peak_memory(self, fixtures: Sequence[Fixture]) -> int:
+        """
+        Measures the most memory allocated at once while predicting the fixtures as a batch.
+
+        Args:
+            fixtures (Sequence[Fixture]): The fixtures to predict.
+
+        Returns:
+            int: The peak memory, in bytes, above what was allocated before.
+        """
+        return traced_peak_memory(lambda: self.predictor.predict_all(fixtures))
+
+
+def traced_peak_memory(run: Callable[[], object]) -> int:
+    """
+    Measures the most memory allocated at once while running a function, with tracemalloc.
+
+    Args:
+        run (Callable[[], object]): The function.
+
+    Returns:
+        int: The peak memory, in bytes, above what was allocated before.
+    """
+    # Leave tracing on if it was already, e.g. through the profiling API
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+def percentile(sorted_values: Sequence[int], percent: float) -> float:
+    """
+    Finds the nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values (Sequence[int]): The values, sorted.
+        percent (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0 if there are no values.
+    """
+    if len(sorted_values) == 0:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return float(sorted_values[rank - 1])
@@ -3,7 +3,8 @@ from typing import Iterable, List
 
 from matchpredictor.evaluation.evaluator import Evaluator
 from matchpredictor.matchresults.result import Result
-from matchpredictor.model.model_provider import Model, ModelProvider
+from matchpredictor.model.model_provider import ModelProvider
+from matchpredictor.predictors.predictor import Predictor
 
 @dataclass
 class PredictionReport(object):
@@ -14,6 +15,8 @@ class PredictionReport(object):
     label: str
     accuracy: float
     time_elapsed: float
+    throughput: float = 0.0
+    latency_p95_ms: float = 0.0
 
 class Reporter:
     """
@@ -30,7 +33,8 @@ class Reporter:
             model_provider (ModelProvider): The model provider for generating reports.
         """
         self.title = title
-        self.validation_data = validation_data
+        # Every model is evaluated on the same data, so it is read once
+        self.validation_data = list(validation_data)
         self.model_provider = model_provider
         self.reports: List[PredictionReport] = []
 
@@ -39,51 +43,61 @@ class Reporter:
         Runs the report by generating reports for each model in the model provider and printing them.
         """
         # Generate reports for each model in the model provider
-        reports = map(self.__calculate_accuracy, self.model_provider.list())
+        self.reports = [
+            report_for(model.name, model.predictor, self.validation_data) for model in self.model_provider.list()
+        ]
         # Print the reports
-        self.__print_reports(reports)
+        print_reports(self.title, self.reports)
 
-    def __print_reports(self, reports: Iterable[PredictionReport]) -> None:
-        """
-        Prints the prediction reports.
 
-        Args:
-            reports (Iterable[PredictionReport]): Iterable collection of PredictionReport objects to be printed.
-        """
-        # Print the report header
-        print()
-        print("=" * (len(self.title) + 2))
-        print(f" {self.title} ")
-        print("=" * (len(self.title) + 2))
-        print()
+def report_for(label: str, predictor: Predictor, validation_data: List[Result]) -> PredictionReport:
+    """
+    Calculates the accuracy, time elapsed and throughput of a predictor using the Evaluator.
 
-        # Print the table header
-        print(" {:<30} | {:<8} | {:<10}".format("Predictor", "Accuracy", "Elapsed"))
-        print("-" * 32 + "+" + "-" * 10 + "+" + "-" * 11)
+    Args:
+        label (str): The label of the report, usually the name of the model.
+        predictor (Predictor): The predictor to evaluate.
+        validation_data (List[Result]): The validation data.
 
-        # Print each report row
-        format_line = " {:<30} | {:<8.6f} | {:<8.6f}s"
-        for r in reports:
-            print(format_line.format(r.label, r.accuracy, r.time_elapsed))
+    Returns:
+        PredictionReport: A PredictionReport object containing the label, accuracy, time elapsed and throughput.
+    """
+    # Calculate accuracy, time elapsed and throughput for a model using the Evaluator
+    evaluation = Evaluator(predictor).evaluate(validation_data)
 
-        print()
+    # Create a PredictionReport object with the model's label, accuracy, time elapsed and throughput
+    return PredictionReport(
+        label=label,
+        accuracy=evaluation.accuracy,
+        time_elapsed=evaluation.time_elapsed,
+        throughput=evaluation.throughput,
+        latency_p95_ms=evaluation.latency_p95_ms,
+    )
 
-    def __calculate_accuracy(self, model: Model) -> PredictionReport:
-        """
-        Calculates the accuracy and time elapsed for a model using the Evaluator.
 
-        Args:
-            model (Model): The model for which the accuracy is calculated.
+def print_reports(title: str, reports: Iterable[PredictionReport]) -> None:
+    """
+    Prints the prediction reports.
 
-        Returns:
-            PredictionReport: A PredictionReport object containing the model's label, accuracy, and time elapsed.
-        """
-        # Calculate accuracy and time elapsed for a model using the Evaluator
-        accuracy, time_elapsed = Evaluator(model.predictor).measure_accuracy(self.validation_data)
-
-        # Create a PredictionReport object with the model's label, accuracy, and time elapsed
-        return PredictionReport(
-            label=model.name,
-            accuracy=accuracy,
-            time_elapsed=time_elapsed
-        )
+    Args:
+        title (str): The title of the report.
+        reports (Iterable[PredictionReport]): Iterable collection of PredictionReport objects to be printed.
+    """
+    # Print the report header
+    print()
+    print("=" * (len(title) + 2))
+    print(f" {title} ")
+    print("=" * (len(title) + 2))
+    print()
+
+    # Print the table header
+    print(" {:<30} | {:<8} | {:>12} | {:>10} | {:<10}".format(
+        "Predictor", "Accuracy", "Matches/s", "p95", "Elapsed"))
+    print("-" * 32 + "+" + "-" * 10 + "+" + "-" * 14 + "+" + "-" * 12 + "+" + "-" * 11)
+
+    # Print each report row
+    format_line = " {:<30} | {:<8.6f} | {:>12.1f} | {:>8.3f}ms | {:<8.6f}s"
+    for r in reports:
+        print(format_line.format(r.label, r.accuracy, r.throughput, r.latency_p95_ms, r.time_elapsed))
+
+    print()
@@ -0,0 +1,219 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Dict, Iterator, Optional
+
+from flask import Response
+
+from matchpredictor.model.model_provider import Model
+
+
+class BulkheadFull(Exception):
+    """
+    Raised when a model has no capacity left to admit another prediction.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        super().__init__(f"Model {model_name} is overloaded")
+        self.model_name = model_name
+
+
+def model_overloaded(error: BulkheadFull) -> Response:
+    """
+    Rejects requests for a model that has no capacity left, without affecting the other models. Registered as the
+    BulkheadFull error handler of the APIs that predict.
+
+    Args:
+        error (BulkheadFull): The error raised for the overloaded model.
+
+    Returns:
+        Response: A 503 response asking the client to retry shortly.
+    """
+    return Response(str(error), 503, headers={"Retry-After": "1"})
+
+
+@dataclass(frozen=True)
+class BulkheadLimit(object):
+    """
+    Represents how much load a model admits.
+
+    Attributes:
+        max_concurrent (int): The number of predictions that may run at the same time.
+        max_queued (int): The number of predictions that may wait for one of those to finish.
+        queue_timeout (Optional[float]): How long, in seconds, a prediction may wait before it is rejected.
+    """
+    max_concurrent: int
+    max_queued: int
+    queue_timeout: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BulkheadStats(object):
+    """
+    Represents the load of a model's bulkhead.
+
+    Attributes:
+        in_flight (int): The number of predictions running.
+        queued (int): The number of predictions waiting to run.
+        rejected (int): The number of predictions rejected so far.
+        max_concurrent (int): The number of predictions that may run at the same time.
+        max_queued (int): The number of predictions that may wait.
+    """
+    in_flight: int
+    queued: int
+    rejected: int
+    max_concurrent: int
+    max_queued: int
+
+
+class Bulkhead:
+    """
+    Limits the number of predictions of a single model that run at the same time, with a bounded queue in front.
+    """
+
+    def __init__(self, model_name: str, limit: BulkheadLimit) -> None:
+        """
+        Initializes the Bulkhead.
+
+        Args:
+            model_name (str): The name of the model the bulkhead protects.
+            limit (BulkheadLimit): How much load the model admits.
+        """
+        self.model_name = model_name
+        self.limit = limit
+        self.__condition = Condition()
+        self.__in_flight = 0
+        self.__queued = 0
+        self.__rejected = 0
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """
+        Admits a prediction, waiting in the queue if all slots are taken.
+
+        Raises:
+            BulkheadFull: If the queue is full, or the prediction waited longer than the queue timeout.
+        """
+        with self.__condition:
+            # Reject straight away when there is no room to run or to wait
+            if self.__in_flight >= self.limit.max_concurrent and self.__queued >= self.limit.max_queued:
+                self.__rejected += 1
+                raise BulkheadFull(self.model_name)
+
+            self.__queued += 1
+            admitted = self.__condition.wait_for(
+                lambda: self.__in_flight < self.limit.max_concurrent,
+                timeout=self.limit.queue_timeout,
+            )
+            self.__queued -= 1
+
+            if not admitted:
+                self.__rejected += 1
+                raise BulkheadFull(self.model_name)
+
+            self.__in_flight += 1
+
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__in_flight -= 1
+                self.__condition.notify()
+
+    def stats(self) -> BulkheadStats:
+        """
+        Retrieves the current load of the bulkhead.
+
+        Returns:
+            BulkheadStats: The load of the bulkhead.
+        """
+        with self.__condition:
+            return BulkheadStats(
+                in_flight=self.__in_flight,
+                queued=self.__queued,
+                rejected=self.__rejected,
+                max_concurrent=self.limit.max_concurrent,
+                max_queued=self.limit.max_queued,
+            )
+
+
+class Bulkheads:
+    """
+    Gives every configured model a bulkhead of its own, so that overload of one model does not starve the others.
+
+    Limits are configured by model name or by cost class, e.g. "expensive"; a model name takes precedence.
+    Models without a limit are not restricted.
+    """
+
+    def __init__(self, limits: Dict[str, BulkheadLimit]) -> None:
+        """
+        Initializes the Bulkheads.
+
+        Args:
+            limits (Dict[str, BulkheadLimit]): The limits, keyed by model name or cost class.
+        """
+        self.__limits = limits
+        self.__bulkheads: Dict[str, Optional[Bulkhead]] = {}
+        self.__lock = Lock()
+
+    def bulkhead_for(self, model: Model) -> Optional[Bulkhead]:
+        """
+        Retrieves the bulkhead of a model.
+
+        Args:
+            model (Model): The model.
+
+        Returns:
+            Optional[Bulkhead]: The model's bulkhead, or None if the model is not restricted.
+        """
+        with self.__lock:
+            if model.name not in self.__bulkheads:
+                limit = self.__limits.get(model.name, self.__limits.get(model.cost.value))
+                self.__bulkheads[model.name] = None if limit is None else Bulkhead(model.name, limit)
+
+            return self.__bulkheads[model.name]
+
+    def stats(self) -> Dict[str, BulkheadStats]:
+        """
+        Retrieves the load of every bulkhead that has been used.
+
+        Returns:
+            Dict[str, BulkheadStats]: The load of the bulkheads, keyed by model name.
+        """
+        with self.__lock:
+            bulkheads = [b for b in self.__bulkheads.values() if b is not None]
+
+        return {bulkhead.model_name: bulkhead.stats() for bulkhead in bulkheads}
+
+
+def parse_bulkhead_limits(spec: str) -> Dict[str, BulkheadLimit]:
+    """
+    Parses bulkhead limits such as "expensive=4/16/500,Home=64/256".
+
+    Each entry maps a model name or cost class to the number of concurrent predictions, the queue length and,
+    optionally, how many milliseconds a prediction may wait in the queue.
+
+    Args:
+        spec (str): The limits.
+
+    Returns:
+        Dict[str, BulkheadLimit]: The limits, keyed by model name or cost class.
+
+    Raises:
+        ValueError: If an entry has no name, or its limits are not numbers.
+    """
+    limits: Dict[str, BulkheadLimit] = {}
+
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        key, separator, value = entry.rpartition("=")
+        if not separator or not key.strip():
+            raise ValueError(f"Malformed bulkhead limit {entry!r}, expected name=concurrent/queued/timeout_ms")
+        max_concurrent, _, queue = value.partition("/")
+        max_queued, _, timeout_ms = queue.partition("/")
+        limits[key.strip()] = BulkheadLimit(
+            max_concurrent=int(max_concurrent),
+            max_queued=int(max_queued or 0),
+            queue_timeout=int(timeout_ms) / 1000 if timeout_ms else None,
+        )
+
+    return limits
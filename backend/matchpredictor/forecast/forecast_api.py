@@ -1,7 +1,29 @@
+from typing import Optional
+
 from flask import Blueprint, jsonify, request, Response
 
+from matchpredictor.forecast.bulkhead import BulkheadFull, model_overloaded
 from matchpredictor.forecast.forecaster import Forecaster
 from matchpredictor.matchresults.result import Team, Fixture, Scenario
+from matchpredictor.profiling.spans import span
+
+
+# The header that carries the latency budget, as an alternative to the budget_ms query parameter
+LATENCY_BUDGET_HEADER = "X-Latency-Budget-Ms"
+
+
+def latency_budget() -> Optional[float]:
+    """
+    Reads the latency budget of the current request, from the budget_ms query parameter or the
+    X-Latency-Budget-Ms header.
+
+    Returns:
+        Optional[float]: The latency budget in seconds, or None if the request has no budget.
+    """
+    budget_ms = request.args.get('budget_ms', type=float)
+    if budget_ms is None:
+        budget_ms = request.headers.get(LATENCY_BUDGET_HEADER, type=float)
+    return None if budget_ms is None else budget_ms / 1000
 
 
 def forecast_api(forecaster: Forecaster) -> Blueprint:
@@ -17,6 +39,8 @@ def forecast_api(forecaster: Forecaster) -> Blueprint:
     # Create a Blueprint for the forecast API
     api = Blueprint("forecast_api", __name__)
 
+    api.register_error_handler(BulkheadFull, model_overloaded)
+
     @api.route("/forecast", methods=["GET"])
     def forecast() -> Response:
         """
@@ -26,27 +50,30 @@ def forecast_api(forecaster: Forecaster) -> Blueprint:
             Response: The forecast result as a JSON response.
         """
         # Retrieve query parameters from the request
-        home_name = request.args['home_name']
-        away_name = request.args['away_name']
-        league = request.args['league']
-        model_name = request.args['model_name']
-
-        # Call the forecaster to generate a forecast for the fixture
-        result = forecaster.forecast(
-            Fixture(
+        with span("parse"):
+            home_name = request.args['home_name']
+            away_name = request.args['away_name']
+            league = request.args['league']
+            model_name = request.args['model_name']
+            budget = latency_budget()
+
+            fixture = Fixture(
                 home_team=Team(name=home_name),
                 away_team=Team(name=away_name),
                 league=league,
-            ),
-            model_name=model_name,
-        )
+            )
+
+        # Call the forecaster to generate a forecast for the fixture, within the latency budget if there is one
+        result = forecaster.forecast(fixture, model_name=model_name) if budget is None \
+            else forecaster.forecast_within(fixture, model_name=model_name, budget=budget)
 
         # Check if the forecast is available
         if result is None:
             return Response("Cannot forecast fixture", 400)
 
         # Return the forecast as JSON response
-        return jsonify(result)
+        with span("serialize"):
+            return jsonify(result)
 
     @api.route("/forecast-in-progress", methods=["GET"])
     def forecast_in_progress() -> Response:
@@ -57,34 +84,58 @@ def forecast_api(forecaster: Forecaster) -> Blueprint:
             Response: The forecast result for an in-progress fixture as a JSON response.
         """
         # Retrieve query parameters from the request
-        home_name = request.args['home_name']
-        away_name = request.args['away_name']
-        league = request.args['league']
-        model_name = request.args['model_name']
-        minutes_elapsed = request.args.get('minutes_elapsed', default=0, type=int)
-        home_goals = request.args.get('home_goals', default=0, type=int)
-        away_goals = request.args.get('away_goals', default=0, type=int)
-
-        # Call the forecaster to generate a forecast for the in-progress fixture
-        result = forecaster.forecast_in_progress(
-            Fixture(
+        with span("parse"):
+            home_name = request.args['home_name']
+            away_name = request.args['away_name']
+            league = request.args['league']
+            model_name = request.args['model_name']
+            minutes_elapsed = request.args.get('minutes_elapsed', default=0, type=int)
+            home_goals = request.args.get('home_goals', default=0, type=int)
+            away_goals = request.args.get('away_goals', default=0, type=int)
+            budget = latency_budget()
+
+            fixture = Fixture(
                 home_team=Team(name=home_name),
                 away_team=Team(name=away_name),
                 league=league,
-            ),
-            Scenario(
+            )
+            scenario = Scenario(
                 minutes_elapsed=minutes_elapsed,
                 home_goals=home_goals,
                 away_goals=away_goals,
-            ),
-            model_name=model_name,
-        )
+            )
+
+        # Call the forecaster to generate a forecast for the in-progress fixture,
+        # within the latency budget if there is one
+        result = forecaster.forecast_in_progress(fixture, scenario, model_name=model_name) if budget is None \
+            else forecaster.forecast_within(fixture, model_name=model_name, budget=budget, scenario=scenario)
 
         # Check if the forecast is available
         if result is None:
             return Response("Cannot forecast fixture", 400)
 
         # Return the forecast as JSON response
-        return jsonify(result)
+        with span("serialize"):
+            return jsonify(result)
+
+    @api.route("/bulkheads", methods=["GET"])
+    def bulkheads() -> Response:
+        """
+        Handles GET requests to the "/bulkheads" endpoint.
+
+        Returns:
+            Response: The in-flight, queued and rejected predictions of each model as a JSON response.
+        """
+        return jsonify({"bulkheads": forecaster.bulkhead_stats()})
+
+    @api.route("/coalescing", methods=["GET"])
+    def coalescing() -> Response:
+        """
+        Handles GET requests to the "/coalescing" endpoint.
+
+        Returns:
+            Response: The number of predictions run and of forecasts that shared one, as a JSON response.
+        """
+        return jsonify({"coalescing": forecaster.coalescing_stats()})
 
     return api
@@ -1,12 +1,20 @@
+import time
+from contextlib import nullcontext
+from functools import partial
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, ContextManager, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
 
+from matchpredictor.forecast.bulkhead import Bulkheads, BulkheadStats
+from matchpredictor.forecast.single_flight import SingleFlight, SingleFlightStats
 from matchpredictor.matchresults.result import Fixture, Team, Outcome, Scenario
-from matchpredictor.model.model_provider import ModelProvider
+from matchpredictor.forecast.prediction_pool import PredictionPool
+from matchpredictor.metrics.registry import MetricsRegistry
+from matchpredictor.model.model_provider import ModelProvider, ModelCost
+from matchpredictor.profiling.spans import span, spanned
+from matchpredictor.predictors.predictor import BudgetedPrediction, BudgetedPredictor, InProgressPredictor, \
+    Prediction, Predictor
 
-
-from typing import Optional
-from dataclasses import dataclass
+P = TypeVar("P", bound=Prediction)
 
 
 # Represents a forecast for a fixture
@@ -27,6 +35,20 @@ class Forecast(object):
     confidence: Optional[float]
 
 
+# Represents a forecast made within a latency budget
+@dataclass(frozen=True)
+class BudgetedForecast(Forecast):
+    """
+    Dataclass to represent a forecast made within a latency budget.
+
+    Attributes:
+        simulations (int): The number of simulations that fit within the budget.
+        confidence_interval (Optional[Tuple[float, float]]): The 95% confidence interval of the confidence level.
+    """
+    simulations: int
+    confidence_interval: Optional[Tuple[float, float]]
+
+
 # Checks if a fixture is invalid (e.g., home team and away team have the same name)
 def fixture_is_invalid(fixture: Fixture) -> bool:
     """
@@ -45,24 +67,54 @@ class Forecaster:
     """
     Class for making forecasts using a model provider.
 
+    Concurrent identical forecasts of expensive models are coalesced: one of them runs the prediction and the
+    others wait for it and share the result.
+
     Attributes:
         model_provider (ModelProvider): The model provider object.
+        prediction_pool (Optional[PredictionPool]): The pool that expensive models predict in, if any.
+        bulkheads (Optional[Bulkheads]): The per-model limits on concurrent predictions, if any.
+        registry (Optional[MetricsRegistry]): The registry forecast latencies are recorded in, if any.
 
     Methods:
         forecast(fixture: Fixture, model_name: str) -> Optional[Forecast]:
             Makes a forecast for a given fixture and model.
+        forecast_all(fixtures: Sequence[Fixture], model_name: str) -> List[Optional[Forecast]]:
+            Makes forecasts for several fixtures at once using a single model.
         forecast_in_progress(fixture: Fixture, scenario: Scenario, model_name: str) -> Optional[Forecast]:
             Makes a forecast for a fixture in progress, given a scenario and model.
+        forecast_within(fixture: Fixture, model_name: str, budget: float, scenario: Optional[Scenario])
+                -> Optional[Forecast]:
+            Makes a forecast for a fixture, in progress or not, within a latency budget.
     """
-    def __init__(self, model_provider: ModelProvider) -> None:
+    def __init__(
+            self,
+            model_provider: ModelProvider,
+            prediction_pool: Optional[PredictionPool] = None,
+            bulkheads: Optional[Bulkheads] = None,
+            registry: Optional[MetricsRegistry] = None,
+    ) -> None:
         """
         Initializes the Forecaster with a ModelProvider.
 
         Args:
             model_provider (ModelProvider): The model provider object.
+            prediction_pool (Optional[PredictionPool]): The pool that expensive models predict in.
+                Defaults to None, in which case every model predicts in the calling thread.
+            bulkheads (Optional[Bulkheads]): The per-model limits on concurrent predictions.
+                Defaults to None, in which case predictions are not limited.
+            registry (Optional[MetricsRegistry]): The registry to record forecast latencies in.
+                Defaults to None, in which case latencies are not recorded.
         """
         self.__model_provider = model_provider
+        self.__prediction_pool = prediction_pool
+        self.__bulkheads = bulkheads
+        self.__single_flight = SingleFlight()
+        self.__durations = None if registry is None else registry.histogram(
+            "forecast_duration_seconds", "Time taken to forecast, per model and kind of forecast", ("model", "kind")
+        )
 
+    @spanned("forecast")
     def forecast(self, fixture: Fixture, model_name: str) -> Optional[Forecast]:
         """
         Makes a forecast for a given fixture and model.
@@ -73,18 +125,29 @@ class Forecaster:
 
         Returns:
             Optional[Forecast]: The forecast for the fixture, or None if the fixture is invalid or the predictor is not available.
+
+        Raises:
+            BulkheadFull: If the model is overloaded.
         """
         # If the fixture is invalid, return None
         if fixture_is_invalid(fixture):
             return None
 
         # If the predictor for the given model is not available, return None
-        predictor = self.__model_provider.get_predictor(model_name)
+        with span("model_lookup"):
+            predictor = self.__model_provider.get_predictor(model_name)
         if predictor is None:
             return None
 
-        # Make a prediction for the given fixture using the selected predictor
-        prediction = predictor.predict(fixture)
+        # Make a prediction for the given fixture using the selected predictor,
+        # offloading it to the prediction pool if the model is expensive
+        pool = self.__pool_for(model_name)
+
+        def predict(found: Predictor) -> Prediction:
+            with self.__admit(model_name):
+                return found.predict(fixture) if pool is None else pool.predict(model_name, fixture)
+
+        prediction = self.__predict("forecast", (fixture,), model_name, partial(predict, predictor))
 
         # Create a Forecast object with the fixture, model name, predicted outcome, and confidence level
         # Return the Forecast object as the result of the forecast
@@ -95,6 +158,55 @@ class Forecaster:
             confidence=prediction.confidence
         )
 
+    @spanned("forecast_all")
+    def forecast_all(self, fixtures: Sequence[Fixture], model_name: str) -> List[Optional[Forecast]]:
+        """
+        Makes forecasts for several fixtures at once using a single model.
+
+        The valid fixtures are predicted in one batch, which lets vectorized predictors do the work in one call.
+
+        Args:
+            fixtures (Sequence[Fixture]): The fixtures for which to make the forecasts.
+            model_name (str): The name of the model to use for the forecasts.
+
+        Returns:
+            List[Optional[Forecast]]: One forecast per fixture, or None where the fixture is invalid.
+            All forecasts are None if the predictor is not available.
+
+        Raises:
+            BulkheadFull: If the model is overloaded.
+        """
+        forecasts: List[Optional[Forecast]] = [None] * len(fixtures)
+
+        # If the predictor for the given model is not available, return no forecasts
+        with span("model_lookup"):
+            predictor = self.__model_provider.get_predictor(model_name)
+        if predictor is None:
+            return forecasts
+
+        # Only predict the fixtures that are valid
+        valid_fixtures = [fixture for fixture in fixtures if not fixture_is_invalid(fixture)]
+        pool = self.__pool_for(model_name)
+        with span("predict", model=model_name, kind="forecast_all"), self.__observe("forecast_all", model_name), \
+                self.__admit(model_name):
+            predictions = iter(
+                predictor.predict_all(valid_fixtures) if pool is None else pool.predict_all(model_name, valid_fixtures)
+            )
+
+        # Put the predictions back at the positions of their fixtures
+        for index, fixture in enumerate(fixtures):
+            if not fixture_is_invalid(fixture):
+                prediction = next(predictions)
+                forecasts[index] = Forecast(
+                    fixture=fixture,
+                    model_name=model_name,
+                    outcome=prediction.outcome,
+                    confidence=prediction.confidence
+                )
+
+        return forecasts
+
+    @spanned("forecast_in_progress")
     def forecast_in_progress(self, fixture: Fixture, scenario: Scenario, model_name: str) -> Optional[Forecast]:
         """
         Makes a forecast for a fixture in progress, given a scenario and model.
@@ -106,18 +218,31 @@ class Forecaster:
 
         Returns:
             Optional[Forecast]: The forecast for the in-progress fixture, or None if the fixture is invalid or the predictor is not available.
+
+        Raises:
+            BulkheadFull: If the model is overloaded.
         """
         # If the fixture is invalid, return None
         if fixture_is_invalid(fixture):
             return None
 
         # If the predictor for the given model is not available, return None
-        predictor = self.__model_provider.get_in_progress_predictor(model_name)
+        with span("model_lookup"):
+            predictor = self.__model_provider.get_in_progress_predictor(model_name)
         if predictor is None:
             return None
 
-        # Make an in-progress prediction for the given fixture and scenario using the selected predictor
-        prediction = predictor.predict_in_progress(fixture, scenario)
+        # Make an in-progress prediction for the given fixture and scenario using the selected predictor,
+        # offloading it to the prediction pool if the model is expensive
+        pool = self.__pool_for(model_name)
+
+        def predict(found: InProgressPredictor) -> Prediction:
+            with self.__admit(model_name):
+                return found.predict_in_progress(fixture, scenario) if pool is None \
+                    else pool.predict_in_progress(model_name, fixture, scenario)
+
+        prediction = self.__predict("forecast_in_progress", (fixture, scenario), model_name,
+                                    partial(predict, predictor))
 
         # Create a Forecast object with the fixture, model name, predicted outcome, and confidence level
         # Return the Forecast object as the result of the forecast_in_progress
@@ -127,3 +252,165 @@ class Forecaster:
             outcome=prediction.outcome,
             confidence=prediction.confidence
         )
+
+    @spanned("forecast_within")
+    def forecast_within(
+            self,
+            fixture: Fixture,
+            model_name: str,
+            budget: float,
+            scenario: Optional[Scenario] = None,
+    ) -> Optional[Forecast]:
+        """
+        Makes a forecast for a fixture, in progress or not, within a latency budget.
+
+        Budgeted models, such as the simulators, run as many simulations as fit within the budget, including the
+        time spent waiting for a slot. Other models ignore the budget and forecast as usual.
+
+        Args:
+            fixture (Fixture): The fixture for which to make the forecast.
+            model_name (str): The name of the model to use for the forecast.
+            budget (float): The latency budget, in seconds.
+            scenario (Optional[Scenario]): The scenario of the fixture in progress.
+                Defaults to None, in which case the fixture has not started.
+
+        Returns:
+            Optional[Forecast]: A BudgetedForecast for budgeted models, a Forecast for other models,
+            or None if the fixture is invalid or the predictor is not available.
+
+        Raises:
+            BulkheadFull: If the model is overloaded.
+        """
+        deadline = time.monotonic() + budget
+
+        # Models that cannot trade precision for latency forecast as usual
+        with span("model_lookup"):
+            predictor = self.__model_provider.get_budgeted_predictor(model_name)
+        if predictor is None:
+            if scenario is None:
+                return self.forecast(fixture, model_name)
+            return self.forecast_in_progress(fixture, scenario, model_name)
+
+        # If the fixture is invalid, return None
+        if fixture_is_invalid(fixture):
+            return None
+
+        # A fixture that has not started is a fixture in progress with no time elapsed
+        in_progress = scenario or Scenario(minutes_elapsed=0, home_goals=0, away_goals=0)
+
+        pool = self.__pool_for(model_name)
+
+        def predict(found: BudgetedPredictor) -> BudgetedPrediction:
+            with self.__admit(model_name):
+                return found.predict_in_progress_within(fixture, in_progress, deadline) if pool is None \
+                    else pool.predict_in_progress_within(model_name, fixture, in_progress, deadline)
+
+        # Requests only share a computation when they have the same budget, so none returns later than asked
+        prediction = self.__predict(
+            "forecast_within", (fixture, in_progress, budget), model_name, partial(predict, predictor)
+        )
+
+        return BudgetedForecast(
+            fixture=fixture,
+            model_name=model_name,
+            outcome=prediction.outcome,
+            confidence=prediction.confidence,
+            simulations=prediction.simulations,
+            confidence_interval=prediction.confidence_interval,
+        )
+
+    def model_version(self, model_name: str) -> Optional[str]:
+        """
+        Retrieves the version of the data a model was trained on, which changes when the model is retrained.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            Optional[str]: The version, or None if the model does not exist.
+        """
+        model = self.__model_provider.get_model(model_name)
+        return None if model is None else model.version
+
+    def bulkhead_stats(self) -> Dict[str, BulkheadStats]:
+        """
+        Retrieves the load of the models' bulkheads.
+
+        Returns:
+            Dict[str, BulkheadStats]: The load of the bulkheads, keyed by model name.
+        """
+        return {} if self.__bulkheads is None else self.__bulkheads.stats()
+
+    def coalescing_stats(self) -> SingleFlightStats:
+        """
+        Retrieves how many forecasts ran their prediction and how many shared another forecast's prediction.
+
+        Returns:
+            SingleFlightStats: The counts of predictions and coalesced forecasts.
+        """
+        return self.__single_flight.stats()
+
+    def __predict(self, kind: str, key: Tuple[Hashable, ...], model_name: str, predict: Callable[[], P]) -> P:
+        """
+        Runs a prediction, timing it and sharing it with the concurrent identical forecasts if the model is expensive.
+
+        Cheap predictions are faster to run again than to coordinate, so they are not coalesced.
+
+        Args:
+            kind (str): The kind of forecast, e.g. "forecast_in_progress".
+            key (Tuple[Hashable, ...]): Identifies, with the kind and model, the forecasts the prediction can be
+                shared with.
+            model_name (str): The name of the model.
+            predict (Callable[[], P]): Runs the prediction.
+
+        Returns:
+            P: The prediction.
+        """
+        with span("predict", model=model_name, kind=kind), self.__observe(kind, model_name):
+            model = self.__model_provider.get_model(model_name)
+            if model is None or model.cost is not ModelCost.EXPENSIVE:
+                return predict()
+            return self.__single_flight.run((kind, model_name, *key), predict)
+
+    def __observe(self, kind: str, model_name: str) -> ContextManager[None]:
+        """
+        Records how long a forecast takes in the forecast latency histogram, if there is a metrics registry.
+
+        Args:
+            kind (str): The kind of forecast.
+            model_name (str): The name of the model.
+
+        Returns:
+            ContextManager[None]: Times the forecast.
+        """
+        return nullcontext() if self.__durations is None \
+            else self.__durations.time(model=model_name, kind=kind)
+
+    def __admit(self, model_name: str) -> ContextManager[None]:
+        """
+        Admits a prediction of the given model through the model's bulkhead.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            ContextManager[None]: Holds the model's slot while the prediction runs.
+        """
+        model = self.__model_provider.get_model(model_name)
+        bulkhead = None if self.__bulkheads is None or model is None else self.__bulkheads.bulkhead_for(model)
+        return nullcontext() if bulkhead is None else bulkhead.admit()
+
+    def __pool_for(self, model_name: str) -> Optional[PredictionPool]:
+        """
+        Retrieves the prediction pool to offload the given model's predictions to.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            Optional[PredictionPool]: The prediction pool, or None if the model predicts in the calling thread.
+        """
+        model = self.__model_provider.get_model(model_name)
+        if model is None or model.cost is not ModelCost.EXPENSIVE:
+            return None
+        return self.__prediction_pool
@@ -0,0 +1,188 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import List, Optional, Sequence
+
+from matchpredictor.matchresults.result import Fixture, Scenario
+from matchpredictor.model.model_provider import ModelProvider
+from matchpredictor.predictors.predictor import BudgetedPrediction, Prediction
+
+# The models of the pool's worker processes, installed when each worker starts
+_installed_models: Optional[ModelProvider] = None
+
+
+class PredictionPool:
+    """
+    Runs predictions in a pool of worker processes, so that CPU-bound predictors do not hold the GIL of the
+    process serving requests. Threads waiting for a prediction release the GIL, so cheap requests keep flowing.
+
+    The workers are forked from the process that first uses the pool and inherit its trained models, so only
+    model names, fixtures and predictions cross process boundaries. A process forked after the pool was
+    started, such as a server worker, starts a pool of its own.
+    """
+
+    def __init__(self, model_provider: ModelProvider, processes: int) -> None:
+        """
+        Initializes the PredictionPool. The worker processes are started on first use.
+
+        Args:
+            model_provider (ModelProvider): The models the workers predict with.
+            processes (int): The number of worker processes.
+        """
+        self.__model_provider = model_provider
+        self.__processes = processes
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__executor_pid = 0
+        self.__lock = Lock()
+
+    def predict(self, model_name: str, fixture: Fixture) -> Prediction:
+        """
+        Predicts the outcome of a fixture in a worker process.
+
+        Args:
+            model_name (str): The name of the model to predict with.
+            fixture (Fixture): The fixture to predict.
+
+        Returns:
+            Prediction: The predicted outcome and confidence level.
+        """
+        return self.__get_executor().submit(_predict, model_name, fixture).result()
+
+    def predict_all(self, model_name: str, fixtures: Sequence[Fixture]) -> List[Prediction]:
+        """
+        Predicts the outcomes of several fixtures in a worker process.
+
+        Args:
+            model_name (str): The name of the model to predict with.
+            fixtures (Sequence[Fixture]): The fixtures to predict.
+
+        Returns:
+            List[Prediction]: The predictions, in the same order as the fixtures.
+        """
+        return self.__get_executor().submit(_predict_all, model_name, list(fixtures)).result()
+
+    def predict_in_progress(self, model_name: str, fixture: Fixture, scenario: Scenario) -> Prediction:
+        """
+        Predicts the outcome of an in-progress fixture in a worker process.
+
+        Args:
+            model_name (str): The name of the model to predict with.
+            fixture (Fixture): The in-progress fixture to predict.
+            scenario (Scenario): The scenario of the fixture in progress.
+
+        Returns:
+            Prediction: The predicted outcome and confidence level.
+        """
+        return self.__get_executor().submit(_predict_in_progress, model_name, fixture, scenario).result()
+
+    def predict_in_progress_within(
+            self,
+            model_name: str,
+            fixture: Fixture,
+            scenario: Scenario,
+            deadline: float,
+    ) -> BudgetedPrediction:
+        """
+        Predicts the outcome of an in-progress fixture in a worker process, returning by the given deadline.
+
+        The monotonic clock is shared by the processes of a machine, so the deadline holds in the worker.
+
+        Args:
+            model_name (str): The name of the model to predict with.
+            fixture (Fixture): The in-progress fixture to predict.
+            scenario (Scenario): The scenario of the fixture in progress.
+            deadline (float): The time.monotonic() value by which to return.
+
+        Returns:
+            BudgetedPrediction: The predicted outcome, confidence level and precision.
+        """
+        return self.__get_executor().submit(
+            _predict_in_progress_within, model_name, fixture, scenario, deadline
+        ).result()
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes once the predictions in flight are done.
+        """
+        with self.__lock:
+            if self.__executor is not None and self.__executor_pid == os.getpid():
+                self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """
+        Retrieves the process pool of the current process, starting it if needed.
+
+        Returns:
+            ProcessPoolExecutor: The process pool.
+        """
+        with self.__lock:
+            # A pool inherited through fork belongs to the parent process and cannot be used here
+            if self.__executor is None or self.__executor_pid != os.getpid():
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__processes,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_install_models,
+                    initargs=(self.__model_provider,),
+                )
+                self.__executor_pid = os.getpid()
+
+            return self.__executor
+
+
+def _install_models(model_provider: ModelProvider) -> None:
+    """
+    Installs the models in a worker process. The provider is inherited through fork, not pickled.
+
+    Args:
+        model_provider (ModelProvider): The models to predict with.
+    """
+    global _installed_models
+    _installed_models = model_provider
+
+
+def _worker_models() -> ModelProvider:
+    """
+    Retrieves the models installed in the worker process.
+
+    Returns:
+        ModelProvider: The models to predict with.
+    """
+    if _installed_models is None:
+        raise RuntimeError("No models installed in the prediction worker")
+    return _installed_models
+
+
+# The functions below run in the worker processes, so they are referenced by name and cannot be name-mangled
+def _predict(model_name: str, fixture: Fixture) -> Prediction:
+    predictor = _worker_models().get_predictor(model_name)
+    if predictor is None:
+        raise ValueError(f"Unknown model {model_name}")
+    return predictor.predict(fixture)
+
+
+def _predict_all(model_name: str, fixtures: List[Fixture]) -> List[Prediction]:
+    predictor = _worker_models().get_predictor(model_name)
+    if predictor is None:
+        raise ValueError(f"Unknown model {model_name}")
+    return predictor.predict_all(fixtures)
+
+
+def _predict_in_progress(model_name: str, fixture: Fixture, scenario: Scenario) -> Prediction:
+    predictor = _worker_models().get_in_progress_predictor(model_name)
+    if predictor is None:
+        raise ValueError(f"Unknown in-progress model {model_name}")
+    return predictor.predict_in_progress(fixture, scenario)
+
+
+def _predict_in_progress_within(
+        model_name: str,
+        fixture: Fixture,
+        scenario: Scenario,
+        deadline: float,
+) -> BudgetedPrediction:
+    predictor = _worker_models().get_budgeted_predictor(model_name)
+    if predictor is None:
+        raise ValueError(f"Unknown budgeted model {model_name}")
+    return predictor.predict_in_progress_within(fixture, scenario, deadline)
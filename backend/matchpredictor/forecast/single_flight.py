@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Callable, Dict, Hashable, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats(object):
+    """
+    Represents how much work a SingleFlight has saved.
+
+    Attributes:
+        computations (int): The number of calls that ran the computation.
+        coalesced (int): The number of calls that waited for, and shared, another call's computation.
+        in_flight (int): The number of computations running.
+    """
+    computations: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call(object):
+    """
+    A computation in flight, which the calls with the same key wait on.
+    """
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: object = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent calls with the same key, so that only the first runs the computation and the others
+    wait for it and share its result, or its error.
+
+    Nothing is cached: once a computation is done, the next call with its key runs it again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the SingleFlight.
+        """
+        self.__calls: Dict[Hashable, _Call] = {}
+        self.__lock = Lock()
+        self.__computations = 0
+        self.__coalesced = 0
+
+    def run(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Runs the computation, or waits for the one already running with the same key.
+
+        Args:
+            key (Hashable): Identifies calls whose computations are interchangeable.
+            compute (Callable[[], T]): The computation.
+
+        Returns:
+            T: The result of the computation.
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = _Call()
+                self.__computations += 1
+            else:
+                self.__coalesced += 1
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = compute()
+            except BaseException as error:
+                call.error = error
+            finally:
+                # Later calls start a computation of their own
+                with self.__lock:
+                    del self.__calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return cast(T, call.result)
+
+    def stats(self) -> SingleFlightStats:
+        """
+        Retrieves how many calls ran and shared computations.
+
+        Returns:
+            SingleFlightStats: The counts of computations and coalesced calls.
+        """
+        with self.__lock:
+            return SingleFlightStats(
+                computations=self.__computations,
+                coalesced=self.__coalesced,
+                in_flight=len(self.__calls),
+            )
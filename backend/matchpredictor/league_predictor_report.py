@@ -1,7 +1,19 @@
-from matchpredictor.app import build_model_provider
-from matchpredictor.evaluation.reporter import Reporter
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from matchpredictor.app import MODEL_TRAINERS
+from matchpredictor.evaluation.reporter import PredictionReport, print_reports, report_for
 from matchpredictor.matchresults.result import Result
-from matchpredictor.matchresults.results_provider import training_results, validation_results
+from matchpredictor.matchresults.result_filter import ResultFilter, ResultIndex
+from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.results_store import ResultsStore
+
+CSV_LOCATION = 'https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv'
+
+# The training and validation data of each league, installed in the report's worker processes when they start
+_installed_datasets: Optional[Dict[str, Tuple[List[Result], List[Result]]]] = None
 
 
 def predictor_report_for(league: str, year: int) -> None:
@@ -15,20 +27,97 @@ def predictor_report_for(league: str, year: int) -> None:
     Returns:
         None
     """
-    # Helper function to check if a result belongs to a specific league
-    def matches_league(result: Result) -> bool:
-        return result.fixture.league == league
-
-    # Set the CSV location
-    csv_location = 'https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv'
-    # Fetch training data using the training_results function
-    training_data = training_results(csv_location, year,
-                                     lambda result: result.season >= year - 3 and matches_league(result))
-    # Fetch validation data using the validation_results function
-    validation_data = validation_results(csv_location, year, matches_league)
-
-    # Create a Reporter object with the league and year as the title, validation data,
-    # and a model provider built from the training data
-    # Generate and print the prediction report
-    Reporter(f"{league} {year}", validation_data, build_model_provider(training_data)) \
-        .run_report()
+    predictor_reports_for([league], year)
+
+
+def predictor_reports_for(
+        leagues: Sequence[str],
+        year: int,
+        csv_location: str = CSV_LOCATION,
+        processes: Optional[int] = None,
+        model_names: Optional[List[str]] = None,
+        store: Optional[ResultsStore] = None,
+) -> List[Tuple[str, List[PredictionReport]]]:
+    """
+    Generates and prints the prediction reports of several leagues for a year.
+
+    The results are downloaded and parsed once. Each model of each league is then trained and evaluated in its own
+    task of a process pool, so the whole report takes about as long as the slowest model, rather than all of them.
+
+    Args:
+        leagues (Sequence[str]): The league names.
+        year (int): The year whose results the models are validated on. They are trained on the three before it.
+        csv_location (str): The location of the CSV file.
+        processes (Optional[int]): The number of worker processes, which parse the results, then train and
+            evaluate the models. Defaults to None, in which case there is one per CPU.
+        model_names (Optional[List[str]]): The names of the models to report on. Defaults to None, in which case
+            all models are.
+        store (Optional[ResultsStore]): The store the results are kept in and queried from. Defaults to None, in
+            which case they are loaded from the CSV file.
+
+    Returns:
+        List[Tuple[str, List[PredictionReport]]]: The title and reports of each league, in the order of the
+        leagues, with the reports in the order of the models.
+    """
+    # Skip the rows of other leagues and seasons as they are parsed, then split the results of each league once,
+    # before the workers are forked, so they share the parsed dataset
+    result_filter = ResultFilter(first_season=year - 3, last_season=year, leagues=frozenset(leagues))
+    index = ResultIndex(load_results(csv_location, result_filter, processes or os.cpu_count() or 1, store))
+    datasets = {league: split_league(index, league, year) for league in leagues}
+    names = [trainer.name for trainer in MODEL_TRAINERS if model_names is None or trainer.name in model_names]
+
+    with ProcessPoolExecutor(
+            max_workers=processes or os.cpu_count(),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_install_datasets,
+            initargs=(datasets,),
+    ) as executor:
+        # Submit every task before waiting on any, and collect them in submission order, so the output is
+        # deterministic however the tasks finish
+        futures = {(league, name): executor.submit(_report, league, name) for league in leagues for name in names}
+        league_reports = [
+            (f"{league} {year}", [futures[(league, name)].result() for name in names]) for league in leagues
+        ]
+
+    for title, reports in league_reports:
+        print_reports(title, reports)
+    return league_reports
+
+
+def split_league(index: ResultIndex, league: str, year: int) -> Tuple[List[Result], List[Result]]:
+    """
+    Splits the results of a league into training and validation data.
+
+    Args:
+        index (ResultIndex): The results of all leagues, indexed.
+        league (str): The league name.
+        year (int): The year to validate on. The three years before it are trained on.
+
+    Returns:
+        Tuple[List[Result], List[Result]]: The training data and the validation data.
+    """
+    leagues = frozenset([league])
+    training_data = index.select(ResultFilter(first_season=year - 3, last_season=year - 1, leagues=leagues))
+    validation_data = index.select(ResultFilter(first_season=year, last_season=year, leagues=leagues))
+    return training_data, validation_data
+
+
+def _install_datasets(datasets: Dict[str, Tuple[List[Result], List[Result]]]) -> None:
+    """
+    Installs the datasets in a worker process. They are inherited through fork, not pickled.
+
+    Args:
+        datasets (Dict[str, Tuple[List[Result], List[Result]]]): The training and validation data of each league.
+    """
+    global _installed_datasets
+    _installed_datasets = datasets
+
+
+# Runs in the worker processes, so it is referenced by name
+def _report(league: str, model_name: str) -> PredictionReport:
+    if _installed_datasets is None:
+        raise RuntimeError("No datasets installed in the report worker")
+
+    training_data, validation_data = _installed_datasets[league]
+    trainer = next(trainer for trainer in MODEL_TRAINERS if trainer.name == model_name)
+    return report_for(model_name, trainer.train(training_data), validation_data)
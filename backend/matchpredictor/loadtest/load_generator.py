@@ -0,0 +1,196 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from matchpredictor.evaluation.evaluator import percentile
+from matchpredictor.loadtest.request_mix import LoadRequest
+
+# The number of requests in flight at once, by default
+DEFAULT_CONCURRENCY = 8
+
+# How long to wait for a response, in seconds, before counting the request as failed
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class RequestTiming(object):
+    """
+    Represents the outcome of a request sent by the load generator.
+
+    Attributes:
+        endpoint (str): The path of the request, without the query string.
+        model (str): The models the request asked for, or "-".
+        status (int): The status code of the response, or 0 if there was none, e.g. on a timeout.
+        latency_ns (int): The latency, in nanoseconds.
+    """
+    endpoint: str
+    model: str
+    status: int
+    latency_ns: int
+
+    def failed(self) -> bool:
+        """
+        Returns:
+            bool: Whether the request got no response or an error response.
+        """
+        return self.status == 0 or self.status >= 400
+
+
+@dataclass(frozen=True)
+class LoadReport(object):
+    """
+    Represents how an endpoint of the app, asked for a model, held up under load.
+
+    Attributes:
+        endpoint (str): The endpoint, or "All" for the requests of every endpoint.
+        model (str): The models asked for, "-" if none, or "All" for the requests of every model.
+        requests (int): The number of requests sent.
+        errors (int): The number of requests that got no response or an error response.
+        error_rate (float): The share of the requests that failed.
+        throughput (float): The number of requests completed per second of the run.
+        latency_p50_ms (float): The median latency, in milliseconds.
+        latency_p95_ms (float): The 95th percentile latency, in milliseconds.
+        latency_p99_ms (float): The 99th percentile latency, in milliseconds.
+    """
+    endpoint: str
+    model: str
+    requests: int
+    errors: int
+    error_rate: float
+    throughput: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+
+
+def run_load(
+        base_url: str,
+        load_requests: Sequence[LoadRequest],
+        total: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: Optional[float] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+) -> Tuple[List[RequestTiming], float]:
+    """
+    Sends requests to an app from several threads at once, cycling through the given requests in order.
+
+    Without a rate, each thread sends its next request as soon as the previous one completes. With a rate, the
+    requests are scheduled at fixed intervals whatever the responses, as real clients arrive, and latencies are
+    measured from when each request was due rather than when it was sent: when the app falls behind, the time
+    requests spend waiting for a free thread counts against it, instead of the load silently slowing down.
+
+    Args:
+        base_url (str): The base URL of the app, e.g. http://localhost:5001.
+        load_requests (Sequence[LoadRequest]): The requests to send.
+        total (Optional[int]): The number of requests to send. Defaults to None, in which case each request is
+            sent once.
+        concurrency (int): The number of threads sending requests.
+        rate (Optional[float]): The number of requests per second. Defaults to None, in which case requests are
+            sent as fast as the app answers them.
+        timeout (float): How long to wait for each response, in seconds.
+
+    Returns:
+        Tuple[List[RequestTiming], float]: The outcome of each request, in the order they were due, and how long
+        the run took, in seconds.
+
+    Raises:
+        ValueError: If there are no requests to send.
+    """
+    if not load_requests:
+        raise ValueError("No requests to send")
+
+    count = total if total is not None else len(load_requests)
+    timings: List[Optional[RequestTiming]] = [None] * count
+    next_index = iter(range(count))
+    lock = threading.Lock()
+    started = time.perf_counter_ns()
+
+    def send() -> None:
+        # Each thread keeps its own session, so connections are reused but never shared between threads
+        with requests.Session() as session:
+            while True:
+                with lock:
+                    index = next(next_index, None)
+                if index is None:
+                    return
+
+                load_request = load_requests[index % len(load_requests)]
+                due = started + int(index * 1_000_000_000 / rate) if rate is not None else None
+                if due is not None:
+                    time.sleep(max(due - time.perf_counter_ns(), 0) / 1_000_000_000)
+
+                sent = time.perf_counter_ns()
+                try:
+                    status = session.request(load_request.method, base_url + load_request.path,
+                                             headers=load_request.headers, timeout=timeout).status_code
+                except requests.RequestException:
+                    status = 0
+                latency = time.perf_counter_ns() - (due if due is not None else sent)
+
+                timings[index] = RequestTiming(load_request.endpoint(), load_request.model(), status, latency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Surface the errors of the threads, other than failed requests, once they have all finished
+        for thread in [executor.submit(send) for _ in range(concurrency)]:
+            thread.result()
+
+    elapsed = (time.perf_counter_ns() - started) / 1_000_000_000
+    return [timing for timing in timings if timing is not None], elapsed
+
+
+def summarize(timings: Sequence[RequestTiming], elapsed: float) -> List[LoadReport]:
+    """
+    Summarizes the outcome of a load run per endpoint and model.
+
+    Args:
+        timings (Sequence[RequestTiming]): The outcome of each request.
+        elapsed (float): How long the run took, in seconds.
+
+    Returns:
+        List[LoadReport]: The report of each endpoint and model, in the order they were first requested, followed
+        by the report of all requests.
+    """
+    groups: Dict[Tuple[str, str], List[RequestTiming]] = {}
+    for timing in timings:
+        groups.setdefault((timing.endpoint, timing.model), []).append(timing)
+
+    reports = [_report(endpoint, model, group, elapsed) for (endpoint, model), group in groups.items()]
+    return reports + [_report("All", "All", timings, elapsed)]
+
+
+def print_load_report(reports: Sequence[LoadReport]) -> None:
+    """
+    Prints the throughput, latency percentiles and error rate of each endpoint and model.
+
+    Args:
+        reports (Sequence[LoadReport]): The reports.
+    """
+    print()
+    print(" {:<22} | {:<28} | {:>8} | {:>8} | {:>10} | {:>10} | {:>10} | {:>8}".format(
+        "Endpoint", "Model", "Requests", "Req/s", "p50", "p95", "p99", "Errors"))
+    print("-" * 24 + "+" + "-" * 30 + ("+" + "-" * 10) * 2 + ("+" + "-" * 12) * 3 + "+" + "-" * 10)
+    for r in reports:
+        print(" {:<22} | {:<28} | {:>8} | {:>8.1f} | {:>8.1f}ms | {:>8.1f}ms | {:>8.1f}ms | {:>7.2%}".format(
+            r.endpoint, r.model, r.requests, r.throughput, r.latency_p50_ms, r.latency_p95_ms, r.latency_p99_ms,
+            r.error_rate))
+    print()
+
+
+def _report(endpoint: str, model: str, timings: Sequence[RequestTiming], elapsed: float) -> LoadReport:
+    latencies = sorted(timing.latency_ns for timing in timings)
+    errors = sum(timing.failed() for timing in timings)
+    return LoadReport(
+        endpoint=endpoint,
+        model=model,
+        requests=len(timings),
+        errors=errors,
+        error_rate=errors / len(timings) if timings else 0.0,
+        throughput=len(timings) / elapsed if elapsed > 0 else 0.0,
+        latency_p50_ms=percentile(latencies, 50) / 1_000_000,
+        latency_p95_ms=percentile(latencies, 95) / 1_000_000,
+        latency_p99_ms=percentile(latencies, 99) / 1_000_000,
+    )
@@ -0,0 +1,264 @@
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import requests
+
+from matchpredictor.model.models_api import ModelInfo
+from matchpredictor.teams.teams_provider import TeamWithLeagues
+
+# The share of each endpoint in a synthetic mix, roughly as the frontend calls them
+SYNTHETIC_MIX: Dict[str, float] = {
+    "/forecast": 0.6,
+    "/forecast-in-progress": 0.2,
+    "/upcoming-games": 0.1,
+    "/teams": 0.05,
+    "/models": 0.05,
+}
+
+
+@dataclass(frozen=True)
+class LoadRequest(object):
+    """
+    Represents a request sent by the load generator.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The path, with the query string, relative to the app's base URL.
+        headers (Dict[str, str]): The headers.
+    """
+    method: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def endpoint(self) -> str:
+        """
+        Returns:
+            str: The path without the query string, which the load report groups requests by.
+        """
+        return urlsplit(self.path).path or "/"
+
+    def model(self) -> str:
+        """
+        Returns:
+            str: The models the request asks for, comma-separated, or "-" if it does not ask for any.
+        """
+        return ",".join(parse_qs(urlsplit(self.path).query).get("model_name", [])) or "-"
+
+
+def parse_http_file(text: str) -> List[LoadRequest]:
+    """
+    Parses the requests of an HTTP client file, such as requests.http: requests separated by ### lines, each a
+    request line followed by headers.
+
+    Args:
+        text (str): The content of the file.
+
+    Returns:
+        List[LoadRequest]: The requests, in order, with their paths relative to the host they were recorded against.
+    """
+    load_requests: List[LoadRequest] = []
+
+    for block in _http_blocks(text):
+        lines = [line.strip() for line in block if not line.strip().startswith(("#", "//"))]
+        # Skip the blank lines before the request line, and stop at the first blank line after the headers
+        while lines and lines[0] == "":
+            lines.pop(0)
+        if not lines:
+            continue
+
+        method, url = lines[0].split()[:2]
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if line == "":
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip()] = value.strip()
+
+        load_requests.append(LoadRequest(method.upper(), _relative(url), headers))
+
+    return load_requests
+
+
+def parse_request_log(text: str) -> List[LoadRequest]:
+    """
+    Parses a recorded request log of JSON lines, each with a "method", a "path" or "url", and optionally
+    "headers".
+
+    Args:
+        text (str): The content of the log.
+
+    Returns:
+        List[LoadRequest]: The requests, in order.
+    """
+    load_requests: List[LoadRequest] = []
+
+    for line in text.splitlines():
+        if line.strip() == "":
+            continue
+        entry = json.loads(line)
+        load_requests.append(LoadRequest(
+            entry.get("method", "GET").upper(),
+            _relative(entry.get("path") or entry["url"]),
+            dict(entry.get("headers", {})),
+        ))
+
+    return load_requests
+
+
+def load_request_log(path: str) -> List[LoadRequest]:
+    """
+    Reads the requests to replay from a file: an HTTP client file if it ends in .http, a JSON lines log otherwise.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        List[LoadRequest]: The requests, in order.
+    """
+    with open(path) as log_file:
+        text = log_file.read()
+    return parse_http_file(text) if path.endswith(".http") else parse_request_log(text)
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parses the weights of the endpoints of a synthetic mix, e.g. "forecast=6,teams=1".
+
+    Args:
+        value (str): The comma-separated weights of the endpoints, with or without their leading slash.
+
+    Returns:
+        Dict[str, float]: The weight of each endpoint, keyed by path. Endpoints that are not listed are not requested.
+
+    Raises:
+        ValueError: If an endpoint is not one of the synthetic mix's, or a weight is not a non-negative number.
+    """
+    mix: Dict[str, float] = {}
+
+    for entry in value.split(","):
+        if entry.strip() == "":
+            continue
+        name, _, weight = entry.partition("=")
+        endpoint = "/" + name.strip().lstrip("/")
+        if endpoint not in SYNTHETIC_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {name.strip()}")
+        mix[endpoint] = float(weight)
+        if mix[endpoint] < 0:
+            raise ValueError(f"Negative weight in mix: {entry.strip()}")
+
+    return mix
+
+
+def fetch_catalog(base_url: str, timeout: float = 10.0) -> Tuple[List[TeamWithLeagues], List[ModelInfo]]:
+    """
+    Fetches the teams and models an app serves, to build a synthetic mix of requests it can answer.
+
+    Args:
+        base_url (str): The base URL of the app.
+        timeout (float): How long to wait for each response, in seconds.
+
+    Returns:
+        Tuple[List[TeamWithLeagues], List[ModelInfo]]: The teams and the models.
+    """
+    teams = requests.get(f"{base_url}/teams", timeout=timeout).json()["teams"]
+    models = requests.get(f"{base_url}/models", timeout=timeout).json()["models"]
+    return (
+        [TeamWithLeagues(team["name"], team["leagues"]) for team in teams],
+        [ModelInfo(model["name"], model["predicts_in_progress"]) for model in models],
+    )
+
+
+def synthetic_requests(
+        count: int,
+        teams: Sequence[TeamWithLeagues],
+        models: Sequence[ModelInfo],
+        mix: Dict[str, float] = SYNTHETIC_MIX,
+        seed: int = 0,
+) -> List[LoadRequest]:
+    """
+    Generates a synthetic mix of requests across the endpoints of the app.
+
+    Forecasts are between two teams of the same league, with a model drawn uniformly. In-progress forecasts only
+    use the models that predict in-progress fixtures, and are left out of the mix if there are none.
+
+    Args:
+        count (int): The number of requests.
+        teams (Sequence[TeamWithLeagues]): The teams the app knows.
+        models (Sequence[ModelInfo]): The models the app serves.
+        mix (Dict[str, float]): The weight of each endpoint.
+        seed (int): The seed of the generator. The same arguments always generate the same requests.
+
+    Returns:
+        List[LoadRequest]: The requests.
+
+    Raises:
+        ValueError: If no endpoint of the mix can be requested.
+    """
+    generator = random.Random(seed)
+
+    league_teams: Dict[str, List[str]] = {}
+    for team in teams:
+        for league in team.leagues:
+            league_teams.setdefault(league, []).append(team.name)
+    leagues = sorted(league for league, names in league_teams.items() if len(names) >= 2)
+    in_progress_models = [model.name for model in models if model.predicts_in_progress]
+    model_names = [model.name for model in models]
+
+    # Leave out the endpoints that cannot be requested with these teams and models
+    available = {
+        "/forecast": bool(leagues and model_names),
+        "/forecast-in-progress": bool(leagues and in_progress_models),
+        "/upcoming-games": bool(model_names),
+        "/teams": True,
+        "/models": True,
+    }
+    endpoints = [endpoint for endpoint, weight in mix.items() if weight > 0 and available.get(endpoint, False)]
+    if not endpoints:
+        raise ValueError("No endpoint of the mix can be requested")
+    weights = [mix[endpoint] for endpoint in endpoints]
+
+    def fixture() -> Dict[str, str]:
+        league = generator.choice(leagues)
+        home, away = generator.sample(league_teams[league], 2)
+        return {"home_name": home, "away_name": away, "league": league}
+
+    load_requests: List[LoadRequest] = []
+    for endpoint in generator.choices(endpoints, weights, k=count):
+        if endpoint == "/forecast":
+            query = {**fixture(), "model_name": generator.choice(model_names)}
+        elif endpoint == "/forecast-in-progress":
+            home_goals, away_goals = generator.randint(0, 3), generator.randint(0, 3)
+            query = {
+                **fixture(), "model_name": generator.choice(in_progress_models),
+                "minutes_elapsed": str(generator.randint(1, 89)), "home_goals": str(home_goals),
+                "away_goals": str(away_goals),
+            }
+        elif endpoint == "/upcoming-games":
+            query = {"model_name": generator.choice(model_names)}
+        else:
+            query = {}
+
+        path = f"{endpoint}?{urlencode(query)}" if query else endpoint
+        load_requests.append(LoadRequest("GET", path, {"Accept": "application/json"}))
+
+    return load_requests
+
+
+def _http_blocks(text: str) -> List[List[str]]:
+    blocks: List[List[str]] = [[]]
+    for line in text.splitlines():
+        if line.startswith("###"):
+            blocks.append([])
+        else:
+            blocks[-1].append(line)
+    return blocks
+
+
+def _relative(url: str) -> str:
+    # Drop the scheme and host the request was recorded against, so it can be replayed against any app
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
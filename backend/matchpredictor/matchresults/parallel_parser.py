@@ -0,0 +1,295 @@
+import csv
+import multiprocessing
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from matchpredictor.matchresults.result import Fixture, Result, Team, match_outcome
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.result_timeline import NO_DAY, day_date, parse_day
+
+# The number of bytes of the CSV parsed by a worker at a time. Large enough that the cost of sending a block and
+# its results between processes is small next to parsing it
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# The columns a result is read from
+COLUMNS = ("season", "league", "team1", "team2", "score1", "score2")
+
+# The column of the date of a result, which older files may not have
+DATE_COLUMN = "date"
+
+# The fields of a result read from a row: its season, league, home team, away team, home goals, away goals and
+# ordinal day
+RowFields = Tuple[int, str, str, str, int, int, int]
+
+# The result filter and the positions of the columns, installed in the parser's worker processes when they start
+_installed_filter: Optional[Callable[[Result], bool]] = None
+_installed_columns: Optional[Tuple[int, ...]] = None
+_installed_date_column: Optional[int] = None
+
+
+@dataclass
+class ResultColumns(object):
+    """
+    Represents parsed results column by column, which is compact to send between processes: the numbers are
+    arrays of machine integers, and the leagues and team names are indexes into a table of the distinct names.
+
+    Attributes:
+        names (List[str]): The distinct league and team names.
+        seasons (array): The season of each result.
+        leagues (array): The index of the league of each result in names.
+        home_teams (array): The index of the home team of each result in names.
+        away_teams (array): The index of the away team of each result in names.
+        home_goals (array): The goals of the home team of each result.
+        away_goals (array): The goals of the away team of each result.
+        days (array): The ordinal day of each result, or NO_DAY if it has no date.
+    """
+    names: List[str] = field(default_factory=list)
+    seasons: "array[int]" = field(default_factory=lambda: array("i"))
+    leagues: "array[int]" = field(default_factory=lambda: array("i"))
+    home_teams: "array[int]" = field(default_factory=lambda: array("i"))
+    away_teams: "array[int]" = field(default_factory=lambda: array("i"))
+    home_goals: "array[int]" = field(default_factory=lambda: array("i"))
+    away_goals: "array[int]" = field(default_factory=lambda: array("i"))
+    days: "array[int]" = field(default_factory=lambda: array("i"))
+
+
+class ColumnsBuilder(object):
+    """
+    Builds ResultColumns a result at a time, indexing each distinct league and team name once.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the ColumnsBuilder with no results.
+        """
+        self.columns = ResultColumns()
+        self.__indexes: Dict[str, int] = {}
+
+    def append(self, fields: RowFields) -> None:
+        """
+        Adds a result.
+
+        Args:
+            fields (RowFields): The fields of the result, as read by read_row.
+        """
+        season, league, home_team, away_team, home_goals, away_goals, day = fields
+        self.columns.seasons.append(season)
+        self.columns.leagues.append(self.__index(league))
+        self.columns.home_teams.append(self.__index(home_team))
+        self.columns.away_teams.append(self.__index(away_team))
+        self.columns.home_goals.append(home_goals)
+        self.columns.away_goals.append(away_goals)
+        self.columns.days.append(day)
+
+    def __index(self, name: str) -> int:
+        if name not in self.__indexes:
+            self.__indexes[name] = len(self.columns.names)
+            self.columns.names.append(name)
+        return self.__indexes[name]
+
+
+def column_positions(names: Sequence[str]) -> Tuple[Tuple[int, ...], Optional[int]]:
+    """
+    Finds the columns a result is read from in the header of a CSV file.
+
+    Args:
+        names (Sequence[str]): The names of the columns of the file, which must include COLUMNS.
+
+    Returns:
+        Tuple[Tuple[int, ...], Optional[int]]: The position of each of COLUMNS, and that of the date, or None if
+        the file has no dates.
+    """
+    return tuple(names.index(column) for column in COLUMNS), names.index(DATE_COLUMN) if DATE_COLUMN in names else None
+
+
+def read_row(row: Sequence[str], columns: Tuple[int, ...], date_column: Optional[int]) -> Optional[RowFields]:
+    """
+    Reads the fields of a result from a row of a CSV file.
+
+    Args:
+        row (Sequence[str]): The fields of the row.
+        columns (Tuple[int, ...]): The position of each of COLUMNS in the row.
+        date_column (Optional[int]): The position of the date in the row, or None if there is none.
+
+    Returns:
+        Optional[RowFields]: The fields of the result, or None if the row is of a match not played yet, or is
+        truncated or malformed.
+    """
+    season_column, league_column, home_column, away_column, home_goals_column, away_goals_column = columns
+    try:
+        home_goals, away_goals = int(row[home_goals_column]), int(row[away_goals_column])
+        season = int(row[season_column])
+        league, home_team, away_team = row[league_column], row[home_column], row[away_column]
+    except (IndexError, ValueError):
+        return None
+    day = parse_day(row[date_column]) if date_column is not None and date_column < len(row) else NO_DAY
+    return season, league, home_team, away_team, home_goals, away_goals, day
+
+
+def parse_in_parallel(
+        chunks: Iterable[bytes],
+        encoding: str = "utf-8",
+        result_filter: Callable[[Result], bool] = lambda result: True,
+        processes: Optional[int] = None,
+        block_size: int = BLOCK_SIZE,
+) -> List[Result]:
+    """
+    Parses the results of a CSV file in a process pool.
+
+    The chunks are gathered into blocks that end on a line break, and each block is parsed and filtered by a
+    worker into columns, while the next blocks are still being read. The columns of the blocks are then turned
+    into results in the order of the file, sharing a single Team object per team.
+
+    The file is split on line breaks, so quoted fields cannot span lines, as they never do in spi_matches.csv.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the file, in order.
+        encoding (str): The encoding of the file.
+        result_filter (Callable[[Result], bool]): The filter the results must pass. It is inherited by the workers
+            through fork, so it need not be picklable.
+        processes (Optional[int]): The number of worker processes. Defaults to None, in which case there is one
+            per CPU.
+        block_size (int): The number of bytes parsed by a worker at a time.
+
+    Returns:
+        List[Result]: The results that passed the filter, in the order of the file.
+    """
+    blocks = _blocks(chunks, block_size)
+    first_block = next(blocks, None)
+    if first_block is None:
+        return []
+
+    # Find the columns in the header, which only the first block has
+    header, _, first_block = first_block.partition(b"\n")
+    names: List[str] = next(csv.reader([header.decode(encoding, errors="replace")]), [])
+    if any(column not in names for column in COLUMNS):
+        return []
+
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_install,
+            initargs=(result_filter, *column_positions(names)),
+    ) as executor:
+        # Keep a bounded number of blocks in flight, so that reading the file does not outpace parsing it and
+        # hold the whole file in memory
+        in_flight: Deque[Future[ResultColumns]] = deque()
+        parsed: List[ResultColumns] = []
+
+        for block in _prepend(first_block, blocks):
+            if len(in_flight) >= 2 * workers:
+                parsed.append(in_flight.popleft().result())
+            in_flight.append(executor.submit(_parse_block, block, encoding))
+
+        parsed.extend(future.result() for future in in_flight)
+
+    return results_from_columns(parsed)
+
+
+def results_from_columns(parsed: Iterable[ResultColumns]) -> List[Result]:
+    """
+    Turns parsed columns into results.
+
+    Args:
+        parsed (Iterable[ResultColumns]): The columns of each block, in order.
+
+    Returns:
+        List[Result]: The results, sharing a single Team object per team.
+    """
+    teams: Dict[str, Team] = {}
+    results: List[Result] = []
+
+    for columns in parsed:
+        block_teams = [teams.setdefault(name, Team(name)) for name in columns.names]
+        for season, league, home_team, away_team, home_goals, away_goals, day in zip(
+                columns.seasons, columns.leagues, columns.home_teams, columns.away_teams, columns.home_goals,
+                columns.away_goals, columns.days):
+            results.append(Result(
+                fixture=Fixture(block_teams[home_team], block_teams[away_team], columns.names[league]),
+                outcome=match_outcome(home_goals, away_goals),
+                home_goals=home_goals,
+                away_goals=away_goals,
+                season=season,
+                date=day_date(day),
+            ))
+
+    return results
+
+
+def _blocks(chunks: Iterable[bytes], block_size: int) -> Iterator[bytes]:
+    """
+    Gathers chunks into blocks of at least block_size bytes that end on a line break, but for the last one.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the file, in order.
+        block_size (int): The smallest size of a block.
+
+    Returns:
+        Iterator[bytes]: The blocks, in order.
+    """
+    buffer = bytearray()
+
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= block_size:
+            end = buffer.rfind(b"\n") + 1
+            if end > 0:
+                yield bytes(buffer[:end])
+                del buffer[:end]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _prepend(first: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+    yield first
+    yield from rest
+
+
+def _install(result_filter: Callable[[Result], bool], columns: Tuple[int, ...], date_column: Optional[int]) -> None:
+    """
+    Installs the result filter and the positions of the columns in a worker process. They are inherited through
+    fork, not pickled.
+
+    Args:
+        result_filter (Callable[[Result], bool]): The filter the results must pass.
+        columns (Tuple[int, ...]): The position of each of COLUMNS in a row.
+        date_column (Optional[int]): The position of the date in a row, or None if there is none.
+    """
+    global _installed_filter, _installed_columns, _installed_date_column
+    _installed_filter = result_filter
+    _installed_columns = columns
+    _installed_date_column = date_column
+
+
+# Runs in the worker processes, so it is referenced by name
+def _parse_block(block: bytes, encoding: str) -> ResultColumns:
+    if _installed_filter is None or _installed_columns is None:
+        raise RuntimeError("No filter installed in the parser worker")
+
+    builder = ColumnsBuilder()
+
+    for row in csv.reader(block.decode(encoding, errors="replace").splitlines()):
+        fields = read_row(row, _installed_columns, _installed_date_column)
+        if fields is None:
+            # Skip the rows of matches not played yet, and truncated or malformed ones
+            continue
+        season, league, home_team, away_team, home_goals, away_goals, day = fields
+
+        if isinstance(_installed_filter, ResultFilter):
+            # Check a declarative filter against the fields, without building the result
+            if not _installed_filter.matches(season, league, home_team, away_team, day):
+                continue
+        elif not _installed_filter(Result(Fixture(Team(home_team), Team(away_team), league),
+                                          match_outcome(home_goals, away_goals), home_goals, away_goals, season,
+                                          day_date(day))):
+            continue
+
+        builder.append(fields)
+
+    return builder.columns
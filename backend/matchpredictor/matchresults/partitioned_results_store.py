@@ -0,0 +1,263 @@
+import csv
+import fcntl
+import hashlib
+import heapq
+import json
+import os
+import re
+import shutil
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.result_timeline import NO_DAY
+from matchpredictor.matchresults.results_delta import ResultsCursor, ResultsDelta
+from matchpredictor.matchresults.results_store import DEFAULT_MAX_AGE, ResultsStore, results_from_rows
+
+# The columns of a partition; the season and the league are those of the partition
+COLUMNS = ["position", "home_team", "away_team", "home_goals", "away_goals", "day"]
+
+# The version of the layout of the partitions. Sources stored in an older one are loaded again in full, e.g. to
+# fill in the days, which the first one did not keep
+FORMAT = 2
+
+
+class PartitionedResultsStore(ResultsStore):
+    """
+    Stores results in a directory with a CSV file per season and league, so that loading the results of a few
+    leagues and seasons reads only their partitions, rather than the whole history.
+
+    Each source has its own directory, with a manifest of its partitions. Ingestion writes a new version of the
+    partitions, then replaces the manifest, so that readers always see a complete version.
+    """
+
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """
+        Initializes the PartitionedResultsStore, creating its directory if it does not exist.
+
+        Args:
+            path (str): The path of the directory.
+            max_age (float): How long, in seconds, the results of a source are fresh after they are loaded.
+        """
+        self.path = path
+        self.max_age = max_age
+        os.makedirs(path, exist_ok=True)
+
+    def is_fresh(self, source: str) -> bool:
+        """
+        Checks whether the results of a source were loaded recently enough to be served.
+
+        Args:
+            source (str): The location of the CSV file.
+
+        Returns:
+            bool: True if the results were loaded less than max_age seconds ago, False otherwise.
+        """
+        manifest = self.__manifest(source)
+        return manifest is not None and manifest.get("format") == FORMAT \
+            and time.time() - manifest["loaded_at"] < self.max_age
+
+    def ingest(self, source: str, load: Callable[[], Iterable[Result]]) -> bool:
+        """
+        Replaces the partitions of a source with freshly loaded results, unless another process just did.
+
+        The source is locked while the results load, so that processes starting together load them once: the
+        others wait, then find them fresh. If no results load, e.g. because the source is unreachable, the
+        partitions already stored are kept.
+
+        Args:
+            source (str): The location of the CSV file.
+            load (Callable[[], Iterable[Result]]): Loads all results of the source.
+
+        Returns:
+            bool: True if the results were loaded, False if they were already fresh or none loaded.
+        """
+        with self.__locked(source):
+            if self.is_fresh(source):
+                return False
+
+            results = list(load())
+            if not results:
+                return False
+
+            self.__write_version(source, [], results, None)
+            return True
+
+    def update(self, source: str, fetch: Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]) -> bool:
+        """
+        Applies the results added to a source since it was last loaded, unless another process just did.
+
+        The source is locked while the delta loads, as it is while results are ingested. Only the partitions the
+        delta adds to are written again, to a new version, and the others are kept where they are.
+
+        Args:
+            source (str): The location of the CSV file.
+            fetch (Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]): Loads the delta of the source since
+                a cursor, or all of its results if there is none.
+
+        Returns:
+            bool: True if the results were updated, False if they were already fresh or none loaded.
+        """
+        with self.__locked(source):
+            if self.is_fresh(source):
+                return False
+
+            manifest = self.__manifest(source)
+            # The results of an older layout are loaded again from the start, rather than from their cursor
+            cursor = manifest.get("cursor") if manifest is not None and manifest.get("format") == FORMAT else None
+            delta = fetch(ResultsCursor.from_json(cursor) if cursor is not None else None)
+            if delta is None or (delta.reset and not delta.results):
+                return False
+
+            entries = manifest["partitions"] if manifest is not None and not delta.reset else []
+            self.__write_version(source, entries, delta.results, delta.cursor)
+            return True
+
+    def select(self, source: str, result_filter: Callable[[Result], bool] = lambda result: True) -> List[Result]:
+        """
+        Selects the results of a source that pass a filter, reading only the partitions it needs.
+
+        Args:
+            source (str): The location of the CSV file.
+            result_filter (Callable[[Result], bool]): The filter. The seasons and leagues of a ResultFilter select
+                the partitions read, and its day is checked on their rows; any other filter is checked against every
+                result of the source.
+
+        Returns:
+            List[Result]: The results that pass the filter, in the order they were loaded, sharing a single Team
+            object per team.
+        """
+        manifest = self.__manifest(source)
+        if manifest is None:
+            return []
+
+        declared = result_filter if isinstance(result_filter, ResultFilter) else None
+        partitions = [
+            entry for entry in manifest["partitions"]
+            if declared is None or (declared.matches_season(entry["season"])
+                                    and (declared.leagues is None or entry["league"] in declared.leagues))
+        ]
+
+        # Each partition is in file order, so merging them by position restores the order of the file
+        rows: Iterable[Tuple[int, int, str, str, str, int, int, Optional[int]]] = \
+            heapq.merge(*(self.__read_partition(source, entry) for entry in partitions))
+        if declared is not None and declared.before_day is not None:
+            # The days are not partitioned on, so they are checked on the rows of the partitions read, before any
+            # result is built
+            rows = (row for row in rows if declared.matches_day(row[7] or NO_DAY))
+        results = results_from_rows(row[1:] for row in rows)
+        # The teams are not partitioned on, so they are checked on the results of the partitions read
+        if declared is None or declared.teams is not None:
+            return [result for result in results if result_filter(result)]
+        return results
+
+    def __write_version(self, source: str, entries: List[Dict[str, Any]], results: List[Result],
+                        cursor: Optional[ResultsCursor]) -> None:
+        """
+        Writes a version of the partitions of a source, which adds results to the partitions of a previous one.
+
+        Args:
+            source (str): The location of the CSV file.
+            entries (List[Dict[str, Any]]): The partitions of the previous version, empty to replace them.
+            results (List[Result]): The results added.
+            cursor (Optional[ResultsCursor]): The cursor of the source after the results, if any.
+        """
+        # Group the results into partitions, remembering their position in the file, after those already stored
+        partitions: Dict[Tuple[int, str], List[List[Any]]] = {}
+        for position, r in enumerate(results, start=sum(entry["rows"] for entry in entries)):
+            partitions.setdefault((r.season, r.fixture.league), []).append(
+                [position, r.fixture.home_team.name, r.fixture.away_team.name, r.home_goals, r.away_goals,
+                 r.date.toordinal() if r.date else ""])
+
+        previous = self.__manifest(source)
+        version = f"v{time.time_ns()}"
+        written = {(entry["season"], entry["league"]): entry for entry in entries}
+        for (season, league), rows in partitions.items():
+            file = os.path.join(version, str(season), _file_name(league))
+            existing = written.get((season, league))
+            self.__write_partition(
+                os.path.join(self.__directory(source), file), rows,
+                os.path.join(self.__directory(source), existing["file"]) if existing is not None else None)
+            written[(season, league)] = {
+                "season": season, "league": league, "file": file,
+                "rows": len(rows) + (existing["rows"] if existing is not None else 0),
+            }
+
+        manifest = {
+            "source": source, "format": FORMAT, "loaded_at": time.time(), "version": version,
+            "partitions": [written[key] for key in sorted(written)],
+            "cursor": cursor.to_json() if cursor is not None else None,
+        }
+        self.__write_manifest(source, manifest)
+        # Keep the versions that the partitions are in, and those that were current until now, as readers may still
+        # be reading them
+        self.__remove_versions(source, keep=_versions(manifest) | (_versions(previous) if previous else set()))
+
+    def __directory(self, source: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(source.encode()).hexdigest()[:16])
+
+    def __manifest(self, source: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.__directory(source), "manifest.json")) as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+                return manifest
+        except FileNotFoundError:
+            return None
+
+    def __write_manifest(self, source: str, manifest: Dict[str, Any]) -> None:
+        # Write the manifest aside, then move it into place, so that readers never see a partial one
+        path = os.path.join(self.__directory(source), "manifest.json")
+        with open(f"{path}.{os.getpid()}", "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(f"{path}.{os.getpid()}", path)
+
+    @staticmethod
+    def __write_partition(path: str, rows: List[List[Any]], existing: Optional[str]) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Add the rows to a copy of the existing partition, if any, as it may still be read
+        if existing is not None:
+            shutil.copyfile(existing, path)
+        with open(path, "a" if existing is not None else "w", newline="") as partition_file:
+            writer = csv.writer(partition_file)
+            if existing is None:
+                writer.writerow(COLUMNS)
+            writer.writerows(rows)
+
+    def __read_partition(self, source: str,
+                         entry: Dict[str, Any]) -> Iterator[Tuple[int, int, str, str, str, int, int, Optional[int]]]:
+        season, league = entry["season"], entry["league"]
+        with open(os.path.join(self.__directory(source), entry["file"]), newline="") as partition_file:
+            rows = csv.reader(partition_file)
+            next(rows)
+            for position, home_team, away_team, home_goals, away_goals, *day in rows:
+                # Partitions written before the days were kept have none
+                yield int(position), season, league, home_team, away_team, int(home_goals), int(away_goals), \
+                    int(day[0]) if day and day[0] else None
+
+    def __remove_versions(self, source: str, keep: Iterable[str]) -> None:
+        for name in os.listdir(self.__directory(source)):
+            if name.startswith("v") and name not in keep:
+                shutil.rmtree(os.path.join(self.__directory(source), name), ignore_errors=True)
+
+    @contextmanager
+    def __locked(self, source: str) -> Iterator[None]:
+        os.makedirs(self.__directory(source), exist_ok=True)
+        with open(os.path.join(self.__directory(source), "lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _versions(manifest: Dict[str, Any]) -> Set[str]:
+    # The versions a manifest refers to: its own, and those of the partitions it kept from earlier ones
+    return {manifest["version"], *(entry["file"].split(os.sep)[0] for entry in manifest["partitions"])}
+
+
+def _file_name(league: str) -> str:
+    # League names are free text, so keep a readable slug and make it unique with a digest of the name
+    slug = re.sub(r"[^a-z0-9]+", "-", league.lower()).strip("-")
+    return f"{slug or 'league'}-{hashlib.sha256(league.encode()).hexdigest()[:8]}.csv"
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
 from enum import Enum
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -57,6 +59,24 @@ class Outcome(str, Enum):
     DRAW = "draw"
 
 
+def match_outcome(home_goals: int, away_goals: int) -> Outcome:
+    """
+    Determines the outcome of a match based on the number of home and away goals.
+
+    Args:
+        home_goals (int): The number of goals scored by the home team.
+        away_goals (int): The number of goals scored by the away team.
+
+    Returns:
+        Outcome: The outcome of the match.
+    """
+    if home_goals > away_goals:
+        return Outcome.HOME
+    if away_goals > home_goals:
+        return Outcome.AWAY
+    return Outcome.DRAW
+
+
 @dataclass
 class Result(object):
     """
@@ -68,9 +88,12 @@ class Result(object):
         home_goals (int): The number of goals scored by the home team.
         away_goals (int): The number of goals scored by the away team.
         season (int): The season of the fixture.
+        date (Optional[date]): The day the fixture was played, if known. Defaults to None. It is not compared, so
+            that results are equal whether or not they were loaded with their dates.
     """
     fixture: Fixture
     outcome: Outcome
     home_goals: int
     away_goals: int
     season: int
+    date: Optional[date] = field(default=None, compare=False)
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
+
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.result_timeline import NO_DAY
+
+
+@dataclass(frozen=True)
+class ResultFilter(object):
+    """
+    A filter of results by season, league, team and day, declared rather than coded, so that it can be pushed down:
+    the results loader checks it against the raw fields of each row before building a Result, and a ResultIndex
+    looks up the matching results rather than scanning them all.
+
+    A ResultFilter is also a Callable[[Result], bool], so it can be used wherever an arbitrary filter can.
+
+    Attributes:
+        first_season (Optional[int]): The earliest season matched. Defaults to None, in which case there is none.
+        last_season (Optional[int]): The latest season matched. Defaults to None, in which case there is none.
+        leagues (Optional[FrozenSet[str]]): The leagues matched. Defaults to None, in which case all are.
+        teams (Optional[FrozenSet[str]]): The teams matched, at home or away. Defaults to None, in which case all
+            are.
+        before_day (Optional[date]): The day whose results, and those of the days after it, are not matched, e.g. to
+            train the models as of that day. Results without a date are not matched either. Defaults to None, in
+            which case there is none.
+    """
+    first_season: Optional[int] = None
+    last_season: Optional[int] = None
+    leagues: Optional[FrozenSet[str]] = None
+    teams: Optional[FrozenSet[str]] = None
+    before_day: Optional[date] = None
+
+    def __call__(self, result: Result) -> bool:
+        return self.matches(result.season, result.fixture.league, result.fixture.home_team.name,
+                            result.fixture.away_team.name, result.date.toordinal() if result.date else NO_DAY)
+
+    def __and__(self, other: "ResultFilter") -> "ResultFilter":
+        """
+        Combines two filters into one that matches the results both match.
+
+        Args:
+            other (ResultFilter): The other filter.
+
+        Returns:
+            ResultFilter: The combined filter.
+        """
+        def intersect(first: Optional[FrozenSet[str]], second: Optional[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+            return second if first is None else first if second is None else first & second
+
+        first_seasons = [s for s in (self.first_season, other.first_season) if s is not None]
+        last_seasons = [s for s in (self.last_season, other.last_season) if s is not None]
+        before_days = [d for d in (self.before_day, other.before_day) if d is not None]
+        return ResultFilter(
+            first_season=max(first_seasons) if first_seasons else None,
+            last_season=min(last_seasons) if last_seasons else None,
+            leagues=intersect(self.leagues, other.leagues),
+            teams=intersect(self.teams, other.teams),
+            before_day=min(before_days) if before_days else None,
+        )
+
+    def matches_season(self, season: int) -> bool:
+        """
+        Checks a season against the season range of the filter.
+
+        Args:
+            season (int): The season.
+
+        Returns:
+            bool: True if the season is within the range, False otherwise.
+        """
+        return (self.first_season is None or season >= self.first_season) \
+            and (self.last_season is None or season <= self.last_season)
+
+    def matches_day(self, day: int) -> bool:
+        """
+        Checks the day of a result against the day of the filter.
+
+        Args:
+            day (int): The ordinal day of the result, or NO_DAY if it has no date.
+
+        Returns:
+            bool: True if the result was played before the day of the filter, or the filter has none, False
+            otherwise.
+        """
+        return self.before_day is None or NO_DAY < day < self.before_day.toordinal()
+
+    def matches(self, season: int, league: str, home_team: str, away_team: str, day: int = NO_DAY) -> bool:
+        """
+        Checks the fields of a result against the filter, without building the result.
+
+        Args:
+            season (int): The season of the result.
+            league (str): The league of the result.
+            home_team (str): The name of the home team.
+            away_team (str): The name of the away team.
+            day (int): The ordinal day of the result. Defaults to NO_DAY, for a result without a date.
+
+        Returns:
+            bool: True if the result matches the filter, False otherwise.
+        """
+        return self.matches_season(season) \
+            and (self.leagues is None or league in self.leagues) \
+            and (self.teams is None or home_team in self.teams or away_team in self.teams) \
+            and self.matches_day(day)
+
+
+def combine_filters(result_filter: Callable[[Result], bool], other: ResultFilter) -> Callable[[Result], bool]:
+    """
+    Combines a filter with a ResultFilter, keeping the combination declarative if the filter is.
+
+    Args:
+        result_filter (Callable[[Result], bool]): The filter, declarative or not.
+        other (ResultFilter): The declarative filter.
+
+    Returns:
+        Callable[[Result], bool]: A ResultFilter if the filter is one, otherwise a function that checks both.
+    """
+    if isinstance(result_filter, ResultFilter):
+        return result_filter & other
+    return lambda result: result_filter(result) and other(result)
+
+
+class ResultIndex(object):
+    """
+    Indexes loaded results by season and league, so that the results matching a ResultFilter are looked up
+    rather than found by checking every result.
+    """
+
+    def __init__(self, results: Sequence[Result]) -> None:
+        """
+        Initializes the ResultIndex.
+
+        Args:
+            results (Sequence[Result]): The results to index.
+        """
+        self.results = results
+        self.__by_season: Dict[int, List[int]] = {}
+        self.__by_league: Dict[str, List[int]] = {}
+
+        for position, result in enumerate(results):
+            self.__by_season.setdefault(result.season, []).append(position)
+            self.__by_league.setdefault(result.fixture.league, []).append(position)
+
+    def select(self, result_filter: Callable[[Result], bool]) -> List[Result]:
+        """
+        Selects the results that pass a filter.
+
+        Args:
+            result_filter (Callable[[Result], bool]): The filter. Only a ResultFilter is looked up in the indexes;
+                any other filter is checked against every result.
+
+        Returns:
+            List[Result]: The results that pass the filter, in their original order.
+        """
+        if not isinstance(result_filter, ResultFilter):
+            return [result for result in self.results if result_filter(result)]
+
+        candidates: Optional[List[int]] = None
+        if result_filter.first_season is not None or result_filter.last_season is not None:
+            candidates = [
+                position for season, positions in self.__by_season.items()
+                if result_filter.matches_season(season)
+                for position in positions
+            ]
+        if result_filter.leagues is not None:
+            league_positions = [
+                position for league in result_filter.leagues for position in self.__by_league.get(league, [])
+            ]
+            candidates = league_positions if candidates is None else list(set(candidates) & set(league_positions))
+
+        positions = sorted(candidates) if candidates is not None else range(len(self.results))
+        # The teams are not indexed, so check them, along with everything else, on the candidates
+        return [self.results[position] for position in positions if result_filter(self.results[position])]
@@ -0,0 +1,97 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import List, Optional, Sequence
+
+from matchpredictor.matchresults.result import Result
+
+# The ordinal day of a result without a date. Ordinal days start at 1, for the 1st of January of year 1
+NO_DAY = 0
+
+
+def parse_day(text: Optional[str]) -> int:
+    """
+    Parses the date of a row of the CSV file into an ordinal day, which is compact to store and to send between
+    processes.
+
+    Args:
+        text (Optional[str]): The date, in ISO format, e.g. 2022-08-05.
+
+    Returns:
+        int: The ordinal day of the date, or NO_DAY if it is missing or malformed.
+    """
+    try:
+        return date.fromisoformat(text).toordinal() if text else NO_DAY
+    except ValueError:
+        return NO_DAY
+
+
+def day_date(day: int) -> Optional[date]:
+    """
+    Converts an ordinal day back into a date.
+
+    Args:
+        day (int): The ordinal day.
+
+    Returns:
+        Optional[date]: The date, or None if the day is NO_DAY.
+    """
+    return date.fromordinal(day) if day != NO_DAY else None
+
+
+class ResultTimeline(object):
+    """
+    Indexes results by the day they were played, so that the results played before a day, e.g. to retrain the
+    models in the middle of a season, or at every match day of a backtest, are found by binary search rather than
+    by checking every result.
+
+    The results are kept sorted by day, and their days in an array of ordinal days. Results without a date are
+    not indexed. To load only the results played before a day, e.g. from a results store, filter them with a
+    ResultFilter with that day instead.
+    """
+
+    def __init__(self, results: Sequence[Result]) -> None:
+        """
+        Initializes the ResultTimeline.
+
+        Args:
+            results (Sequence[Result]): The results to index.
+        """
+        # Sorting is stable, so the results of a day keep their original order
+        self.results: List[Result] = sorted((result for result in results if result.date is not None),
+                                            key=lambda result: result.date or date.min)
+        self.days = array("i", (result.date.toordinal() for result in self.results if result.date is not None))
+
+    def as_of(self, day: date) -> List[Result]:
+        """
+        Selects the results played before a day, finding them in O(log n).
+
+        Args:
+            day (date): The day, whose results are not selected.
+
+        Returns:
+            List[Result]: The results played before the day, by day.
+        """
+        return self.results[:bisect_left(self.days, day.toordinal())]
+
+    def on(self, day: date) -> List[Result]:
+        """
+        Selects the results played on a day.
+
+        Args:
+            day (date): The day.
+
+        Returns:
+            List[Result]: The results played on the day.
+        """
+        return self.results[bisect_left(self.days, day.toordinal()):bisect_right(self.days, day.toordinal())]
+
+    def match_days(self) -> List[date]:
+        """
+        Lists the days results were played on.
+
+        Returns:
+            List[date]: The days, in order.
+        """
+        # The days are sorted, so each distinct one is kept in order
+        return [date.fromordinal(day) for day in dict.fromkeys(self.days)]
@@ -0,0 +1,250 @@
+import csv
+import json
+from dataclasses import dataclass, replace
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from matchpredictor.matchresults.parallel_parser import COLUMNS, ColumnsBuilder, ResultColumns, column_positions, \
+    read_row, results_from_columns
+from matchpredictor.matchresults.result import Result
+from matchpredictor.profiling.spans import span
+
+# The number of bytes of the CSV read from the response at a time
+CHUNK_SIZE = 64 * 1024
+
+# The columns that identify a match, so that a result is not loaded twice
+KEY_COLUMNS = ("season", "date", "league", "team1", "team2")
+
+
+@dataclass(frozen=True)
+class ResultsCursor(object):
+    """
+    Records how much of a CSV file has been loaded, so that the next load fetches and parses only what follows.
+
+    Rows are added to the file as matches are scheduled, and their scores are filled in once they are played, so
+    the cursor stops at the first match not played yet: everything before it is loaded for good, and everything
+    from it on is fetched again next time. The results after it that were already loaded are remembered by their
+    key, so that they are not loaded twice.
+
+    Attributes:
+        columns (Tuple[str, ...]): The columns of the file, from its header.
+        encoding (str): The encoding of the file.
+        offset (int): The number of bytes of the file loaded for good.
+        boundary (str): The last line loaded for good, as Latin-1, which maps every byte to a character, so that
+            it is checked byte for byte against the file next time.
+        pending (FrozenSet[Tuple[str, ...]]): The keys of the results loaded after the offset.
+        etag (Optional[str]): The entity tag of the file, if the server sent one, so that an unchanged file is not
+            fetched again. Defaults to None.
+    """
+    columns: Tuple[str, ...]
+    encoding: str
+    offset: int
+    boundary: str
+    pending: FrozenSet[Tuple[str, ...]] = frozenset()
+    etag: Optional[str] = None
+
+    def to_json(self) -> str:
+        """
+        Serializes the cursor, so that a store can keep it along with the results.
+
+        Returns:
+            str: The cursor as JSON.
+        """
+        return json.dumps({
+            "columns": list(self.columns), "encoding": self.encoding, "offset": self.offset,
+            "boundary": self.boundary, "pending": sorted(list(key) for key in self.pending), "etag": self.etag,
+        })
+
+    @staticmethod
+    def from_json(text: str) -> "ResultsCursor":
+        """
+        Deserializes a cursor.
+
+        Args:
+            text (str): The cursor as JSON.
+
+        Returns:
+            ResultsCursor: The cursor.
+        """
+        fields = json.loads(text)
+        return ResultsCursor(
+            columns=tuple(fields["columns"]),
+            encoding=fields["encoding"],
+            offset=fields["offset"],
+            boundary=fields["boundary"],
+            pending=frozenset(tuple(key) for key in fields["pending"]),
+            etag=fields["etag"],
+        )
+
+
+@dataclass(frozen=True)
+class ResultsDelta(object):
+    """
+    The results loaded from a CSV file since a cursor.
+
+    Attributes:
+        results (List[Result]): The new results, in the order of the file.
+        reset (bool): True if the file was loaded from the start, e.g. because it was rewritten rather than added
+            to, in which case the results replace those loaded before rather than follow them.
+        cursor (ResultsCursor): The cursor to load the next delta from.
+    """
+    results: List[Result]
+    reset: bool
+    cursor: ResultsCursor
+
+    def apply(self, results: List[Result]) -> List[Result]:
+        """
+        Applies the delta to the results loaded before it.
+
+        Args:
+            results (List[Result]): The results loaded before the delta.
+
+        Returns:
+            List[Result]: The results loaded so far.
+        """
+        return list(self.results) if self.reset else results + self.results
+
+
+def fetch_delta(csv_location: str, cursor: Optional[ResultsCursor] = None) -> Optional[ResultsDelta]:
+    """
+    Loads the results added to a CSV file since a cursor.
+
+    The file is fetched from the last line loaded for good with an HTTP Range request, which is checked to still
+    be that line, so that only the rows after it are downloaded and parsed. If the server does not support ranges,
+    the whole file is downloaded, but still only the rows after the cursor are parsed. If the file was not added
+    to since, the server answers that it was not modified and nothing is downloaded. If the file was rewritten, it
+    is loaded again from the start.
+
+    Args:
+        csv_location (str): The location of the CSV file.
+        cursor (Optional[ResultsCursor]): The cursor returned with the previous delta. Defaults to None, in which
+            case the whole file is loaded.
+
+    Returns:
+        Optional[ResultsDelta]: The delta, or None if the file could not be loaded, e.g. because it is missing.
+    """
+    if cursor is None:
+        return _load_all(csv_location)
+
+    boundary = cursor.boundary.encode("latin-1")
+    start = cursor.offset - len(boundary)
+    # Ask for the file as it is stored, not compressed, so that the offsets are those of the file
+    headers = {"Range": f"bytes={start}-", "Accept-Encoding": "identity"}
+    if cursor.etag is not None:
+        headers["If-None-Match"] = cursor.etag
+
+    with span("fetch_results", location=csv_location, offset=str(cursor.offset)):
+        response = requests.get(csv_location, headers=headers, stream=True)
+
+    with response:
+        if response.status_code == 304:
+            return ResultsDelta([], False, cursor)
+        if response.status_code not in (200, 206):
+            # E.g. the range is past the end of the file, which must have been rewritten
+            return _load_all(csv_location)
+
+        with span("parse_results", offset=str(cursor.offset)):
+            # A server that does not support ranges sends the whole file; skip to the range without parsing it
+            first = 0 if response.status_code == 200 else start
+            lines = (line for line in _lines(response.iter_content(CHUNK_SIZE), first) if line[0] >= start)
+            if next(lines, None) != (start, boundary):
+                return _load_all(csv_location)
+
+            parsed, next_cursor = _read(lines, cursor)
+            return ResultsDelta(results_from_columns([parsed]), False,
+                                replace(next_cursor, etag=response.headers.get("ETag")))
+
+
+def _load_all(csv_location: str) -> Optional[ResultsDelta]:
+    """
+    Loads every result of a CSV file.
+
+    Args:
+        csv_location (str): The location of the CSV file.
+
+    Returns:
+        Optional[ResultsDelta]: A delta that resets the results, or None if the file could not be loaded.
+    """
+    with span("fetch_results", location=csv_location, offset="0"):
+        response = requests.get(csv_location, headers={"Accept-Encoding": "identity"}, stream=True)
+
+    with response, span("parse_results", offset="0"):
+        if response.status_code != 200:
+            return None
+
+        lines = _lines(response.iter_content(CHUNK_SIZE), 0)
+        encoding = response.encoding or "utf-8"
+        _, header = next(lines, (0, b""))
+        columns = tuple(next(csv.reader([header.decode(encoding, errors="replace")]), []))
+        if not header.endswith(b"\n") or any(column not in columns for column in COLUMNS):
+            return None
+
+        parsed, cursor = _read(lines, ResultsCursor(columns, encoding, len(header), header.decode("latin-1")))
+        return ResultsDelta(results_from_columns([parsed]), True, replace(cursor, etag=response.headers.get("ETag")))
+
+
+def _read(lines: Iterable[Tuple[int, bytes]], cursor: ResultsCursor) -> Tuple[ResultColumns, ResultsCursor]:
+    """
+    Reads the results from the lines of a CSV file that follow a cursor.
+
+    Args:
+        lines (Iterable[Tuple[int, bytes]]): The offset and the bytes of each line after the cursor.
+        cursor (ResultsCursor): The cursor.
+
+    Returns:
+        Tuple[ResultColumns, ResultsCursor]: The results not loaded before, and the cursor after the lines.
+    """
+    positions: Dict[str, int] = {column: position for position, column in enumerate(cursor.columns)}
+    result_columns, date_column = column_positions(cursor.columns)
+    *_, home_goals_column, away_goals_column = result_columns
+    builder = ColumnsBuilder()
+    offset, boundary = cursor.offset, cursor.boundary
+    pending: Set[Tuple[str, ...]] = set()
+    loaded_for_good = True
+
+    for start, line in lines:
+        row: List[str] = next(csv.reader([line.decode(cursor.encoding, errors="replace")]), [])
+        # A line is loaded for good once it is complete, and its match played, if it is one, as are all before it
+        not_played = len(row) == len(cursor.columns) and "" in (row[home_goals_column], row[away_goals_column])
+        loaded_for_good = loaded_for_good and line.endswith(b"\n") and not not_played
+        if loaded_for_good:
+            offset, boundary = start + len(line), line.decode("latin-1")
+
+        fields = read_row(row, result_columns, date_column)
+        if fields is None:
+            # Skip the rows of matches not played yet, and truncated or malformed ones
+            continue
+
+        key = tuple(row[positions[column]] if positions.get(column, len(row)) < len(row) else ""
+                    for column in KEY_COLUMNS)
+        if not loaded_for_good:
+            pending.add(key)
+        if key not in cursor.pending:
+            builder.append(fields)
+
+    return builder.columns, replace(cursor, offset=offset, boundary=boundary, pending=frozenset(pending))
+
+
+def _lines(chunks: Iterable[bytes], offset: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    Splits chunks of a file into lines, keeping their line breaks.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the file, in order.
+        offset (int): The offset in the file of the first chunk.
+
+    Returns:
+        Iterator[Tuple[int, bytes]]: The offset in the file and the bytes of each line.
+    """
+    partial = b""
+
+    for chunk in chunks:
+        # The last piece is the start of a line that continues in the next chunk, if any
+        *lines, partial = (partial + chunk).split(b"\n")
+        for line in lines:
+            yield offset, line + b"\n"
+            offset += len(line) + 1
+
+    if partial:
+        yield offset, partial
@@ -1,15 +1,25 @@
+import codecs
 import csv
-from typing import Dict, Callable, List, Optional, cast
+import hashlib
+from typing import Dict, Callable, Iterable, Iterator, List, Optional, cast
 
 import requests
 
-from matchpredictor.matchresults.result import Result, Fixture, Team, Outcome
+from matchpredictor.matchresults.parallel_parser import parse_in_parallel
+from matchpredictor.matchresults.result import Result, Fixture, Team, match_outcome
+from matchpredictor.matchresults.result_filter import ResultFilter, combine_filters
+from matchpredictor.matchresults.result_timeline import NO_DAY, day_date, parse_day
+from matchpredictor.matchresults.results_delta import CHUNK_SIZE, fetch_delta
+from matchpredictor.matchresults.results_store import ResultsStore
+from matchpredictor.profiling.spans import span
 
 
 def training_results(
         csv_location: str,
         year: int,
         result_filter: Callable[[Result], bool] = lambda result: True,
+        processes: int = 1,
+        store: Optional[ResultsStore] = None,
 ) -> List[Result]:
     """
     Retrieves the training results from a CSV file.
@@ -19,18 +29,24 @@ def training_results(
         year (int): The specific year to filter the results.
         result_filter (Callable[[Result], bool], optional):
             Optional result filter function. Defaults to lambda result: True.
+        processes (int): The number of processes that parse the CSV file.
+        store (Optional[ResultsStore]): The store the results are kept in and queried from, if any.
 
     Returns:
         List[Result]: The filtered training results.
     """
-    # Call the load_results function with a result filter that checks for results before the given year.
-    return load_results(csv_location, lambda r: result_filter(r) and r.season < year)
+    # Call the load_results function with a result filter that checks for results before the given year,
+    # which stays declarative, so it can be pushed down, if the given filter is.
+    before_year = combine_filters(result_filter, ResultFilter(last_season=year - 1))
+    return load_results(csv_location, before_year, processes, store)
 
 
 def validation_results(
         csv_location: str,
         year: int,
-        result_filter: Callable[[Result], bool] = lambda result: True
+        result_filter: Callable[[Result], bool] = lambda result: True,
+        processes: int = 1,
+        store: Optional[ResultsStore] = None,
 ) -> List[Result]:
     """
     Retrieves the training results from a CSV file.
@@ -40,17 +56,22 @@ def validation_results(
         year (int): The specific year to filter the results.
         result_filter (Callable[[Result], bool], optional):
             Optional result filter function. Defaults to lambda result: True.
+        processes (int): The number of processes that parse the CSV file.
+        store (Optional[ResultsStore]): The store the results are kept in and queried from, if any.
 
     Returns:
         List[Result]: The filtered training results.
     """
-    # Call the load_results function with a result filter that checks for results in the given year.
-    return load_results(csv_location, lambda r: result_filter(r) and r.season == year)
+    # Call the load_results function with a result filter that checks for results in the given year,
+    # which stays declarative, so it can be pushed down, if the given filter is.
+    return load_results(csv_location, combine_filters(result_filter, ResultFilter(year, year)), processes, store)
 
 
 def load_results(
         csv_location: str,
         result_filter: Callable[[Result], bool] = lambda result: True,
+        processes: int = 1,
+        store: Optional[ResultsStore] = None,
 ) -> List[Result]:
     """
     Loads the results from a CSV file.
@@ -58,29 +79,19 @@ def load_results(
     Args:
         csv_location (str): The location of the CSV file.
         result_filter (Callable[[Result], bool], optional):
-            Optional result filter function. Defaults to lambda result: True.
+            Optional result filter function. Defaults to lambda result: True. A ResultFilter is checked against
+            the fields of each row, so that no Result is built for the rows it rejects.
+        processes (int): The number of processes that parse the CSV file. With more than one, blocks of the file
+            are parsed in parallel, in a process pool, as they arrive. Defaults to 1, parsing in this process.
+        store (Optional[ResultsStore]): The store the results are kept in. If given, all results of the CSV file
+            are stored the first time they are loaded, and once they are no longer fresh, only the results added to
+            the file since are fetched, parsed in this process and added to them. The filtered results are queried
+            from the store. Defaults to None, in which case the results are not stored.
 
     Returns:
         List[Result]: The filtered results.
     """
 
-    def match_outcome(home_goals: int, away_goals: int) -> Outcome:
-        """
-        Determines the outcome of a match based on the number of home and away goals.
-
-        Args:
-            home_goals (int): The number of goals scored by the home team.
-            away_goals (int): The number of goals scored by the away team.
-
-        Returns:
-            Outcome: The outcome of the match.
-        """
-        if home_goals > away_goals:
-            return Outcome.HOME
-        if away_goals > home_goals:
-            return Outcome.AWAY
-        return Outcome.DRAW
-
     def result_from_row(row: Dict[str, str]) -> Optional[Result]:
         """
         Converts a row from the CSV file to a Result object.
@@ -106,21 +117,112 @@ def load_results(
                 outcome=match_outcome(home_goals, away_goals),
                 home_goals=home_goals,
                 away_goals=away_goals,
-                season=int(row['season'])
+                season=int(row['season']),
+                date=day_date(parse_day(row.get('date')))
             )
-        except (KeyError, ValueError):
-            # If any required fields are missing or the goal values cannot be converted to integers, return None.
+        except (KeyError, TypeError, ValueError):
+            # If any required fields are missing, e.g. in a truncated row, or the goal values cannot be converted
+            # to integers, return None.
             return None
 
-    # Send a GET request to the `csv_location` URL and retrieve the text content of the response,
-    # which represents the CSV data.
-    training_data = requests.get(csv_location).text
+    if store is not None:
+        with span("load_results", store=store.path):
+            # Load every result into the store, so that it can serve any filter, or those added since it last did
+            if not store.is_fresh(csv_location):
+                store.update(csv_location, lambda cursor: fetch_delta(csv_location, cursor))
+            with span("query_results"):
+                return store.select(csv_location, result_filter)
+
+    with span("load_results"):
+        # Stream the response rather than reading the whole body, so the raw CSV is never held in memory at once
+        with span("fetch_results", location=csv_location):
+            response = requests.get(csv_location, stream=True)
+
+        with response, span("parse_results", processes=str(processes)):
+            encoding = response.encoding or "utf-8"
+            if processes > 1:
+                return parse_in_parallel(response.iter_content(CHUNK_SIZE), encoding, result_filter, processes)
+
+            # Parse the rows lazily as the chunks arrive, and keep only the results that pass the filter,
+            # so memory grows with the results retained rather than with the size of the file
+            rows: Iterable[Dict[str, str]] = csv.DictReader(csv_lines(response.iter_content(CHUNK_SIZE), encoding))
+            if isinstance(result_filter, ResultFilter):
+                # Check a declarative filter against the fields of the rows, before any result is built
+                declared = result_filter
+                rows = filter(lambda row: row_matches(row, declared), rows)
+                results = filter(lambda r: type(r) is Result, map(result_from_row, rows))
+            else:
+                results = filter(lambda r: type(r) is Result and result_filter(r), map(result_from_row, rows))
+
+            # Convert the filtered results to a list and cast it to `List[Result]` before returning.
+            return cast(List[Result], list(results))
+
+
+def row_matches(row: Dict[str, str], result_filter: ResultFilter) -> bool:
+    """
+    Checks a row of the CSV file against a declarative filter, without building its result.
+
+    Args:
+        row (Dict[str, str]): The row.
+        result_filter (ResultFilter): The filter.
+
+    Returns:
+        bool: True if the row matches the filter, False otherwise, or if it has no valid season.
+    """
+    try:
+        # Only parse the date of the row if the filter checks it
+        day = parse_day(row.get('date')) if result_filter.before_day is not None else NO_DAY
+        return result_filter.matches(int(row['season']), row['league'], row['team1'], row['team2'], day)
+    except (KeyError, TypeError, ValueError):
+        return False
 
-    # Split the `training_data` string into individual lines and create a `DictReader` object to parse the CSV data.
-    rows = csv.DictReader(training_data.splitlines())
-    # Filter the rows based on the given `result_filter` function and
-    # map each row to a `Result` object using the `result_from_row` function.
-    results = filter(lambda r: type(r) is Result and result_filter(r), map(result_from_row, rows))
 
-    # Convert the filtered results to a list and cast it to `List[Result]` before returning.
-    return cast(List[Result], list(results))
+def csv_lines(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Decodes chunks of a CSV file into lines, incrementally, so that the file is never held in memory at once.
+
+    A character or a line split across chunks is carried over to the next one. Lines keep their endings, so that
+    the csv module can parse quoted fields that span lines.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the file, in order.
+        encoding (str): The encoding of the file.
+
+    Returns:
+        Iterator[str]: The lines of the file.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    partial = ""
+
+    for chunk in chunks:
+        lines = (partial + decoder.decode(chunk)).splitlines(keepends=True)
+        # The last line is incomplete unless the chunk ended with a line break
+        partial = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        yield from lines
+
+    partial += decoder.decode(b"", final=True)
+    if partial:
+        yield partial
+
+
+def results_version(results: Iterable[Result]) -> str:
+    """
+    Computes a short digest of results, which identifies the models trained on them.
+
+    The digest does not depend on the order of the results, as results loaded into a store a delta at a time
+    follow the matches played late after those loaded before them, rather than in the order of the file.
+
+    Args:
+        results (Iterable[Result]): The results.
+
+    Returns:
+        str: The first 12 hexadecimal digits of the SHA-256 digest of the results, in sorted order.
+    """
+    digest = hashlib.sha256()
+    for line in sorted(
+            f"{result.season},{result.fixture.league},{result.fixture.home_team.name},"
+            f"{result.fixture.away_team.name},{result.home_goals},{result.away_goals}\n"
+            for result in results
+    ):
+        digest.update(line.encode())
+    return digest.hexdigest()[:12]
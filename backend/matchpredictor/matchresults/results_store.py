@@ -0,0 +1,124 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from matchpredictor.matchresults.result import Fixture, Result, Team, match_outcome
+from matchpredictor.matchresults.results_delta import ResultsCursor, ResultsDelta
+
+# How long, in seconds, the results of a source are served from a store before they are loaded again
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class ResultsStore(ABC):
+    """
+    Abstract base class of the local stores of results, which keep the results loaded from a CSV file, its source,
+    so that later loads query the results they need rather than downloading and parsing the whole file.
+
+    Attributes:
+        path (str): Where the store is on disk.
+    """
+    path: str
+
+    @abstractmethod
+    def is_fresh(self, source: str) -> bool:
+        """
+        Checks whether the results of a source were loaded recently enough to be served.
+
+        Args:
+            source (str): The location of the CSV file.
+
+        Returns:
+            bool: True if the results are fresh, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def ingest(self, source: str, load: Callable[[], Iterable[Result]]) -> bool:
+        """
+        Replaces the results of a source with freshly loaded ones, unless another process just did. If no results
+        load, e.g. because the source is unreachable, the results already stored are kept.
+
+        Args:
+            source (str): The location of the CSV file.
+            load (Callable[[], Iterable[Result]]): Loads all results of the source.
+
+        Returns:
+            bool: True if the results were loaded, False if they were already fresh or none loaded.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, source: str, fetch: Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]) -> bool:
+        """
+        Applies the results added to a source since it was last loaded, unless another process just did. The cursor
+        of the source is kept along with its results, so that only the results added since are fetched.
+
+        Args:
+            source (str): The location of the CSV file.
+            fetch (Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]): Loads the delta of the source since
+                a cursor, or all of its results if there is none, e.g. fetch_delta.
+
+        Returns:
+            bool: True if the results were updated, False if they were already fresh or none loaded.
+        """
+        pass
+
+    @abstractmethod
+    def select(self, source: str, result_filter: Callable[[Result], bool] = lambda result: True) -> List[Result]:
+        """
+        Selects the results of a source that pass a filter.
+
+        Args:
+            source (str): The location of the CSV file.
+            result_filter (Callable[[Result], bool]): The filter. A ResultFilter is pushed down into the store.
+
+        Returns:
+            List[Result]: The results that pass the filter, in the order they were loaded.
+        """
+        pass
+
+
+def open_results_store(path: str) -> ResultsStore:
+    """
+    Opens the results store at a path: a SQLite database if the path ends in .sqlite or .db, a directory of
+    partitions otherwise.
+
+    Args:
+        path (str): The path of the store.
+
+    Returns:
+        ResultsStore: The store.
+    """
+    # Import the implementations here, as they depend on this module
+    from matchpredictor.matchresults.partitioned_results_store import PartitionedResultsStore
+    from matchpredictor.matchresults.sqlite_results_store import SqliteResultsStore
+
+    return SqliteResultsStore(path) if path.endswith((".sqlite", ".db")) else PartitionedResultsStore(path)
+
+
+def results_from_rows(rows: Iterable[Tuple[int, str, str, str, int, int, Optional[int]]]) -> List[Result]:
+    """
+    Builds results from the rows of a store.
+
+    Args:
+        rows (Iterable[Tuple[int, str, str, str, int, int, Optional[int]]]): The season, league, home team, away
+            team, home goals, away goals and ordinal day, if any, of each result.
+
+    Returns:
+        List[Result]: The results, sharing a single Team object per team.
+    """
+    teams: Dict[str, Team] = {}
+    results: List[Result] = []
+
+    for season, league, home_team, away_team, home_goals, away_goals, day in rows:
+        results.append(Result(
+            fixture=Fixture(teams.setdefault(home_team, Team(home_team)), teams.setdefault(away_team, Team(away_team)),
+                            league),
+            outcome=match_outcome(home_goals, away_goals),
+            home_goals=home_goals,
+            away_goals=away_goals,
+            season=season,
+            date=date.fromordinal(day) if day else None,
+        ))
+
+    return results
@@ -0,0 +1,244 @@
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_delta import ResultsCursor, ResultsDelta
+from matchpredictor.matchresults.results_store import DEFAULT_MAX_AGE, ResultsStore, results_from_rows
+
+# How long, in seconds, to wait for another process that is writing to the store
+BUSY_TIMEOUT = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    location TEXT PRIMARY KEY,
+    loaded_at REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    cursor TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    league TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_goals INTEGER NOT NULL,
+    away_goals INTEGER NOT NULL,
+    day INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_season ON results (source, season, league);
+CREATE INDEX IF NOT EXISTS results_league ON results (source, league, season);
+CREATE INDEX IF NOT EXISTS results_home_team ON results (source, home_team, season);
+CREATE INDEX IF NOT EXISTS results_away_team ON results (source, away_team, season);
+CREATE INDEX IF NOT EXISTS results_day ON results (source, day);
+"""
+
+
+class SqliteResultsStore(ResultsStore):
+    """
+    Stores results in a local SQLite database, indexed by season, league, team and day, so that the results a filter
+    selects are looked up rather than loaded and scanned, and so that several processes, e.g. server workers,
+    reports and benchmarks, share a single copy on disk.
+
+    Results are stored per source, the location of the CSV file they were loaded from.
+    """
+
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """
+        Initializes the SqliteResultsStore, creating the database if it does not exist.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            max_age (float): How long, in seconds, the results of a source are fresh after they are loaded.
+        """
+        self.path = path
+        self.max_age = max_age
+
+        with closing(self.__connect()) as connection:
+            # Write-ahead logging lets processes read the store while another one writes to it
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Add the cursors and the days to stores created before they were kept, before the schema indexes them
+            source_columns = [column[1] for column in connection.execute("PRAGMA table_info(sources)")]
+            if source_columns and "cursor" not in source_columns:
+                connection.execute("ALTER TABLE sources ADD COLUMN cursor TEXT")
+            result_columns = [column[1] for column in connection.execute("PRAGMA table_info(results)")]
+            if result_columns and "day" not in result_columns:
+                connection.execute("ALTER TABLE results ADD COLUMN day INTEGER")
+                # The results stored so far have no days, so forget when and how far they were loaded, for the
+                # next update to load them all again rather than only those added since
+                connection.execute("DELETE FROM sources")
+            connection.executescript(SCHEMA)
+
+    def is_fresh(self, source: str) -> bool:
+        """
+        Checks whether the results of a source were loaded recently enough to be served.
+
+        Args:
+            source (str): The location of the CSV file.
+
+        Returns:
+            bool: True if the results were loaded less than max_age seconds ago, False otherwise.
+        """
+        with closing(self.__connect()) as connection:
+            return self.__is_fresh(connection, source)
+
+    def ingest(self, source: str, load: Callable[[], Iterable[Result]]) -> bool:
+        """
+        Replaces the results of a source with freshly loaded ones, unless another process just did.
+
+        The store is locked for writing while the results load, so that processes starting together load them once:
+        the others wait, then find them fresh. If no results load, e.g. because the source is unreachable, the
+        results already stored are kept.
+
+        Args:
+            source (str): The location of the CSV file.
+            load (Callable[[], Iterable[Result]]): Loads all results of the source.
+
+        Returns:
+            bool: True if the results were loaded, False if they were already fresh or none loaded.
+        """
+        with closing(self.__connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self.__is_fresh(connection, source):
+                    connection.rollback()
+                    return False
+
+                connection.execute("DELETE FROM results WHERE source = ?", (source,))
+                rows = connection.executemany(
+                    "INSERT INTO results (source, season, league, home_team, away_team, home_goals, away_goals, day) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((source, r.season, r.fixture.league, r.fixture.home_team.name, r.fixture.away_team.name,
+                      r.home_goals, r.away_goals, r.date.toordinal() if r.date else None) for r in load()),
+                ).rowcount
+                if rows <= 0:
+                    connection.rollback()
+                    return False
+
+                connection.execute("INSERT OR REPLACE INTO sources (location, loaded_at, rows) VALUES (?, ?, ?)",
+                                   (source, time.time(), rows))
+                connection.commit()
+                return True
+            except BaseException:
+                connection.rollback()
+                raise
+
+    def update(self, source: str, fetch: Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]) -> bool:
+        """
+        Applies the results added to a source since it was last loaded, unless another process just did.
+
+        The store is locked for writing while the delta loads, as it is while results are ingested. The results of
+        the delta are added after those stored, or replace them if it resets them.
+
+        Args:
+            source (str): The location of the CSV file.
+            fetch (Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]): Loads the delta of the source since
+                a cursor, or all of its results if there is none.
+
+        Returns:
+            bool: True if the results were updated, False if they were already fresh or none loaded.
+        """
+        with closing(self.__connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self.__is_fresh(connection, source):
+                    connection.rollback()
+                    return False
+
+                stored = connection.execute("SELECT rows, cursor FROM sources WHERE location = ?",
+                                            (source,)).fetchone()
+                cursor = ResultsCursor.from_json(stored[1]) if stored is not None and stored[1] is not None else None
+                delta = fetch(cursor)
+                if delta is None or (delta.reset and not delta.results):
+                    connection.rollback()
+                    return False
+
+                if delta.reset:
+                    connection.execute("DELETE FROM results WHERE source = ?", (source,))
+                rows = connection.executemany(
+                    "INSERT INTO results (source, season, league, home_team, away_team, home_goals, away_goals, day) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((source, r.season, r.fixture.league, r.fixture.home_team.name, r.fixture.away_team.name,
+                      r.home_goals, r.away_goals, r.date.toordinal() if r.date else None) for r in delta.results),
+                ).rowcount if delta.results else 0
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO sources (location, loaded_at, rows, cursor) VALUES (?, ?, ?, ?)",
+                    (source, time.time(), rows if delta.reset else stored[0] + rows, delta.cursor.to_json()))
+                connection.commit()
+                return True
+            except BaseException:
+                connection.rollback()
+                raise
+
+    def select(self, source: str, result_filter: Callable[[Result], bool] = lambda result: True) -> List[Result]:
+        """
+        Selects the results of a source that pass a filter.
+
+        Args:
+            source (str): The location of the CSV file.
+            result_filter (Callable[[Result], bool]): The filter. A ResultFilter becomes a query on the indexes;
+                any other filter is checked against every result of the source.
+
+        Returns:
+            List[Result]: The results that pass the filter, in the order they were loaded, sharing a single Team
+            object per team.
+        """
+        where, parameters = _where(result_filter) if isinstance(result_filter, ResultFilter) else ("", [])
+
+        with closing(self.__connect()) as connection:
+            rows = connection.execute(
+                "SELECT season, league, home_team, away_team, home_goals, away_goals, day FROM results "
+                f"WHERE source = ?{where} ORDER BY id",
+                [source, *parameters],
+            )
+            results = results_from_rows(rows)
+
+        if isinstance(result_filter, ResultFilter):
+            return results
+        return [result for result in results if result_filter(result)]
+
+    def __connect(self) -> sqlite3.Connection:
+        # Transactions are begun explicitly, so that ingestion can take the write lock before it loads
+        return sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+
+    def __is_fresh(self, connection: sqlite3.Connection, source: str) -> bool:
+        row = connection.execute("SELECT loaded_at FROM sources WHERE location = ?", (source,)).fetchone()
+        return row is not None and time.time() - row[0] < self.max_age
+
+
+def _where(result_filter: ResultFilter) -> Tuple[str, List[Any]]:
+    """
+    Translates a declarative filter into the conditions of a query.
+
+    Args:
+        result_filter (ResultFilter): The filter.
+
+    Returns:
+        Tuple[str, List[Any]]: The conditions, each preceded by AND, and their parameters.
+    """
+    conditions: List[str] = []
+    parameters: List[Any] = []
+
+    if result_filter.first_season is not None:
+        conditions.append("season >= ?")
+        parameters.append(result_filter.first_season)
+    if result_filter.last_season is not None:
+        conditions.append("season <= ?")
+        parameters.append(result_filter.last_season)
+    if result_filter.leagues is not None:
+        conditions.append(f"league IN ({', '.join('?' * len(result_filter.leagues))})")
+        parameters.extend(sorted(result_filter.leagues))
+    if result_filter.teams is not None:
+        placeholders = ", ".join("?" * len(result_filter.teams))
+        conditions.append(f"(home_team IN ({placeholders}) OR away_team IN ({placeholders}))")
+        parameters.extend(sorted(result_filter.teams) * 2)
+    if result_filter.before_day is not None:
+        # Results without a date have no day, which is never before one
+        conditions.append("day < ?")
+        parameters.append(result_filter.before_day.toordinal())
+
+    return "".join(f" AND {condition}" for condition in conditions), parameters
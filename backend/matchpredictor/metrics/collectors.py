@@ -0,0 +1,125 @@
+import os
+import resource
+from typing import Callable, Dict, List
+
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.metrics.registry import CacheStats, Collector, MetricFamily, Sample
+from matchpredictor.model.model_provider import ModelProvider
+
+
+def process_collector() -> List[MetricFamily]:
+    """
+    Collects the memory and CPU usage of the process.
+
+    Returns:
+        List[MetricFamily]: The resident and peak memory, and the CPU time, of the process.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux
+    peak_memory = usage.ru_maxrss * 1024
+
+    return [
+        MetricFamily("process_resident_memory_bytes", "gauge", "Resident memory size in bytes",
+                     [Sample("process_resident_memory_bytes", {}, resident_memory() or peak_memory)]),
+        MetricFamily("process_peak_resident_memory_bytes", "gauge", "Peak resident memory size in bytes",
+                     [Sample("process_peak_resident_memory_bytes", {}, peak_memory)]),
+        MetricFamily("process_cpu_seconds_total", "counter", "User and system CPU time spent in seconds",
+                     [Sample("process_cpu_seconds_total", {}, usage.ru_utime + usage.ru_stime)]),
+    ]
+
+
+def resident_memory() -> int:
+    """
+    Reads the current resident memory of the process.
+
+    Returns:
+        int: The resident memory in bytes, or 0 where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def models_collector(model_provider: ModelProvider) -> Collector:
+    """
+    Creates a collector of the loaded models.
+
+    Args:
+        model_provider (ModelProvider): The loaded models.
+
+    Returns:
+        Collector: Collects the version and training duration of each model.
+    """
+
+    def collect() -> List[MetricFamily]:
+        models = model_provider.list()
+        return [
+            MetricFamily("model_info", "gauge", "The loaded models, with the version of the data they were trained on", [
+                Sample("model_info", {"model": m.name, "cost": m.cost.value, "version": m.version}, 1) for m in models
+            ]),
+            MetricFamily("model_training_duration_seconds", "gauge", "Time taken to train each model", [
+                Sample("model_training_duration_seconds", {"model": m.name}, m.training_seconds) for m in models
+            ]),
+        ]
+
+    return collect
+
+
+def caches_collector(caches: Dict[str, Callable[[], CacheStats]]) -> Collector:
+    """
+    Creates a collector of cache hits and misses.
+
+    Args:
+        caches (Dict[str, Callable[[], CacheStats]]): Retrieves the statistics of each cache, keyed by cache name.
+
+    Returns:
+        Collector: Collects the hits and misses of each cache.
+    """
+
+    def collect() -> List[MetricFamily]:
+        stats = {name: cache_stats() for name, cache_stats in caches.items()}
+        return [
+            MetricFamily("cache_hits_total", "counter", "Lookups answered from a cache", [
+                Sample("cache_hits_total", {"cache": name}, s.hits) for name, s in stats.items()
+            ]),
+            MetricFamily("cache_misses_total", "counter", "Lookups that a cache could not answer", [
+                Sample("cache_misses_total", {"cache": name}, s.misses) for name, s in stats.items()
+            ]),
+        ]
+
+    return collect
+
+
+def forecaster_collector(forecaster: Forecaster) -> Collector:
+    """
+    Creates a collector of the forecaster's coalescing and bulkheads.
+
+    Args:
+        forecaster (Forecaster): The forecaster.
+
+    Returns:
+        Collector: Collects the coalesced forecasts and the load of each model's bulkhead.
+    """
+
+    def collect() -> List[MetricFamily]:
+        coalescing = forecaster.coalescing_stats()
+        bulkheads = forecaster.bulkhead_stats()
+        return [
+            MetricFamily("forecast_predictions_total", "counter", "Predictions run for coalescable forecasts",
+                         [Sample("forecast_predictions_total", {}, coalescing.computations)]),
+            MetricFamily("forecast_coalesced_total", "counter", "Forecasts that shared another forecast's prediction",
+                         [Sample("forecast_coalesced_total", {}, coalescing.coalesced)]),
+            MetricFamily("bulkhead_in_flight", "gauge", "Predictions running, per model", [
+                Sample("bulkhead_in_flight", {"model": name}, s.in_flight) for name, s in bulkheads.items()
+            ]),
+            MetricFamily("bulkhead_queued", "gauge", "Predictions waiting for a slot, per model", [
+                Sample("bulkhead_queued", {"model": name}, s.queued) for name, s in bulkheads.items()
+            ]),
+            MetricFamily("bulkhead_rejected_total", "counter", "Predictions rejected because a model was overloaded", [
+                Sample("bulkhead_rejected_total", {"model": name}, s.rejected) for name, s in bulkheads.items()
+            ]),
+        ]
+
+    return collect
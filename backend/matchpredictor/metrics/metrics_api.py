@@ -0,0 +1,64 @@
+import time
+
+from flask import Blueprint, Flask, Response, g, request
+
+from matchpredictor.metrics.registry import MetricsRegistry
+
+# The content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def metrics_api(registry: MetricsRegistry) -> Blueprint:
+    """
+    Creates a Blueprint for the metrics API.
+
+    Args:
+        registry (MetricsRegistry): The registry holding the app's metrics.
+
+    Returns:
+        Blueprint: The Blueprint for the metrics API.
+    """
+    api = Blueprint("metrics_api", __name__)
+
+    @api.route("/metrics", methods=["GET"])
+    def metrics() -> Response:
+        """
+        Renders the app's metrics for Prometheus to scrape.
+
+        Returns:
+            Response: The metrics in the Prometheus text format.
+        """
+        return Response(registry.render(), content_type=CONTENT_TYPE)
+
+    return api
+
+
+def instrument_app(app: Flask, registry: MetricsRegistry) -> None:
+    """
+    Counts the requests the app serves, and records how long they take, per endpoint.
+
+    Args:
+        app (Flask): The app to instrument.
+        registry (MetricsRegistry): The registry to record the requests in.
+    """
+    requests_total = registry.counter(
+        "http_requests", "Requests served, per endpoint, method and status", ("endpoint", "method", "status")
+    )
+    request_duration = registry.histogram(
+        "http_request_duration_seconds", "Time taken to serve requests, per endpoint", ("endpoint", "method")
+    )
+
+    @app.before_request
+    def start_timer() -> None:
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response: Response) -> Response:
+        started = g.pop("request_started", None)
+        # Label by route rather than path, so that the number of series stays bounded
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+        requests_total.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+        if started is not None:
+            request_duration.observe(time.perf_counter() - started, endpoint=endpoint, method=request.method)
+        return response
@@ -0,0 +1,371 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+# Latency buckets, in seconds, from a cheap lookup to a full simulation
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+LabelValues = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Sample(object):
+    """
+    Represents a single value of a metric.
+
+    Attributes:
+        name (str): The name of the sample, which is the metric name with a suffix for histograms.
+        labels (Dict[str, str]): The labels of the sample.
+        value (float): The value of the sample.
+    """
+    name: str
+    labels: Dict[str, str]
+    value: float
+
+
+@dataclass(frozen=True)
+class MetricFamily(object):
+    """
+    Represents a metric and all of its samples, as exposed to Prometheus.
+
+    Attributes:
+        name (str): The name of the metric.
+        type (str): The type of the metric: counter, gauge or histogram.
+        help (str): The description of the metric.
+        samples (List[Sample]): The samples of the metric.
+    """
+    name: str
+    type: str
+    help: str
+    samples: List[Sample] = field(default_factory=list)
+
+
+class _Metric(ABC):
+    """
+    Base class of the metrics held by a registry, which keep one value per combination of label values.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._lock = Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """
+        Orders the label values of a sample as the label names are.
+
+        Args:
+            labels (Dict[str, str]): The label values, keyed by label name.
+
+        Returns:
+            LabelValues: The label values.
+        """
+        return tuple(labels[name] for name in self.label_names)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+    @abstractmethod
+    def collect(self) -> MetricFamily:
+        """
+        Collects the samples of the metric.
+
+        Returns:
+            MetricFamily: The metric and its samples.
+        """
+        pass
+
+
+class Counter(_Metric):
+    """
+    A value that only goes up, such as a number of requests. It is exposed as <name>_total, the name of both
+    its family and its samples, as the Prometheus text format requires.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, help, label_names)
+        self.__values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            amount (float): How much to increment the counter by. Defaults to 1.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self.__values[key] = self.__values.get(key, 0) + amount
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = list(self.__values.items())
+        return MetricFamily(f"{self.name}_total", self.type, self.help, [
+            Sample(f"{self.name}_total", self._labels(key), value) for key, value in values
+        ])
+
+
+class Gauge(_Metric):
+    """
+    A value that goes up and down, such as a number of rows loaded.
+    """
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, help, label_names)
+        self.__values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """
+        Sets the gauge.
+
+        Args:
+            value (float): The value of the gauge.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self.__values[key] = value
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = list(self.__values.items())
+        return MetricFamily(self.name, self.type, self.help, [
+            Sample(self.name, self._labels(key), value) for key, value in values
+        ])
+
+
+class Histogram(_Metric):
+    """
+    A distribution of observed values, such as latencies, counted in buckets.
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # The bucket counts of each combination of label values, with the count of the values above the last bucket
+        self.__counts: Dict[LabelValues, List[int]] = {}
+        self.__sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Observes a value.
+
+        Args:
+            value (float): The observed value.
+            **labels (str): The label values.
+        """
+        key = self._key(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self.__counts.get(key)
+            if counts is None:
+                counts = self.__counts[key] = [0] * (len(self.buckets) + 1)
+            counts[bucket] += 1
+            self.__sums[key] = self.__sums.get(key, 0) + value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observes how long, in seconds, the block takes to run, whether or not it raises.
+
+        Args:
+            **labels (str): The label values.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            counts = [(key, list(bucket_counts)) for key, bucket_counts in self.__counts.items()]
+            sums = dict(self.__sums)
+
+        family = MetricFamily(self.name, self.type, self.help)
+        for key, bucket_counts in counts:
+            labels = self._labels(key)
+            # Prometheus buckets are cumulative
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, math.inf), bucket_counts):
+                cumulative += count
+                family.samples.append(
+                    Sample(f"{self.name}_bucket", {**labels, "le": format_value(upper_bound)}, cumulative)
+                )
+            family.samples.append(Sample(f"{self.name}_sum", labels, sums[key]))
+            family.samples.append(Sample(f"{self.name}_count", labels, cumulative))
+        return family
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry(object):
+    """
+    Holds the metrics of the app and renders them in the Prometheus text format.
+
+    Metrics that are updated as requests are served live in the registry. Values that are already tracked
+    elsewhere, such as cache statistics, are read by collectors when the metrics are scraped, so that serving
+    requests costs nothing extra.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty MetricsRegistry.
+        """
+        self.__metrics: List[_Metric] = []
+        self.__collectors: List[Collector] = []
+        self.__lock = Lock()
+
+    def counter(self, name: str, help: str, label_names: Sequence[str] = ()) -> Counter:
+        """
+        Creates and registers a counter.
+
+        Args:
+            name (str): The name of the counter, without the _total suffix.
+            help (str): The description of the counter.
+            label_names (Sequence[str]): The names of the counter's labels.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self.__register(Counter(name, help, label_names))
+
+    def gauge(self, name: str, help: str, label_names: Sequence[str] = ()) -> Gauge:
+        """
+        Creates and registers a gauge.
+
+        Args:
+            name (str): The name of the gauge.
+            help (str): The description of the gauge.
+            label_names (Sequence[str]): The names of the gauge's labels.
+
+        Returns:
+            Gauge: The gauge.
+        """
+        return self.__register(Gauge(name, help, label_names))
+
+    def histogram(self, name: str, help: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Creates and registers a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            help (str): The description of the histogram.
+            label_names (Sequence[str]): The names of the histogram's labels.
+            buckets (Sequence[float]): The upper bounds of the buckets. Defaults to DEFAULT_BUCKETS.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        return self.__register(Histogram(name, help, label_names, buckets))
+
+    def collector(self, collector: Collector) -> None:
+        """
+        Registers a collector, which is called to produce metric families whenever the metrics are scraped.
+
+        Args:
+            collector (Collector): The collector.
+        """
+        with self.__lock:
+            self.__collectors.append(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        """
+        Collects all metrics.
+
+        Returns:
+            List[MetricFamily]: The metric families of the registered metrics and collectors.
+        """
+        with self.__lock:
+            metrics = list(self.__metrics)
+            collectors = list(self.__collectors)
+
+        families = [metric.collect() for metric in metrics]
+        for collector in collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics.
+        """
+        lines: List[str] = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {escape(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for sample in family.samples:
+                labels = ",".join(f'{name}="{escape(value)}"' for name, value in sample.labels.items())
+                lines.append(f"{sample.name}{{{labels}}} {format_value(sample.value)}" if labels
+                             else f"{sample.name} {format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+    def __register(self, metric: M) -> M:
+        with self.__lock:
+            self.__metrics.append(metric)
+        return metric
+
+
+def escape(value: str) -> str:
+    """
+    Escapes a help text or label value for the Prometheus text format.
+
+    Args:
+        value (str): The text.
+
+    Returns:
+        str: The escaped text.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    """
+    Formats a sample value for the Prometheus text format.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The formatted value.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass(frozen=True)
+class CacheStats(object):
+    """
+    Represents how often a cache was hit.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to be computed.
+    """
+    hits: int
+    misses: int
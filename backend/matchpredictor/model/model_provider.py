@@ -1,7 +1,20 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Dict, Optional, List
 
-from matchpredictor.predictors.predictor import Predictor, InProgressPredictor
+from matchpredictor.predictors.predictor import Predictor, InProgressPredictor, BudgetedPredictor
+
+
+class ModelCost(str, Enum):
+    """
+    Enumeration class for representing how expensive a model's predictions are to compute.
+
+    Values:
+        CHEAP: Predictions are lookups or simple arithmetic.
+        EXPENSIVE: Predictions run simulations or heavy numerical work.
+    """
+    CHEAP = "cheap"
+    EXPENSIVE = "expensive"
 
 
 @dataclass(frozen=True)
@@ -12,10 +25,16 @@ class Model(object):
     Attributes:
         name (str): The name of the model.
         predictor (Predictor | InProgressPredictor): The predictor associated with the model.
+        cost (ModelCost): How expensive the predictor's predictions are to compute.
+        version (str): Identifies the data the predictor was trained on.
+        training_seconds (float): How long the predictor took to train.
     """
 
     name: str
     predictor: Predictor | InProgressPredictor
+    cost: ModelCost = ModelCost.CHEAP
+    version: str = ""
+    training_seconds: float = 0.0
 
     def predicts_in_progress(self) -> bool:
         """
@@ -46,6 +65,18 @@ class ModelProvider(object):
         for model in models:
             self.__models[model.name] = model
 
+    def get_model(self, model_name: str) -> Optional[Model]:
+        """
+        Retrieves the model with the specified name.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            Optional[Model]: The model, or None if the model does not exist.
+        """
+        return self.__models.get(model_name)
+
     def get_predictor(self, model_name: str) -> Optional[Predictor]:
         """
         Retrieves the predictor for the specified model name.
@@ -85,6 +116,35 @@ class ModelProvider(object):
         # Return the in-progress predictor associated with the model.
         return model.predictor
 
+    def get_budgeted_predictor(self, model_name: str) -> Optional[BudgetedPredictor]:
+        """
+        Retrieves the budgeted predictor for the specified model name.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            Optional[BudgetedPredictor]: The budgeted predictor associated with the model,
+            or None if the model does not exist or its predictor is not a BudgetedPredictor.
+        """
+        model = self.__models.get(model_name)
+
+        # If the model does not exist or its predictor is not a BudgetedPredictor, return None.
+        if model is None or not isinstance(model.predictor, BudgetedPredictor):
+            return None
+
+        # Return the budgeted predictor associated with the model.
+        return model.predictor
+
+    def replace_model(self, model: Model) -> None:
+        """
+        Adds a model, or replaces the model of the same name, e.g. with one retrained on newer results.
+
+        Args:
+            model (Model): The model.
+        """
+        self.__models[model.name] = model
+
     def list(self) -> List[Model]:
         """
         Returns a list of all models stored in the provider.
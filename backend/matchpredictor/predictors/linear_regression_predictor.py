@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional, cast
+from typing import List, Tuple
 
 import numpy as np
 from numpy import float64
@@ -6,15 +6,16 @@ from numpy.typing import NDArray
 from sklearn.linear_model import LogisticRegression  # type: ignore
 from sklearn.preprocessing import OneHotEncoder  # type: ignore
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
-from matchpredictor.predictors.predictor import Predictor, Prediction
+from matchpredictor.matchresults.result import Result
+from matchpredictor.predictors.predictor import Predictor
+from matchpredictor.predictors.team_encoding_predictor import TeamEncodingPredictor
 
 
-class LinearRegressionPredictor(Predictor):
+class LinearRegressionPredictor(TeamEncodingPredictor):
     """
     A predictor that uses linear regression to make predictions based on team encodings.
 
-    Inherits from Predictor.
+    Inherits from TeamEncodingPredictor.
     """
 
     def __init__(self, model: LogisticRegression, team_encoding: OneHotEncoder) -> None:
@@ -25,63 +26,7 @@ class LinearRegressionPredictor(Predictor):
             model (LogisticRegression): The logistic regression model used for prediction.
             team_encoding (OneHotEncoder): The team encoding used to transform team names.
         """
-        self.model = model
-        self.team_encoding = team_encoding
-
-    def predict(self, fixture: Fixture) -> Prediction:
-        """
-        Makes a prediction for the given fixture using linear regression and team encodings.
-
-        Args:
-            fixture (Fixture): The fixture for which the prediction is made.
-
-        Returns:
-            Prediction: The prediction for the fixture.
-        """
-        # Encode the home team name
-        encoded_home_name = self.__encode_team(fixture.home_team)
-        # Encode the away team name
-        encoded_away_name = self.__encode_team(fixture.away_team)
-
-        # If home team name encoding is None, predict AWAY
-        if encoded_home_name is None:
-            return Prediction(outcome=Outcome.AWAY)
-        # If away team name encoding is None, predict HOME
-        if encoded_away_name is None:
-            return Prediction(outcome=Outcome.HOME)
-
-        # Concatenate the encoded team names
-        x: NDArray[float64] = np.concatenate([encoded_home_name, encoded_away_name], 1)
-        # Make a prediction using the model
-        pred = self.model.predict(x)
-
-        # If prediction is positive, predict HOME
-        if pred > 0:
-            return Prediction(outcome=Outcome.HOME)
-        # If prediction is negative, predict AWAY
-        elif pred < 0:
-            return Prediction(outcome=Outcome.AWAY)
-        # If prediction is zero, predict DRAW
-        else:
-            return Prediction(outcome=Outcome.DRAW)
-
-    def __encode_team(self, team: Team) -> Optional[NDArray[float64]]:
-        """
-        Encodes the team name using the team encoding.
-
-        Args:
-            team (Team): The team to encode.
-
-        Returns:
-            Optional[ndarray]: The encoded team name, or None if encoding fails.
-        """
-        try:
-            # Transform the team name using the encoding
-            result: NDArray[float64] = self.team_encoding.transform(np.array(team.name).reshape(-1, 1))
-            return result
-        except ValueError:
-            # Return None if encoding fails
-            return None
+        super().__init__(model, team_encoding)
 
 
 def build_model(results: List[Result]) -> Tuple[LogisticRegression, OneHotEncoder]:
@@ -1,15 +1,18 @@
-from typing import Iterable, Dict
+from typing import Iterable, Dict, Optional
 
 from matchpredictor.matchresults.result import Outcome, Fixture, Result, Team
-from matchpredictor.predictors.predictor import Predictor, Prediction
+from matchpredictor.predictors.predictor import IncrementalTrainer, Predictor, Prediction
 
 
 class PointsTable:
-    def __init__(self) -> None:
+    def __init__(self, points_dict: Optional[Dict[str, int]] = None) -> None:
         """
-        Initializes an empty points table.
+        Initializes a points table, empty unless given points.
+
+        Args:
+            points_dict (Optional[Dict[str, int]]): The points of each team, keyed by team name, which are copied.
         """
-        self.points_dict: Dict[str, int] = {}
+        self.points_dict: Dict[str, int] = dict(points_dict or {})
 
     def points_for(self, team: Team) -> int:
         """
@@ -41,6 +44,25 @@ class PointsTable:
         """
         self.__add_points(team, 1)
 
+    def record_result(self, result: Result, weight: int = 1) -> None:
+        """
+        Records the points each team of a result earned.
+
+        Args:
+            result (Result): The result.
+            weight (int): How many times to record the result. -1 takes the points of a recorded result back.
+        """
+        if result.outcome == Outcome.HOME:
+            # Record a win for the home team
+            self.__add_points(result.fixture.home_team, 3 * weight)
+        elif result.outcome == Outcome.AWAY:
+            # Record a win for the away team
+            self.__add_points(result.fixture.away_team, 3 * weight)
+        else:
+            # Record a draw for both teams
+            self.__add_points(result.fixture.home_team, weight)
+            self.__add_points(result.fixture.away_team, weight)
+
     def __add_points(self, team: Team, points: int) -> None:
         """
         Adds points to the total points of a specific team.
@@ -105,17 +127,7 @@ def calculate_table(results: Iterable[Result]) -> PointsTable:
     table = PointsTable()
 
     for result in results:
-        if result.outcome == Outcome.HOME:
-            # Record a win for the home team
-            table.record_win(result.fixture.home_team)
-        elif result.outcome == Outcome.AWAY:
-            # Record a win for the away team
-            table.record_win(result.fixture.away_team)
-        else:
-            # Record a draw for the home team
-            table.record_draw(result.fixture.home_team)
-            # Record a draw for the away team
-            table.record_draw(result.fixture.away_team)
+        table.record_result(result)
 
     # Return the final PointsTable object
     return table
@@ -134,3 +146,43 @@ def train_results_predictor(results: Iterable[Result]) -> Predictor:
     # Create a predictor using the calculated points table
     return PastResultsPredictor(calculate_table(results))
 
+
+class IncrementalResultsTrainer(IncrementalTrainer):
+    """
+    Trains a results predictor incrementally, by keeping a points table up to date.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the IncrementalResultsTrainer with an empty points table.
+        """
+        self.table = PointsTable()
+
+    def add(self, results: Iterable[Result]) -> None:
+        """
+        Records the points of more results.
+
+        Args:
+            results (Iterable[Result]): The results to train on.
+        """
+        for result in results:
+            self.table.record_result(result)
+
+    def remove(self, results: Iterable[Result]) -> None:
+        """
+        Takes back the points of recorded results.
+
+        Args:
+            results (Iterable[Result]): The results to forget.
+        """
+        for result in results:
+            self.table.record_result(result, weight=-1)
+
+    def predictor(self) -> Predictor:
+        """
+        Creates a results predictor from a copy of the points table.
+
+        Returns:
+            Predictor: The trained Predictor object.
+        """
+        return PastResultsPredictor(PointsTable(self.table.points_dict))
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Scenario
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Scenario
 
 
 @dataclass
@@ -18,6 +18,19 @@ class Prediction:
     confidence: Optional[float] = None
 
 
+@dataclass
+class BudgetedPrediction(Prediction):
+    """
+    Represents a prediction made within a latency budget, along with how precise it turned out to be.
+
+    Attributes:
+        simulations (int): The number of simulations that fit within the budget.
+        confidence_interval (Optional[Tuple[float, float]]): The 95% confidence interval of the confidence level.
+    """
+    simulations: int = 0
+    confidence_interval: Optional[Tuple[float, float]] = None
+
+
 class Predictor(ABC):
     """
     Abstract base class that provides a method to predict the outcome of a fixture.
@@ -25,6 +38,8 @@ class Predictor(ABC):
     Methods:
         predict(fixture: Fixture) -> Prediction:
             Predicts the outcome of the given fixture and returns a Prediction object.
+        predict_all(fixtures: Sequence[Fixture]) -> List[Prediction]:
+            Predicts the outcomes of several fixtures at once and returns one Prediction per fixture.
     """
 
     @abstractmethod
@@ -40,6 +55,20 @@ class Predictor(ABC):
         """
         pass
 
+    def predict_all(self, fixtures: Sequence[Fixture]) -> List[Prediction]:
+        """
+        Predicts the outcomes of several fixtures at once.
+
+        Predictors that can vectorize their work override this method; by default each fixture is predicted in turn.
+
+        Args:
+            fixtures (Sequence[Fixture]): The fixtures to predict.
+
+        Returns:
+            List[Prediction]: The predictions, in the same order as the fixtures.
+        """
+        return [self.predict(fixture) for fixture in fixtures]
+
 
 class InProgressPredictor(Predictor):
     """
@@ -64,3 +93,74 @@ class InProgressPredictor(Predictor):
             Prediction: The predicted outcome and confidence level.
         """
         pass
+
+
+class BudgetedPredictor(InProgressPredictor):
+    """
+    Subclass of InProgressPredictor whose precision can be traded for latency, by doing as much work as fits
+    before a deadline.
+
+    Methods:
+        predict_in_progress_within(fixture: Fixture, scenario: Scenario, deadline: float) -> BudgetedPrediction:
+            Predicts the outcome of the in-progress fixture before the deadline and returns a BudgetedPrediction.
+    """
+
+    @abstractmethod
+    def predict_in_progress_within(self, fixture: Fixture, scenario: Scenario, deadline: float) -> BudgetedPrediction:
+        """
+        Predicts the outcome of an in-progress fixture, returning by the given deadline.
+
+        Args:
+            fixture (Fixture): The in-progress fixture to predict.
+            scenario (Scenario): The scenario to consider for the prediction.
+            deadline (float): The time.monotonic() value by which to return.
+
+        Returns:
+            BudgetedPrediction: The predicted outcome, confidence level and precision.
+        """
+        pass
+
+
+class IncrementalTrainer(ABC):
+    """
+    Abstract base class for training a predictor incrementally, by adding and removing results from what it was
+    trained on, rather than training it from scratch on every change of the training data.
+
+    Methods:
+        add(results: Iterable[Result]) -> None:
+            Trains on more results.
+        remove(results: Iterable[Result]) -> None:
+            Forgets results that were trained on.
+        predictor() -> Predictor:
+            Creates a predictor from what has been trained so far.
+    """
+
+    @abstractmethod
+    def add(self, results: Iterable[Result]) -> None:
+        """
+        Trains on more results.
+
+        Args:
+            results (Iterable[Result]): The results to train on.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, results: Iterable[Result]) -> None:
+        """
+        Forgets results that were trained on.
+
+        Args:
+            results (Iterable[Result]): The results to forget, which must have been added.
+        """
+        pass
+
+    @abstractmethod
+    def predictor(self) -> Predictor:
+        """
+        Creates a predictor from what has been trained so far. Later changes to the training do not affect it.
+
+        Returns:
+            Predictor: The trained predictor.
+        """
+        pass
@@ -1,14 +1,28 @@
-from typing import Iterable
+import math
+import time
+from collections import Counter
+from typing import Callable, Iterable, Tuple
 
 from matchpredictor.matchresults.result import Fixture, Outcome, Result, Scenario
-from matchpredictor.predictors.predictor import Predictor, Prediction, InProgressPredictor
+from matchpredictor.predictors.predictor import Predictor, Prediction, BudgetedPredictor, BudgetedPrediction, \
+    IncrementalTrainer
 from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
 from matchpredictor.predictors.simulators.simulator import Simulator, offense_simulator, offense_and_defense_simulator
 
 
-class SimulationPredictor(InProgressPredictor):
+# The number of simulations run between two checks of the deadline
+SIMULATION_BATCH = 100
+
+# The z-score of a 95% confidence interval
+CONFIDENCE_Z = 1.96
+
+
+class SimulationPredictor(BudgetedPredictor):
     """
     A predictor that uses simulation to predict the outcome of a fixture, both for in-progress and completed fixtures.
+
+    Within a latency budget, it runs batches of simulations until the deadline or the configured number of
+    simulations is reached, so a tight budget degrades precision rather than latency.
     """
 
     def __init__(self, simulator: Simulator, simulations: int) -> None:
@@ -54,12 +68,83 @@ class SimulationPredictor(InProgressPredictor):
         draw_count = sum(map(lambda r: r is Outcome.DRAW, results))
 
         # Determine the predicted outcome based on the majority count and calculate the confidence
-        if home_count > away_count and home_count > draw_count:
-            return Prediction(outcome=Outcome.HOME, confidence=home_count / self.simulations)
-        if away_count > draw_count:
-            return Prediction(outcome=Outcome.AWAY, confidence=away_count / self.simulations)
-        else:
-            return Prediction(outcome=Outcome.DRAW, confidence=draw_count / self.simulations)
+        outcome, count = majority_outcome(home_count, away_count, draw_count)
+        return Prediction(outcome=outcome, confidence=count / self.simulations)
+
+    def predict_in_progress_within(self, fixture: Fixture, scenario: Scenario, deadline: float) -> BudgetedPrediction:
+        """
+        Predicts the outcome of an in-progress fixture, running as many simulations as fit before the deadline.
+
+        At least one batch of simulations is run, however tight the deadline, and no more than the configured number.
+
+        Args:
+            fixture (Fixture): The in-progress fixture to predict.
+            scenario (Scenario): The scenario representing the current state of the fixture.
+            deadline (float): The time.monotonic() value by which to return.
+
+        Returns:
+            BudgetedPrediction: The predicted outcome, with the number of simulations run and the confidence interval.
+        """
+        counts: Counter[Outcome] = Counter()
+        simulations = 0
+
+        # Run batches of simulations until the deadline has passed or enough simulations have run
+        while simulations < self.simulations:
+            batch = min(SIMULATION_BATCH, self.simulations - simulations)
+            counts.update(self.simulator(fixture, scenario) for _ in range(batch))
+            simulations += batch
+            if time.monotonic() >= deadline:
+                break
+
+        outcome, count = majority_outcome(counts[Outcome.HOME], counts[Outcome.AWAY], counts[Outcome.DRAW])
+        return BudgetedPrediction(
+            outcome=outcome,
+            confidence=count / simulations,
+            simulations=simulations,
+            confidence_interval=wilson_interval(count, simulations),
+        )
+
+
+def majority_outcome(home_count: int, away_count: int, draw_count: int) -> Tuple[Outcome, int]:
+    """
+    Picks the outcome that occurred most often in the simulations, favouring home, then away, over draws on ties.
+
+    Args:
+        home_count (int): The number of simulated home wins.
+        away_count (int): The number of simulated away wins.
+        draw_count (int): The number of simulated draws.
+
+    Returns:
+        Tuple[Outcome, int]: The majority outcome and the number of times it occurred.
+    """
+    if home_count > away_count and home_count > draw_count:
+        return Outcome.HOME, home_count
+    if away_count > draw_count:
+        return Outcome.AWAY, away_count
+    else:
+        return Outcome.DRAW, draw_count
+
+
+def wilson_interval(successes: int, trials: int) -> Tuple[float, float]:
+    """
+    Computes the 95% Wilson score interval of a proportion, which stays within [0, 1] even for few trials.
+
+    Args:
+        successes (int): The number of trials with the outcome.
+        trials (int): The number of trials.
+
+    Returns:
+        Tuple[float, float]: The lower and upper bounds of the interval.
+    """
+    proportion = successes / trials
+    z_squared = CONFIDENCE_Z * CONFIDENCE_Z
+
+    centre = (proportion + z_squared / (2 * trials)) / (1 + z_squared / trials)
+    margin = CONFIDENCE_Z * math.sqrt(
+        proportion * (1 - proportion) / trials + z_squared / (4 * trials * trials)
+    ) / (1 + z_squared / trials)
+
+    return max(0.0, centre - margin), min(1.0, centre + margin)
 
 
 def train_offense_predictor(results: Iterable[Result], simulations: int) -> Predictor:
@@ -90,3 +175,51 @@ def train_offense_and_defense_predictor(results: Iterable[Result], simulations:
     """
     # Create a SimulationPredictor using the offense_and_defense_simulator and provided number of simulations
     return SimulationPredictor(offense_and_defense_simulator(ScoringRates(results)), simulations)
+
+
+class IncrementalSimulationTrainer(IncrementalTrainer):
+    """
+    Trains a simulation predictor incrementally, by keeping the scoring rates of the teams up to date.
+    """
+
+    def __init__(self, simulator: Callable[[ScoringRates], Simulator], simulations: int) -> None:
+        """
+        Initializes the IncrementalSimulationTrainer with empty scoring rates.
+
+        Args:
+            simulator (Callable[[ScoringRates], Simulator]): Creates the simulator from the scoring rates, e.g.
+                offense_simulator.
+            simulations (int): The number of simulations the predictor runs.
+        """
+        self.simulator = simulator
+        self.simulations = simulations
+        self.scoring_rates = ScoringRates([])
+
+    def add(self, results: Iterable[Result]) -> None:
+        """
+        Adds more results to the scoring rates.
+
+        Args:
+            results (Iterable[Result]): The results to train on.
+        """
+        for result in results:
+            self.scoring_rates.add_result(result)
+
+    def remove(self, results: Iterable[Result]) -> None:
+        """
+        Removes added results from the scoring rates.
+
+        Args:
+            results (Iterable[Result]): The results to forget.
+        """
+        for result in results:
+            self.scoring_rates.remove_result(result)
+
+    def predictor(self) -> Predictor:
+        """
+        Creates a simulation predictor from a copy of the scoring rates.
+
+        Returns:
+            Predictor: The trained predictor.
+        """
+        return SimulationPredictor(self.simulator(self.scoring_rates.copy()), self.simulations)
@@ -46,7 +46,7 @@ class ScoringRates:
         self.total_matches = 0
 
         for result in results:
-            self.__add_result(result)
+            self.add_result(result)
 
     # Calculate the defensive factor for a given team.
     # The defensive factor is a relative measure of the team's defensive performance compared to the average
@@ -75,33 +75,49 @@ class ScoringRates:
         return team_scoring.goals_scored_per_minute()
 
     # Update the scoring statistics based on a single match result
-    def __add_result(self, result: Result) -> None:
-        # Retrieve the scoring information for the home team from the scoring dictionary,
-        # or create a new TeamScoring instance with initial values if the team is not present.
-        home_team_scoring = self.scoring_dict.get(result.fixture.home_team, TeamScoring(0, 0, 0))
+    def add_result(self, result: Result) -> None:
+        self.__update(result, 1)
+
+    # Take a match result that was added back out of the scoring statistics
+    def remove_result(self, result: Result) -> None:
+        self.__update(result, -1)
+
+    # Copy the scoring statistics, so that the copy is not affected by later results
+    def copy(self) -> "ScoringRates":
+        rates = ScoringRates([])
+        rates.scoring_dict = dict(self.scoring_dict)
+        rates.total_goals = self.total_goals
+        rates.total_matches = self.total_matches
+        return rates
+
+    # Add a match result to the scoring statistics, or remove it with a sign of -1
+    def __update(self, result: Result, sign: int) -> None:
         # Update the scoring information for the home team by adding the goals scored and conceded,
         # and incrementing the number of matches played.
-        self.scoring_dict[result.fixture.home_team] = TeamScoring(
-            goal_scored=home_team_scoring.goal_scored + result.home_goals,
-            goals_conceded=home_team_scoring.goals_conceded + result.away_goals,
-            matches=home_team_scoring.matches + 1,
-        )
+        self.__update_team(result.fixture.home_team, result.home_goals * sign, result.away_goals * sign, sign)
+        # Update the scoring information for the away team the same way.
+        self.__update_team(result.fixture.away_team, result.away_goals * sign, result.home_goals * sign, sign)
+
+        # Update the total number of goals by adding the home and away goals from the current match.
+        self.total_goals += (result.home_goals + result.away_goals) * sign
+        # Increment the total number of matches played.
+        self.total_matches += sign
 
-        # Retrieve the scoring information for the away team from the scoring dictionary,
+    def __update_team(self, team: Team, goals_scored: int, goals_conceded: int, matches: int) -> None:
+        # Retrieve the scoring information for the team from the scoring dictionary,
         # or create a new TeamScoring instance with initial values if the team is not present.
-        away_team_scoring = self.scoring_dict.get(result.fixture.away_team, TeamScoring(0, 0, 0))
-        # Update the scoring information for the away team by adding the goals scored and conceded,
-        # and incrementing the number of matches played.
-        self.scoring_dict[result.fixture.away_team] = TeamScoring(
-            goal_scored=away_team_scoring.goal_scored + result.away_goals,
-            goals_conceded=away_team_scoring.goals_conceded + result.home_goals,
-            matches=away_team_scoring.matches + 1,
+        team_scoring = self.scoring_dict.get(team, TeamScoring(0, 0, 0))
+        updated = TeamScoring(
+            goal_scored=team_scoring.goal_scored + goals_scored,
+            goals_conceded=team_scoring.goals_conceded + goals_conceded,
+            matches=team_scoring.matches + matches,
         )
 
-        # Update the total number of goals by adding the home and away goals from the current match.
-        self.total_goals += (result.home_goals + result.away_goals)
-        # Increment the total number of matches played.
-        self.total_matches += 1
+        # A team whose matches were all removed is unknown again, as if it had never been added
+        if updated.matches == 0:
+            self.scoring_dict.pop(team, None)
+        else:
+            self.scoring_dict[team] = updated
 
     # Calculate the average goals per match across all teams
     def __global_goals_per_match(self) -> float:
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 
 import numpy as np
 from numpy import float64
@@ -6,11 +6,12 @@ from numpy.typing import NDArray
 from sklearn.preprocessing import OneHotEncoder  # type: ignore
 from sklearn.svm import SVC  # type: ignore
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
-from matchpredictor.predictors.predictor import Predictor, Prediction
+from matchpredictor.matchresults.result import Result
+from matchpredictor.predictors.predictor import Predictor
+from matchpredictor.predictors.team_encoding_predictor import TeamEncodingPredictor
 
 
-class SupportVectorPredictor(Predictor):
+class SupportVectorPredictor(TeamEncodingPredictor):
     """
     A predictor that uses a Support Vector Machine (SVM) model for prediction based on encoded team names.
     """
@@ -23,63 +24,7 @@ class SupportVectorPredictor(Predictor):
             model (SVC): The Support Vector Machine model for prediction.
             team_encoding (OneHotEncoder): The OneHotEncoder used to encode team names.
         """
-        self.model = model
-        self.team_encoding = team_encoding
-
-    def predict(self, fixture: Fixture) -> Prediction:
-        """
-        Predicts the outcome of a fixture.
-
-        Args:
-            fixture (Fixture): The fixture to predict.
-
-        Returns:
-            Prediction: The predicted outcome.
-        """
-        # Encode the home team name
-        encoded_home_name = self.__encode_team(fixture.home_team)
-        # Encode the away team name
-        encoded_away_name = self.__encode_team(fixture.away_team)
-
-        # If home team name encoding is None, predict AWAY
-        if encoded_home_name is None:
-            return Prediction(outcome=Outcome.AWAY)
-        # If away team name encoding is None, predict HOME
-        if encoded_away_name is None:
-            return Prediction(outcome=Outcome.HOME)
-
-        # Concatenate the encoded team names
-        x: NDArray[float64] = np.concatenate([encoded_home_name, encoded_away_name], 1)
-        # Make a prediction using the model
-        pred = self.model.predict(x)
-
-        # If prediction is positive, predict HOME
-        if pred > 0:
-            return Prediction(outcome=Outcome.HOME)
-        # If prediction is negative, predict AWAY
-        elif pred < 0:
-            return Prediction(outcome=Outcome.AWAY)
-        # If prediction is zero, predict DRAW
-        else:
-            return Prediction(outcome=Outcome.DRAW)
-
-    def __encode_team(self, team: Team) -> Optional[NDArray[float64]]:
-        """
-        Encodes a team name using the team encoding.
-
-        Args:
-            team (Team): The team whose name needs to be encoded.
-
-        Returns:
-            Optional[NDArray[float64]]: The encoded team name, or None if encoding fails.
-        """
-        try:
-            # Transform the team name using the encoding
-            result: NDArray[float64] = self.team_encoding.transform(np.array(team.name).reshape(-1, 1))
-            return result
-        except ValueError:
-            # Return None if encoding fails
-            return None
+        super().__init__(model, team_encoding)
 
 
 def build_model(results: List[Result]) -> Tuple[SVC, OneHotEncoder]:
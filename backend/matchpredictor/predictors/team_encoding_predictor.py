@@ -0,0 +1,139 @@
+from typing import Any, List, Optional, Sequence, Set, cast
+
+import numpy as np
+from numpy import float64
+from numpy.typing import NDArray
+from sklearn.preprocessing import OneHotEncoder  # type: ignore
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.predictors.predictor import Predictor, Prediction
+
+
+class TeamEncodingPredictor(Predictor):
+    """
+    Base class of the predictors that predict the sign of the goal difference with a scikit-learn model, from the
+    one-hot encodings of the home and away team names.
+
+    Teams the encoding was not fitted with lose: a fixture with an unknown home team is predicted as an away win,
+    and one with an unknown away team as a home win.
+    """
+
+    def __init__(self, model: Any, team_encoding: OneHotEncoder) -> None:
+        """
+        Initializes the TeamEncodingPredictor with a model and a team encoding.
+
+        Args:
+            model (Any): The fitted scikit-learn model, which predicts the sign of the goal difference.
+            team_encoding (OneHotEncoder): The team encoding used to transform team names.
+        """
+        self.model = model
+        self.team_encoding = team_encoding
+        # The team names the encoding was fitted with, used to skip unknown teams without raising
+        self.known_teams: Set[str] = {str(name) for name in team_encoding.categories_[0]}
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        """
+        Makes a prediction for the given fixture using the model and team encodings.
+
+        Args:
+            fixture (Fixture): The fixture for which the prediction is made.
+
+        Returns:
+            Prediction: The prediction for the fixture.
+        """
+        # Encode the home team name
+        encoded_home_name = self.__encode_team(fixture.home_team)
+        # Encode the away team name
+        encoded_away_name = self.__encode_team(fixture.away_team)
+
+        # If home team name encoding is None, predict AWAY
+        if encoded_home_name is None:
+            return Prediction(outcome=Outcome.AWAY)
+        # If away team name encoding is None, predict HOME
+        if encoded_away_name is None:
+            return Prediction(outcome=Outcome.HOME)
+
+        # Concatenate the encoded team names
+        x: NDArray[float64] = np.concatenate([encoded_home_name, encoded_away_name], 1)
+        # Make a prediction using the model
+        pred = self.model.predict(x)
+
+        return self.__prediction_from(pred[0])
+
+    def predict_all(self, fixtures: Sequence[Fixture]) -> List[Prediction]:
+        """
+        Predicts the outcomes of several fixtures with a single call to the model.
+
+        Args:
+            fixtures (Sequence[Fixture]): The fixtures to predict.
+
+        Returns:
+            List[Prediction]: The predictions, in the same order as the fixtures.
+        """
+        predictions: List[Optional[Prediction]] = []
+        # Positions of the fixtures whose teams are both known to the encoding
+        encodable: List[int] = []
+
+        for index, fixture in enumerate(fixtures):
+            # Unknown teams are handled the same way as in predict
+            if fixture.home_team.name not in self.known_teams:
+                predictions.append(Prediction(outcome=Outcome.AWAY))
+            elif fixture.away_team.name not in self.known_teams:
+                predictions.append(Prediction(outcome=Outcome.HOME))
+            else:
+                predictions.append(None)
+                encodable.append(index)
+
+        if len(encodable) > 0:
+            # Encode all home and away team names at once
+            home_names = np.array([fixtures[i].home_team.name for i in encodable]).reshape(-1, 1)
+            away_names = np.array([fixtures[i].away_team.name for i in encodable]).reshape(-1, 1)
+            x: NDArray[float64] = np.concatenate([
+                self.team_encoding.transform(home_names),
+                self.team_encoding.transform(away_names),
+            ], 1)
+
+            # Make all predictions using the model and put them back in place
+            for index, pred in zip(encodable, self.model.predict(x)):
+                predictions[index] = self.__prediction_from(pred)
+
+        return cast(List[Prediction], predictions)
+
+    @staticmethod
+    def __prediction_from(pred: float) -> Prediction:
+        """
+        Converts a value predicted by the model to a Prediction.
+
+        Args:
+            pred (float): The predicted sign of the goal difference.
+
+        Returns:
+            Prediction: The prediction for the fixture.
+        """
+        # If prediction is positive, predict HOME
+        if pred > 0:
+            return Prediction(outcome=Outcome.HOME)
+        # If prediction is negative, predict AWAY
+        elif pred < 0:
+            return Prediction(outcome=Outcome.AWAY)
+        # If prediction is zero, predict DRAW
+        else:
+            return Prediction(outcome=Outcome.DRAW)
+
+    def __encode_team(self, team: Team) -> Optional[NDArray[float64]]:
+        """
+        Encodes the team name using the team encoding.
+
+        Args:
+            team (Team): The team to encode.
+
+        Returns:
+            Optional[ndarray]: The encoded team name, or None if encoding fails.
+        """
+        try:
+            # Transform the team name using the encoding
+            result: NDArray[float64] = self.team_encoding.transform(np.array(team.name).reshape(-1, 1))
+            return result
+        except ValueError:
+            # Return None if encoding fails
+            return None
@@ -0,0 +1,234 @@
+import cProfile
+import hmac
+import io
+import itertools
+import pstats
+import tracemalloc
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from flask import Blueprint, Response, g, jsonify, request
+
+from matchpredictor.profiling.sampling_profiler import collapsed_stacks, sample_stacks
+from matchpredictor.profiling.spans import server_timing, start_recording_spans, stop_recording_spans
+
+# The header that carries the profiling token, without which nothing is profiled
+TOKEN_HEADER = "X-Profile-Token"
+
+# The header that asks for a cProfile of the request, in addition to its span timings
+PROFILE_HEADER = "X-Profile"
+
+# The number of request profiles kept for retrieval
+MAX_PROFILES = 16
+
+# The longest time window that can be sampled, in seconds
+MAX_SAMPLING_SECONDS = 30.0
+
+# The most frames tracemalloc keeps of each allocation's traceback
+MAX_TRACEMALLOC_FRAMES = 65535
+
+
+class ProfileStore(object):
+    """
+    Keeps the most recent request profiles, so that they can be retrieved after the request.
+    """
+
+    def __init__(self, capacity: int = MAX_PROFILES) -> None:
+        """
+        Initializes an empty ProfileStore.
+
+        Args:
+            capacity (int): The number of profiles kept. Older profiles are dropped.
+        """
+        self.__capacity = capacity
+        self.__profiles: OrderedDict[str, str] = OrderedDict()
+        self.__ids = itertools.count(1)
+        self.__lock = Lock()
+
+    def add(self, profile: str) -> str:
+        """
+        Keeps a profile.
+
+        Args:
+            profile (str): The profile report.
+
+        Returns:
+            str: The id of the profile.
+        """
+        with self.__lock:
+            profile_id = str(next(self.__ids))
+            self.__profiles[profile_id] = profile
+            while len(self.__profiles) > self.__capacity:
+                self.__profiles.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[str]:
+        """
+        Retrieves a profile.
+
+        Args:
+            profile_id (str): The id of the profile.
+
+        Returns:
+            Optional[str]: The profile report, or None if it is unknown or has been dropped.
+        """
+        with self.__lock:
+            return self.__profiles.get(profile_id)
+
+
+def profile_report(profiler: cProfile.Profile, limit: int = 50) -> str:
+    """
+    Formats the functions a profiler spent the most cumulative time in.
+
+    Args:
+        profiler (cProfile.Profile): The profiler.
+        limit (int): The number of functions reported.
+
+    Returns:
+        str: The pstats report.
+    """
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return report.getvalue()
+
+
+def profiling_api(token: str) -> Blueprint:
+    """
+    Creates a Blueprint for the profiling API, which lets operators see where the time and memory of live
+    requests goes. Every request and endpoint must present the profiling token, so nothing is profiled unless
+    asked for.
+
+    A request with the token in the X-Profile-Token header gets a Server-Timing header with the timings of its
+    stages. With "X-Profile: cprofile" as well, the request is run under cProfile and the report can be retrieved
+    from /admin/profiles/<id>, with the id given in the X-Profile-Id header.
+
+    Args:
+        token (str): The profiling token.
+
+    Returns:
+        Blueprint: The Blueprint for the profiling API.
+    """
+    api = Blueprint("profiling_api", __name__)
+    profiles = ProfileStore()
+
+    def authorized() -> bool:
+        presented = request.headers.get(TOKEN_HEADER)
+        return presented is not None and hmac.compare_digest(presented.encode(), token.encode())
+
+    @api.before_app_request
+    def start_profiling() -> None:
+        if not authorized():
+            return
+
+        g.profiling_spans, g.profiling_token = start_recording_spans()
+
+        if request.headers.get(PROFILE_HEADER, "").lower() == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            g.profiler = profiler
+
+    @api.after_app_request
+    def report_profiling(response: Response) -> Response:
+        profiler: Optional[cProfile.Profile] = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+            response.headers["X-Profile-Id"] = profiles.add(profile_report(profiler))
+
+        if "profiling_spans" in g:
+            response.headers["Server-Timing"] = server_timing(g.profiling_spans)
+
+        return response
+
+    # Teardown runs even when the request fails, so the thread never keeps profiling the requests that follow
+    @api.teardown_app_request
+    def stop_profiling(error: Optional[BaseException]) -> None:
+        profiler: Optional[cProfile.Profile] = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+
+        token = g.pop("profiling_token", None)
+        if token is not None:
+            stop_recording_spans(token)
+
+    @api.route("/admin/profiles/<profile_id>", methods=["GET"])
+    def profile(profile_id: str) -> Response:
+        """
+        Retrieves the cProfile report of a recent request.
+
+        Returns:
+            Response: The report as plain text.
+        """
+        if not authorized():
+            return Response("Forbidden", 403)
+
+        report = profiles.get(profile_id)
+        if report is None:
+            return Response("Unknown profile", 404)
+        return Response(report, mimetype="text/plain")
+
+    @api.route("/admin/profile", methods=["POST"])
+    def sample() -> Response:
+        """
+        Samples the stacks of all request threads for a time window, given by the seconds query parameter.
+
+        Returns:
+            Response: The sampled stacks in collapsed format, ready for a flame graph.
+        """
+        if not authorized():
+            return Response("Forbidden", 403)
+
+        seconds = min(request.args.get("seconds", default=5.0, type=float), MAX_SAMPLING_SECONDS)
+        return Response(collapsed_stacks(sample_stacks(seconds)), mimetype="text/plain")
+
+    @api.route("/admin/tracemalloc", methods=["POST", "DELETE"])
+    def toggle_tracemalloc() -> Response:
+        """
+        Starts tracing memory allocations on POST and stops on DELETE. Tracing slows down allocations, so it
+        should only be on for as long as needed.
+
+        Returns:
+            Response: Whether allocations are being traced, as a JSON response, or a 400 if the number of frames
+                is invalid.
+        """
+        if not authorized():
+            return Response("Forbidden", 403)
+
+        if request.method == "POST":
+            frames = request.args.get("frames", default=1, type=int)
+            if not 1 <= frames <= MAX_TRACEMALLOC_FRAMES:
+                return Response(f"The number of frames must be between 1 and {MAX_TRACEMALLOC_FRAMES}", 400)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+        elif request.method == "DELETE":
+            tracemalloc.stop()
+
+        return jsonify({"tracing": tracemalloc.is_tracing()})
+
+    @api.route("/admin/tracemalloc", methods=["GET"])
+    def tracemalloc_snapshot() -> Response:
+        """
+        Takes a snapshot of the memory allocated since tracing started, grouped by the line that allocated it.
+
+        Returns:
+            Response: The lines that allocated the most memory, as a JSON response.
+        """
+        if not authorized():
+            return Response("Forbidden", 403)
+        if not tracemalloc.is_tracing():
+            return Response("Allocations are not being traced", 409)
+
+        limit = request.args.get("limit", default=25, type=int)
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        current, peak = tracemalloc.get_traced_memory()
+
+        return jsonify({
+            "traced_bytes": current,
+            "peak_traced_bytes": peak,
+            "top": [
+                {"location": str(statistic.traceback), "bytes": statistic.size, "count": statistic.count}
+                for statistic in statistics[:limit]
+            ],
+        })
+
+    return api
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from flask import Flask, Response, g, request
+
+from matchpredictor.profiling.tracing import Tracer, install_tracer, parse_traceparent, set_span_attribute, \
+    uninstall_tracer
+
+
+def trace_requests(app: Flask, tracer: Tracer) -> None:
+    """
+    Traces every request the app serves as the root of the spans of its stages.
+
+    A request with a W3C traceparent header continues the caller's trace, and follows its sampling decision.
+
+    Args:
+        app (Flask): The app to trace.
+        tracer (Tracer): The tracer of the app, which its requests trace with.
+    """
+
+    @app.before_request
+    def start_request_span() -> None:
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        # Trace the stages of the request with the app's tracer, rather than with that of another app
+        tracer_token = install_tracer(tracer)
+        g.request_trace = (tracer_token, tracer.start(
+            f"{request.method} {route}",
+            parent=parse_traceparent(request.headers.get("traceparent")),
+            attributes={"http.method": request.method, "http.route": route},
+        ))
+
+    @app.after_request
+    def record_response_status(response: Response) -> Response:
+        if "request_trace" in g:
+            set_span_attribute("http.status_code", str(response.status_code))
+        return response
+
+    # Teardown runs even when the request fails, so the span always ends
+    @app.teardown_request
+    def end_request_span(error: Optional[BaseException]) -> None:
+        request_trace = g.pop("request_trace", None)
+        if request_trace is not None:
+            tracer_token, span_token = request_trace
+            tracer.end(span_token, error)
+            uninstall_tracer(tracer_token)
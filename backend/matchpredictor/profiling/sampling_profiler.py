@@ -0,0 +1,67 @@
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import List, Optional
+
+# How deep into a stack the sampler looks
+MAX_STACK_DEPTH = 64
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> Counter[str]:
+    """
+    Samples the stacks of all threads but the calling one for a time window.
+
+    Unlike cProfile, sampling does not slow down the code it observes, other than briefly taking the GIL at each
+    sample, so it can run against a live server.
+
+    Args:
+        seconds (float): How long to sample for.
+        interval (float): How long to wait between samples, in seconds.
+
+    Returns:
+        Counter[str]: How many times each stack was seen, keyed by the stack in collapsed form.
+    """
+    stacks: Counter[str] = Counter()
+    sampler = threading.get_ident()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != sampler:
+                stacks[collapsed_stack(frame)] += 1
+        time.sleep(interval)
+
+    return stacks
+
+
+def collapsed_stack(frame: Optional[FrameType]) -> str:
+    """
+    Formats a stack as a single line, from the outermost frame to the innermost.
+
+    Args:
+        frame (Optional[FrameType]): The innermost frame of the stack.
+
+    Returns:
+        str: The frames separated by semicolons, each as "function (file:first line)".
+    """
+    frames: List[str] = []
+    while frame is not None and len(frames) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+def collapsed_stacks(stacks: Counter[str]) -> str:
+    """
+    Formats sampled stacks in the collapsed format read by flame graph tools, most frequent first.
+
+    Args:
+        stacks (Counter[str]): How many times each stack was seen.
+
+    Returns:
+        str: One line per stack, followed by its count.
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -0,0 +1,137 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, cast
+
+from matchpredictor.profiling.tracing import current_tracer
+
+
+@dataclass(frozen=True)
+class SpanTiming(object):
+    """
+    Represents how long a stage of a request took.
+
+    Attributes:
+        name (str): The name of the stage, e.g. "predict".
+        start (float): When the stage started, as a time.perf_counter() value.
+        duration (float): How long the stage took, in seconds.
+        attributes (Dict[str, str]): Describes what the stage did, e.g. the model it trained.
+    """
+    name: str
+    start: float
+    duration: float
+    attributes: Dict[str, str] = field(default_factory=dict)
+
+
+# The spans of the request being recorded in the current context, or None when spans are not recorded
+_recorded_spans: ContextVar[Optional[List[SpanTiming]]] = ContextVar("recorded_spans", default=None)
+
+
+@contextmanager
+def span(name: str, **attributes: str) -> Iterator[None]:
+    """
+    Times a stage of the current request, if its spans are being recorded, and traces it, if tracing is enabled.
+
+    When neither is the case, which is the usual one, this costs two context variable lookups.
+
+    Args:
+        name (str): The name of the stage.
+        **attributes (str): Describes what the stage does, e.g. the model it predicts with.
+    """
+    spans = _recorded_spans.get()
+    tracer = current_tracer()
+    if spans is None and tracer is None:
+        yield
+        return
+
+    trace_token = None if tracer is None else tracer.start(name, attributes=attributes)
+    started = time.perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        if spans is not None:
+            spans.append(SpanTiming(name, started, time.perf_counter() - started, attributes))
+        if tracer is not None and trace_token is not None:
+            tracer.end(trace_token, error)
+
+
+# The type of a function that is timed as a stage
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def spanned(name: str) -> Callable[[F], F]:
+    """
+    Times every call of a function as a stage of the current request, as span() does for a block.
+
+    Args:
+        name (str): The name of the stage.
+
+    Returns:
+        Callable[[F], F]: Decorates the function.
+    """
+
+    def decorate(function: F) -> F:
+        @wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return function(*args, **kwargs)
+
+        return cast(F, timed)
+
+    return decorate
+
+
+@contextmanager
+def recording_spans() -> Iterator[List[SpanTiming]]:
+    """
+    Records the spans of the stages run in the block.
+
+    Returns:
+        Iterator[List[SpanTiming]]: The spans, in the order the stages finished, filled in as they finish.
+    """
+    spans, token = start_recording_spans()
+    try:
+        yield spans
+    finally:
+        stop_recording_spans(token)
+
+
+def start_recording_spans() -> Tuple[List[SpanTiming], Token[Optional[List[SpanTiming]]]]:
+    """
+    Starts recording the spans of the stages run in the current context, for when a block does not fit.
+
+    Returns:
+        Tuple[List[SpanTiming], Token[Optional[List[SpanTiming]]]]: The spans, filled in as stages finish,
+        and the token to stop recording with.
+    """
+    spans: List[SpanTiming] = []
+    return spans, _recorded_spans.set(spans)
+
+
+def stop_recording_spans(token: Token[Optional[List[SpanTiming]]]) -> None:
+    """
+    Stops recording spans.
+
+    Args:
+        token (Token[Optional[List[SpanTiming]]]): The token returned when the recording started.
+    """
+    _recorded_spans.reset(token)
+
+
+def server_timing(spans: List[SpanTiming]) -> str:
+    """
+    Formats spans as the value of a Server-Timing header, which browsers show alongside network timings.
+
+    Args:
+        spans (List[SpanTiming]): The spans.
+
+    Returns:
+        str: The header value, with durations in milliseconds.
+    """
+    return ", ".join(f"{s.name};dur={s.duration * 1000:.3f}" for s in sorted(spans, key=lambda s: s.start))
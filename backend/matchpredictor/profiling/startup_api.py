@@ -0,0 +1,29 @@
+from flask import Blueprint, Response, jsonify
+
+from matchpredictor.profiling.startup_timeline import StartupTimeline
+
+
+def startup_api(timeline: StartupTimeline) -> Blueprint:
+    """
+    Creates a Blueprint for the startup API, which reports where the time of the cold start went.
+
+    Args:
+        timeline (StartupTimeline): The startup timeline of the app.
+
+    Returns:
+        Blueprint: The Blueprint for the startup API.
+    """
+    api = Blueprint("startup_api", __name__)
+
+    @api.route("/startup", methods=["GET"])
+    def startup() -> Response:
+        """
+        Handles GET requests to the "/startup" endpoint.
+
+        Returns:
+            Response: The duration of the startup and of its phases, e.g. the imports, the fetch and parse of the
+            results, the training of each model and the registration of the blueprints, as a JSON response.
+        """
+        return jsonify({"startup": timeline})
+
+    return api
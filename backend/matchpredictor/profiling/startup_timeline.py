@@ -0,0 +1,81 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from matchpredictor.profiling.spans import SpanTiming
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StartupPhase(object):
+    """
+    Represents a phase of the startup, e.g. the training of a model.
+
+    Attributes:
+        name (str): The name of the phase, e.g. "train".
+        start_ms (float): When the phase started, in milliseconds since the app started importing.
+        duration_ms (float): How long the phase took, in milliseconds.
+        attributes (Dict[str, str]): Describes what the phase did, e.g. the model it trained.
+    """
+    name: str
+    start_ms: float
+    duration_ms: float
+    attributes: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class StartupTimeline(object):
+    """
+    Represents where the time went between the app starting to import and being ready to serve.
+
+    Attributes:
+        total_ms (float): How long the startup took, in milliseconds.
+        phases (List[StartupPhase]): The phases of the startup, in the order they started. Phases nest, e.g. the
+            fetch and the parse of the results are part of loading them.
+    """
+    total_ms: float
+    phases: List[StartupPhase]
+
+
+def startup_timeline(
+        import_started: float,
+        app_started: float,
+        app_finished: float,
+        spans: List[SpanTiming],
+) -> StartupTimeline:
+    """
+    Builds the startup timeline from the spans recorded while the app was created.
+
+    Args:
+        import_started (float): When the app started importing, as a time.perf_counter() value.
+        app_started (float): When the app started being created, as a time.perf_counter() value.
+        app_finished (float): When the app was ready to serve, as a time.perf_counter() value.
+        spans (List[SpanTiming]): The spans recorded while the app was created.
+
+    Returns:
+        StartupTimeline: The startup timeline.
+    """
+    def milliseconds(seconds: float) -> float:
+        return round(seconds * 1000, 3)
+
+    # Everything before the app started being created is imports, and reading the environment
+    phases = [StartupPhase("import", 0.0, milliseconds(app_started - import_started))]
+    phases.extend(
+        StartupPhase(s.name, milliseconds(s.start - import_started), milliseconds(s.duration), dict(s.attributes))
+        for s in sorted(spans, key=lambda s: s.start)
+    )
+    return StartupTimeline(milliseconds(app_finished - import_started), phases)
+
+
+def log_startup_timeline(timeline: StartupTimeline) -> None:
+    """
+    Logs the startup timeline, one line per phase.
+
+    Args:
+        timeline (StartupTimeline): The startup timeline.
+    """
+    logger.info("Started in %.1f ms", timeline.total_ms)
+    for phase in timeline.phases:
+        details = "".join(f" {name}={value}" for name, value in phase.attributes.items())
+        logger.info("  %-20s %10.1f ms  at %10.1f ms%s", phase.name, phase.duration_ms, phase.start_ms, details)
@@ -0,0 +1,317 @@
+import json
+import random
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Iterator, Optional, TextIO
+
+# Matches a W3C trace context traceparent header: version, trace id, parent span id and flags
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclass(frozen=True)
+class SpanContext(object):
+    """
+    Represents the identity of a span, as propagated between services.
+
+    Attributes:
+        trace_id (str): The id of the trace, as 32 hexadecimal digits.
+        span_id (str): The id of the span, as 16 hexadecimal digits.
+        sampled (bool): Whether the trace is exported.
+    """
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[SpanContext]:
+    """
+    Parses a W3C traceparent header.
+
+    Args:
+        header (Optional[str]): The header value.
+
+    Returns:
+        Optional[SpanContext]: The context of the remote parent span, or None if the header is missing or invalid.
+    """
+    match = TRACEPARENT.match((header or "").strip().lower())
+    if match is None:
+        return None
+
+    trace_id, span_id, flags = match.groups()
+    # All-zero ids are invalid
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return SpanContext(trace_id, span_id, sampled=int(flags, 16) & 1 == 1)
+
+
+def format_traceparent(context: SpanContext) -> str:
+    """
+    Formats a span context as a W3C traceparent header.
+
+    Args:
+        context (SpanContext): The span context.
+
+    Returns:
+        str: The header value.
+    """
+    return f"00-{context.trace_id}-{context.span_id}-{'01' if context.sampled else '00'}"
+
+
+@dataclass
+class ActiveSpan(object):
+    """
+    Represents a span that has started and not yet ended.
+
+    Attributes:
+        name (str): The name of the span.
+        context (SpanContext): The identity of the span.
+        parent_id (Optional[str]): The id of the parent span, or None for the root of a trace.
+        start_time_unix_nano (int): When the span started, in nanoseconds since the epoch.
+        start_counter_ns (int): When the span started, as a time.perf_counter_ns() value.
+        attributes (Dict[str, str]): Describes what the span did, e.g. the model it predicted with.
+    """
+    name: str
+    context: SpanContext
+    parent_id: Optional[str]
+    start_time_unix_nano: int
+    start_counter_ns: int
+    attributes: Dict[str, str] = field(default_factory=dict)
+
+
+class JsonLinesExporter(object):
+    """
+    Exports finished spans as JSON lines, to a local file or to stdout, so that traces can be inspected without a
+    collector service.
+    """
+
+    def __init__(self, stream: TextIO, owns_stream: bool = False) -> None:
+        """
+        Initializes the JsonLinesExporter.
+
+        Args:
+            stream (TextIO): The stream to write the spans to.
+            owns_stream (bool): Whether the exporter opened the stream, and so closes it when it is closed.
+                Defaults to False, e.g. for stdout.
+        """
+        self.__stream = stream
+        self.__owns_stream = owns_stream
+        self.__lock = Lock()
+
+    def export(self, span: ActiveSpan, end_time_unix_nano: int, duration_ns: int, error: Optional[str]) -> None:
+        """
+        Writes a finished span.
+
+        Args:
+            span (ActiveSpan): The span.
+            end_time_unix_nano (int): When the span ended, in nanoseconds since the epoch.
+            duration_ns (int): How long the span took, in nanoseconds.
+            error (Optional[str]): The error the span failed with, if any.
+        """
+        line = json.dumps({
+            "name": span.name,
+            "trace_id": span.context.trace_id,
+            "span_id": span.context.span_id,
+            "parent_id": span.parent_id,
+            "start_time_unix_nano": span.start_time_unix_nano,
+            "end_time_unix_nano": end_time_unix_nano,
+            "duration_ms": duration_ns / 1_000_000,
+            "attributes": span.attributes,
+            "error": error,
+        })
+        with self.__lock:
+            if self.__stream.closed:
+                return
+            self.__stream.write(line + "\n")
+            self.__stream.flush()
+
+    def close(self) -> None:
+        """
+        Closes the stream, if the exporter opened it. Spans that end afterwards are dropped.
+        """
+        with self.__lock:
+            if self.__owns_stream:
+                self.__stream.close()
+
+
+def exporter_for(destination: str) -> JsonLinesExporter:
+    """
+    Creates the exporter for a trace destination.
+
+    Args:
+        destination (str): "stdout", or the path of the file to append the spans to.
+
+    Returns:
+        JsonLinesExporter: The exporter.
+    """
+    if destination == "stdout":
+        return JsonLinesExporter(sys.stdout)
+    return JsonLinesExporter(open(destination, "a", buffering=1), owns_stream=True)
+
+
+class Tracer(object):
+    """
+    Starts and ends spans, which nest through a context variable, and exports them once they end.
+
+    Traces that start in this process are sampled at the given ratio; traces continued from an incoming
+    traceparent header follow the sampling decision of the caller.
+    """
+
+    def __init__(self, exporter: JsonLinesExporter, sample_ratio: float = 1.0) -> None:
+        """
+        Initializes the Tracer.
+
+        Args:
+            exporter (JsonLinesExporter): Exports the finished spans.
+            sample_ratio (float): The share of the traces started here that are exported. Defaults to all.
+        """
+        self.__exporter = exporter
+        self.__sample_ratio = sample_ratio
+
+    def start(
+            self,
+            name: str,
+            parent: Optional[SpanContext] = None,
+            attributes: Optional[Dict[str, str]] = None,
+    ) -> Token[Optional[ActiveSpan]]:
+        """
+        Starts a span and makes it the current span.
+
+        Args:
+            name (str): The name of the span.
+            parent (Optional[SpanContext]): The remote parent of the span. Defaults to None, in which case the
+                current span, if any, is the parent.
+            attributes (Optional[Dict[str, str]]): Describes what the span does.
+
+        Returns:
+            Token[Optional[ActiveSpan]]: The token to end the span with.
+        """
+        current = _current_span.get()
+        parent = parent if parent is not None else (current.context if current is not None else None)
+
+        if parent is None:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+            sampled = random.random() < self.__sample_ratio
+        else:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+
+        # Spans that are not sampled are still made current, so that their children are not sampled either
+        return _current_span.set(ActiveSpan(
+            name=name,
+            context=SpanContext(trace_id, f"{random.getrandbits(64):016x}", sampled),
+            parent_id=parent_id,
+            start_time_unix_nano=time.time_ns(),
+            start_counter_ns=time.perf_counter_ns(),
+            attributes=dict(attributes or {}),
+        ))
+
+    def end(self, token: Token[Optional[ActiveSpan]], error: Optional[BaseException] = None) -> None:
+        """
+        Ends the current span, exports it if it is sampled and makes its parent the current span again.
+
+        Args:
+            token (Token[Optional[ActiveSpan]]): The token the span was started with.
+            error (Optional[BaseException]): The error the span failed with, if any.
+        """
+        span = _current_span.get()
+        _current_span.reset(token)
+        if span is None or not span.context.sampled:
+            return
+
+        duration_ns = time.perf_counter_ns() - span.start_counter_ns
+        self.__exporter.export(
+            span,
+            span.start_time_unix_nano + duration_ns,
+            duration_ns,
+            None if error is None else f"{type(error).__name__}: {error}",
+        )
+
+    def close(self) -> None:
+        """
+        Closes the exporter, e.g. the file the spans are appended to, once the app that traces with it stops.
+        """
+        self.__exporter.close()
+
+
+# The span that new spans are children of, in the current context
+_current_span: ContextVar[Optional[ActiveSpan]] = ContextVar("current_span", default=None)
+
+# The tracer of the app being served or started in the current context, or None when tracing is disabled
+_current_tracer: ContextVar[Optional[Tracer]] = ContextVar("current_tracer", default=None)
+
+
+def install_tracer(tracer: Optional[Tracer]) -> Token[Optional[Tracer]]:
+    """
+    Makes a tracer the tracer of the current context, e.g. of a request, so that apps with different tracers do
+    not trace with each other's.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer, or None to disable tracing.
+
+    Returns:
+        Token[Optional[Tracer]]: The token to restore the previous tracer with.
+    """
+    return _current_tracer.set(tracer)
+
+
+def uninstall_tracer(token: Token[Optional[Tracer]]) -> None:
+    """
+    Restores the tracer of the current context from before a tracer was installed.
+
+    Args:
+        token (Token[Optional[Tracer]]): The token the tracer was installed with.
+    """
+    _current_tracer.reset(token)
+
+
+@contextmanager
+def using_tracer(tracer: Optional[Tracer]) -> Iterator[None]:
+    """
+    Traces the block with a tracer.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer, or None to disable tracing in the block.
+    """
+    token = install_tracer(tracer)
+    try:
+        yield
+    finally:
+        uninstall_tracer(token)
+
+
+def current_tracer() -> Optional[Tracer]:
+    """
+    Retrieves the tracer of the current context.
+
+    Returns:
+        Optional[Tracer]: The tracer, or None when tracing is disabled.
+    """
+    return _current_tracer.get()
+
+
+def current_span_context() -> Optional[SpanContext]:
+    """
+    Retrieves the identity of the current span, e.g. to propagate it in a traceparent header.
+
+    Returns:
+        Optional[SpanContext]: The current span context, or None outside of a sampled span.
+    """
+    span = _current_span.get()
+    return None if span is None else span.context
+
+
+def set_span_attribute(name: str, value: str) -> None:
+    """
+    Describes the current span further, e.g. with the status of a response.
+
+    Args:
+        name (str): The name of the attribute.
+        value (str): The value of the attribute.
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.attributes[name] = value
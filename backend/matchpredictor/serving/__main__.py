@@ -0,0 +1,17 @@
+import logging
+import os
+
+from matchpredictor.app import create_app
+from matchpredictor.environment import app_environment_from_env
+from matchpredictor.serving.prefork_server import serve, server_settings_from_env
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s")
+
+# Read the server settings, e.g. WORKERS and THREADS, from the environment
+settings = server_settings_from_env(os.environ)
+
+# Create the app, loading the results and training the models once, before any worker is forked
+app = create_app(app_environment_from_env())
+
+# Serve the app from the worker processes until asked to stop
+serve(app, settings)
@@ -0,0 +1,225 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, AbstractSet, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from flask import Flask
+
+from matchpredictor.app import MODEL_TRAINERS, create_app
+from matchpredictor.environment import app_environment_from_env
+from matchpredictor.model.model_provider import ModelCost
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class AsgiAdapter:
+    """
+    Serves a Flask app, and therefore the existing blueprints, to an ASGI server.
+
+    Requests are handled on a pool of threads so that the event loop never blocks. Requests for expensive models
+    can be given a pool of their own, so that simulations, or requests waiting on the prediction pool, never take
+    every thread and queue the requests for cheap models behind them. Combined with a prediction pool, expensive
+    predictions run in other processes and their threads only wait for them, releasing the GIL. Responses are sent
+    once the app has produced them.
+    """
+
+    def __init__(
+            self,
+            app: Flask,
+            threads: int,
+            expensive_threads: int = 0,
+            is_expensive: Callable[[Dict[str, Any]], bool] = lambda environ: False,
+    ) -> None:
+        """
+        Initializes the AsgiAdapter.
+
+        Args:
+            app (Flask): The app to serve.
+            threads (int): The number of threads requests are handled on.
+            expensive_threads (int): The number of threads the requests for expensive models are handled on.
+                Defaults to 0, in which case they share the threads of the other requests.
+            is_expensive (Callable[[Dict[str, Any]], bool]): Tells, from its WSGI environ, whether a request is
+                for an expensive model. Defaults to none being.
+        """
+        self.__app = app
+        self.__executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="asgi")
+        self.__expensive_executor = ThreadPoolExecutor(max_workers=expensive_threads,
+                                                       thread_name_prefix="asgi-expensive") \
+            if expensive_threads > 0 else self.__executor
+        self.__is_expensive = is_expensive
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handles an ASGI connection.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): Receives the messages of the connection.
+            send (Send): Sends messages on the connection.
+        """
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']}")
+
+        # Read the whole request body before handing the request to a thread
+        body = BytesIO()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.write(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body.seek(0)
+
+        environ = wsgi_environ(scope, body)
+        executor = self.__expensive_executor if self.__is_expensive(environ) else self.__executor
+        loop = asyncio.get_running_loop()
+        status, headers, content = await loop.run_in_executor(executor, self.__run_app, environ)
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": content})
+
+    def __run_app(self, environ: Dict[str, Any]) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        """
+        Runs the app for a request on a thread of the pool.
+
+        Args:
+            environ (Dict[str, Any]): The WSGI environ of the request.
+
+        Returns:
+            Tuple[int, List[Tuple[bytes, bytes]], bytes]: The status, headers and body of the response.
+        """
+        status = 500
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+
+        def start_response(
+                status_line: str,
+                response_headers: List[Tuple[str, str]],
+                exc_info: Optional[Any] = None,
+        ) -> Callable[[bytes], object]:
+            nonlocal status, headers
+            status = int(status_line.split(" ", 1)[0])
+            headers = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in response_headers]
+            return chunks.append
+
+        response: Iterable[bytes] = self.__app(environ, start_response)
+        try:
+            chunks.extend(response)
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+        return status, headers, b"".join(chunks)
+
+    async def __lifespan(self, receive: Receive, send: Send) -> None:
+        """
+        Handles the startup and shutdown messages of the ASGI server.
+
+        Args:
+            receive (Receive): Receives the lifespan messages.
+            send (Send): Sends the lifespan replies.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.__executor.shutdown(wait=True)
+                self.__expensive_executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def wsgi_environ(scope: Scope, body: BytesIO) -> Dict[str, Any]:
+    """
+    Builds the WSGI environ of an ASGI HTTP request.
+
+    Args:
+        scope (Scope): The ASGI connection scope.
+        body (BytesIO): The request body.
+
+    Returns:
+        Dict[str, Any]: The WSGI environ.
+    """
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        # WSGI carries paths as latin-1 decoded bytes
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        key = name if name in ("CONTENT_TYPE", "CONTENT_LENGTH") else f"HTTP_{name}"
+        # Repeated headers are joined, as a WSGI server would
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+    # The body has been read in full, so its length is known even when it was sent in chunks
+    environ.setdefault("CONTENT_LENGTH", str(body.getbuffer().nbytes))
+
+    return environ
+
+
+def requests_model_in(model_names: AbstractSet[str]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Creates a check of whether a request is for one of some models, as named by its model_name query parameters.
+
+    Args:
+        model_names (AbstractSet[str]): The names of the models.
+
+    Returns:
+        Callable[[Dict[str, Any]], bool]: Checks the WSGI environ of a request.
+    """
+
+    def requests_model(environ: Dict[str, Any]) -> bool:
+        requested = parse_qs(environ.get("QUERY_STRING", "")).get("model_name", [])
+        return any(model_name in model_names for model_name in requested)
+
+    return requests_model
+
+
+def create_asgi_app() -> AsgiAdapter:
+    """
+    Creates the ASGI app from the environment, e.g. for `uvicorn --factory matchpredictor.serving.asgi:create_asgi_app`.
+
+    The requests for expensive models are handled on EXPENSIVE_THREADS threads of their own, 8 by default, so that
+    the requests for cheap models always have the THREADS others.
+
+    Returns:
+        AsgiAdapter: The ASGI app.
+    """
+    expensive_models = frozenset(trainer.name for trainer in MODEL_TRAINERS if trainer.cost is ModelCost.EXPENSIVE)
+    return AsgiAdapter(
+        create_app(app_environment_from_env()),
+        threads=int(os.environ.get('THREADS', 32)),
+        expensive_threads=int(os.environ.get('EXPENSIVE_THREADS', 8)),
+        is_expensive=requests_model_in(expensive_models),
+    )
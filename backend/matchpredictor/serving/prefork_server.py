@@ -0,0 +1,286 @@
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Thread
+from types import FrameType
+from typing import Dict, List, Mapping, Optional
+
+from flask import Flask
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """
+    Represents the configuration of the production server.
+
+    Attributes:
+        host (str): The host to listen on.
+        port (int): The port to listen on.
+        workers (int): The number of worker processes.
+        threads (int): The number of request threads in each worker.
+        keep_alive (float): How long, in seconds, an idle keep-alive connection is held open.
+        graceful_timeout (float): How long, in seconds, workers get to finish their requests when shutting down.
+        queue (int): How many connections each worker accepts beyond those its threads are handling. Connections
+            past that are answered with 503 Service Unavailable.
+    """
+    host: str
+    port: int
+    workers: int
+    threads: int
+    keep_alive: float = 5
+    graceful_timeout: float = 30
+    queue: int = 64
+
+
+def server_settings_from_env(environ: Mapping[str, str]) -> ServerSettings:
+    """
+    Creates the ServerSettings from environment variables.
+
+    Args:
+        environ (Mapping[str, str]): The environment variables.
+
+    Returns:
+        ServerSettings: The server settings, with one worker per core by default.
+    """
+    return ServerSettings(
+        host=environ.get('HOST', '0.0.0.0'),
+        port=int(environ.get('PORT', 5001)),
+        workers=int(environ.get('WORKERS', os.cpu_count() or 1)),
+        threads=int(environ.get('THREADS', 8)),
+        keep_alive=float(environ.get('KEEP_ALIVE', 5)),
+        graceful_timeout=float(environ.get('GRACEFUL_TIMEOUT', 30)),
+        queue=int(environ.get('QUEUE', 64)),
+    )
+
+
+class ThreadPoolWSGIServer(BaseWSGIServer):
+    """
+    A WSGI server that handles connections on a fixed size pool of threads.
+
+    The connections waiting for a thread are bounded, so that an overloaded server sheds the connections it cannot
+    handle soon, rather than queueing them until their clients have given up.
+    """
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, app: Flask, threads: int, keep_alive: float, queue: int = 64,
+                 fd: Optional[int] = None) -> None:
+        """
+        Initializes the server.
+
+        Args:
+            host (str): The host to listen on.
+            port (int): The port to listen on.
+            app (Flask): The app to serve.
+            threads (int): The number of request threads.
+            keep_alive (float): How long, in seconds, an idle keep-alive connection is held open.
+            queue (int): How many connections may wait for a thread.
+            fd (Optional[int]): The descriptor of an already listening socket to accept connections from.
+        """
+        # Idle keep-alive connections time out, so that they do not hold on to a thread of the pool
+        handler = type("KeepAliveRequestHandler", (WSGIRequestHandler,), {"timeout": keep_alive})
+
+        super().__init__(host, port, app, handler=handler, fd=fd)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="request")
+        # A slot per connection being handled or waiting for a thread
+        self.__slots = BoundedSemaphore(threads + queue)
+
+    def process_request(self, request: socket.socket, client_address: str) -> None:  # type: ignore[override]
+        """
+        Hands an accepted connection to the thread pool, or rejects it if the pool's queue is full.
+
+        Args:
+            request (socket.socket): The connection.
+            client_address (str): The address of the client.
+        """
+        if not self.__slots.acquire(blocking=False):
+            self.__reject(request)
+            return
+        self.executor.submit(self.__process_request, request, client_address)
+
+    def server_close(self) -> None:
+        """
+        Stops accepting connections and waits for the requests in flight to finish.
+        """
+        super().server_close()
+
+        # The base class also closes the server while it initializes, before there is an executor
+        if hasattr(self, "executor"):
+            self.executor.shutdown(wait=True)
+
+    def __process_request(self, request: socket.socket, client_address: str) -> None:
+        """
+        Handles a connection on a thread of the pool.
+
+        Args:
+            request (socket.socket): The connection.
+            client_address (str): The address of the client.
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.__slots.release()
+
+    def __reject(self, request: socket.socket) -> None:
+        """
+        Answers a connection that no thread can handle soon with 503 Service Unavailable, without reading it.
+
+        Args:
+            request (socket.socket): The connection.
+        """
+        try:
+            request.sendall(b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\nContent-Length: 0\r\n"
+                            b"Connection: close\r\n\r\n")
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+
+def serve(app: Flask, settings: ServerSettings) -> None:
+    """
+    Serves the app from several worker processes that share a single listening socket.
+
+    The app, with its trained models, is created before calling this function, so the workers are forked with
+    the models already in memory and share it copy-on-write. Workers that die are replaced.
+    SIGTERM or SIGINT stops the server gracefully: the workers stop accepting connections and finish the
+    requests in flight, and are killed if they have not exited within the graceful timeout.
+
+    Args:
+        app (Flask): The app to serve.
+        settings (ServerSettings): The server settings.
+    """
+    listener = socket.create_server((settings.host, settings.port), backlog=2048)
+
+    # Move the objects created so far out of the garbage collector's reach, so that collections in the
+    # workers do not touch, and therefore copy, the pages holding the models
+    gc.freeze()
+
+    workers: Dict[int, int] = {}
+    stopping = False
+
+    def stop(signum: int, frame: Optional[FrameType]) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info("Listening on %s:%d with %d workers", settings.host, settings.port, settings.workers)
+
+    try:
+        for number in range(settings.workers):
+            workers[_fork_worker(app, listener, settings)] = number
+
+        # Replace the workers that exit until asked to stop
+        while not stopping:
+            pid = _reap_worker()
+            if pid is None:
+                time.sleep(0.1)
+            elif pid in workers:
+                logger.warning("Worker %d exited, starting a new one", pid)
+                # Back off a little, so that a worker that fails on start does not turn into a fork loop
+                time.sleep(1)
+                workers[_fork_worker(app, listener, settings)] = workers.pop(pid)
+    finally:
+        listener.close()
+        _stop_workers(list(workers), settings.graceful_timeout)
+
+
+def _fork_worker(app: Flask, listener: socket.socket, settings: ServerSettings) -> int:
+    """
+    Forks a worker process that serves the app.
+
+    Args:
+        app (Flask): The app to serve.
+        listener (socket.socket): The listening socket shared by the workers.
+        settings (ServerSettings): The server settings.
+
+    Returns:
+        int: The process id of the worker.
+    """
+    pid = os.fork()
+    if pid != 0:
+        return pid
+
+    exit_code = 0
+    try:
+        server = ThreadPoolWSGIServer(settings.host, settings.port, app, settings.threads, settings.keep_alive,
+                                      settings.queue, fd=listener.fileno())
+
+        # shutdown waits for serve_forever to return, so it must not be called on the thread running it
+        def stop(signum: int, frame: Optional[FrameType]) -> None:
+            Thread(target=server.shutdown).start()
+
+        signal.signal(signal.SIGTERM, stop)
+        # Interrupts from the terminal reach the whole process group, and the master turns them into SIGTERM
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+    except BaseException:
+        logger.exception("Worker %d failed", os.getpid())
+        exit_code = 1
+    finally:
+        # Never return into the master's code
+        os._exit(exit_code)
+
+
+def _reap_worker() -> Optional[int]:
+    """
+    Collects a worker that has exited, without blocking.
+
+    Returns:
+        Optional[int]: The process id of the worker that exited, or None if all workers are running.
+    """
+    try:
+        pid, _ = os.waitpid(-1, os.WNOHANG)
+    except ChildProcessError:
+        return None
+    return pid if pid != 0 else None
+
+
+def _stop_workers(pids: List[int], graceful_timeout: float) -> None:
+    """
+    Asks the workers to stop and waits for them, killing the ones that outlive the graceful timeout.
+
+    Args:
+        pids (List[int]): The process ids of the workers.
+        graceful_timeout (float): How long, in seconds, the workers get to exit.
+    """
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    remaining = set(pids)
+    deadline = time.monotonic() + graceful_timeout
+
+    while len(remaining) > 0 and time.monotonic() < deadline:
+        for pid in list(remaining):
+            try:
+                exited, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                exited = pid
+            if exited != 0:
+                remaining.discard(pid)
+        time.sleep(0.05)
+
+    for pid in remaining:
+        logger.warning("Worker %d did not stop in time, killing it", pid)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
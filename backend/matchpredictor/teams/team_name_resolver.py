@@ -0,0 +1,235 @@
+import re
+import unicodedata
+from collections import Counter
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from matchpredictor.matchresults.result import Team
+from matchpredictor.metrics.registry import CacheStats
+
+# Upstream names that normalization alone cannot line up with the names in the training data
+DEFAULT_ALIASES: Dict[str, str] = {
+    "Club Atlético de Madrid": "Atletico Madrid",
+    "FC Bayern München": "Bayern Munich",
+    "FC Internazionale Milano": "Internazionale",
+    "Wolverhampton Wanderers FC": "Wolverhampton",
+    "Newcastle United FC": "Newcastle",
+    "Nottingham Forest FC": "Nottingham Forest",
+    "Sport Lisboa e Benfica": "Benfica",
+    "Sporting Clube de Portugal": "Sporting CP",
+    "PSV": "PSV Eindhoven",
+    "Borussia Mönchengladbach": "Borussia Monchengladbach",
+    "Real Betis Balompié": "Real Betis",
+    "RC Celta de Vigo": "Celta Vigo",
+}
+
+# Tokens that only tell clubs apart from other kinds of teams, e.g. the FC in "Chelsea FC"
+IGNORED_TOKENS: Set[str] = {"fc", "afc", "cf", "sc", "ac", "as", "cd", "ssc", "sv", "fk", "club", "calcio"}
+
+# The minimum trigram similarity for a fuzzy match to be accepted
+MINIMUM_SIMILARITY = 0.7
+
+# How far ahead of the runner-up a fuzzy match must be, so that ambiguous names stay unresolved
+MINIMUM_MARGIN = 0.1
+
+
+def normalize_team_name(name: str) -> str:
+    """
+    Normalizes a team name so that spelling variants of the same name compare equal.
+
+    Accents, case, punctuation and tokens such as "FC" are removed, and "&" is spelled out.
+
+    Args:
+        name (str): The team name.
+
+    Returns:
+        str: The normalized team name.
+    """
+    # Strip accents, e.g. "München" becomes "Munchen"
+    decomposed = unicodedata.normalize("NFKD", name)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+
+    # Lower case, spell out "&" and replace punctuation with spaces
+    words = re.sub(r"[^a-z0-9]+", " ", without_accents.casefold().replace("&", " and "))
+
+    # Drop the tokens that do not identify the team
+    tokens = [token for token in words.split() if token not in IGNORED_TOKENS]
+    return " ".join(tokens)
+
+
+def trigrams(key: str) -> Set[str]:
+    """
+    Splits a normalized team name into its trigrams.
+
+    Args:
+        key (str): The normalized team name.
+
+    Returns:
+        Set[str]: The trigrams of the padded name.
+    """
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TeamNameResolver:
+    """
+    Resolves team names from upstream sources, such as football-data, to the teams known to the predictors.
+
+    Names are looked up, in order, by exact name, alias, normalized name and trigram similarity.
+    Resolved names are cached, so repeated lookups are a single dictionary access, counted as cache hits.
+    """
+
+    def __init__(self, teams: Iterable[Team], aliases: Optional[Dict[str, str]] = None) -> None:
+        """
+        Builds the resolution index for the known teams.
+
+        Args:
+            teams (Iterable[Team]): The teams known to the predictors.
+            aliases (Optional[Dict[str, str]]): Upstream names mapped to known team names.
+                Defaults to DEFAULT_ALIASES.
+        """
+        self.__teams: Dict[str, Team] = {}
+        self.__normalized: Dict[str, Optional[Team]] = {}
+        self.__trigrams: Dict[str, Set[str]] = {}
+        self.__trigram_counts: Dict[str, int] = {}
+        self.__resolved: Dict[str, Optional[Team]] = {}
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+        for team in teams:
+            self.__add_team(team)
+
+        # Index the aliases by their normalized name, skipping the ones for teams that are not known
+        self.__aliases: Dict[str, Team] = {}
+        for alias, name in (DEFAULT_ALIASES if aliases is None else aliases).items():
+            aliased_team = self.__teams.get(name)
+            if aliased_team is not None:
+                self.__aliases[normalize_team_name(alias)] = aliased_team
+
+    def resolve(self, name: str) -> Optional[Team]:
+        """
+        Resolves an upstream team name to a known team.
+
+        Args:
+            name (str): The upstream team name.
+
+        Returns:
+            Optional[Team]: The known team, or None if the name cannot be resolved.
+        """
+        # Most lookups hit the cache
+        with self.__lock:
+            if name in self.__resolved:
+                self.__hits += 1
+                return self.__resolved[name]
+            self.__misses += 1
+
+        team = self.__lookup(name)
+
+        with self.__lock:
+            self.__resolved[name] = team
+
+        return team
+
+    def stats(self) -> CacheStats:
+        """
+        Retrieves how often resolved names were found in the cache.
+
+        Returns:
+            CacheStats: The number of cache hits and misses.
+        """
+        with self.__lock:
+            return CacheStats(hits=self.__hits, misses=self.__misses)
+
+    def resolve_name(self, name: str) -> str:
+        """
+        Resolves an upstream team name to the name of a known team, keeping the upstream name if it is unknown.
+
+        Args:
+            name (str): The upstream team name.
+
+        Returns:
+            str: The name of the known team, or the upstream name.
+        """
+        team = self.resolve(name)
+        return name if team is None else team.name
+
+    def __add_team(self, team: Team) -> None:
+        """
+        Adds a known team to the index.
+
+        Args:
+            team (Team): The team to add.
+        """
+        if team.name in self.__teams:
+            return
+        self.__teams[team.name] = team
+
+        key = normalize_team_name(team.name)
+        if key in self.__normalized:
+            # Two teams share the normalized name, so it cannot tell them apart
+            self.__normalized[key] = None
+            return
+        self.__normalized[key] = team
+
+        # Add the normalized name to the posting list of each of its trigrams
+        key_trigrams = trigrams(key)
+        self.__trigram_counts[key] = len(key_trigrams)
+        for trigram in key_trigrams:
+            self.__trigrams.setdefault(trigram, set()).add(key)
+
+    def __lookup(self, name: str) -> Optional[Team]:
+        """
+        Looks up an upstream team name in the index.
+
+        Args:
+            name (str): The upstream team name.
+
+        Returns:
+            Optional[Team]: The known team, or None if the name cannot be resolved.
+        """
+        exact = self.__teams.get(name)
+        if exact is not None:
+            return exact
+
+        key = normalize_team_name(name)
+
+        alias = self.__aliases.get(key)
+        if alias is not None:
+            return alias
+
+        if key in self.__normalized:
+            return self.__normalized[key]
+
+        return self.__fuzzy_lookup(key)
+
+    def __fuzzy_lookup(self, key: str) -> Optional[Team]:
+        """
+        Finds the known team whose normalized name shares the most trigrams with the given one.
+
+        Args:
+            key (str): The normalized upstream team name.
+
+        Returns:
+            Optional[Team]: The most similar team, or None if no team is clearly similar enough.
+        """
+        key_trigrams = trigrams(key)
+
+        # Count the trigrams shared with every candidate that has at least one in common
+        shared: Counter[str] = Counter()
+        for trigram in key_trigrams:
+            shared.update(self.__trigrams.get(trigram, ()))
+
+        # Score the candidates with the Dice coefficient of their trigram sets
+        scores: List[Tuple[float, str]] = sorted(
+            ((2 * count / (len(key_trigrams) + self.__trigram_counts[candidate]), candidate)
+             for candidate, count in shared.items()),
+            reverse=True,
+        )
+
+        if len(scores) == 0 or scores[0][0] < MINIMUM_SIMILARITY:
+            return None
+        if len(scores) > 1 and scores[0][0] - scores[1][0] < MINIMUM_MARGIN:
+            return None
+
+        return self.__normalized[scores[0][1]]
@@ -22,17 +22,32 @@ class FootballDataMatchesResponse:
     matches: List[MatchJson]
 
 
+# The football-data API, unless another server, such as the fake one, is configured
+DEFAULT_BASE_URL = 'https://api.football-data.org/v4'
+
+# How long to wait for the football-data API to connect and to respond, in seconds
+DEFAULT_TIMEOUT = 10.0
+
+
 class FootballDataApiClient:
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL, timeout: float = DEFAULT_TIMEOUT):
         self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
 
     def fetch_matches(self) -> Optional[FootballDataMatchesResponse]:
         try:
             # Send a GET request to the football data API to fetch matches
-            football_data_api_response = requests \
-                .get('https://api.football-data.org/v4/matches', headers={'X-Auth-Token': self.api_key}) \
-                .json()
+            response = requests.get(
+                f'{self.base_url}/matches',
+                headers={'X-Auth-Token': self.api_key},
+                timeout=self.timeout,
+            )
+            # Errors, e.g. when the rate limit is reached, have bodies that are not matches
+            if response.status_code != 200:
+                return None
+            football_data_api_response = response.json()
 
             # Convert the API response to a FootballDataMatchesResponse object using dacite
             return dacite.core.from_dict(
@@ -40,6 +55,12 @@ class FootballDataApiClient:
                 data=football_data_api_response
             )
 
+        except requests.Timeout:
+            # Return None if the football data API took too long to respond
+            return None
+        except requests.ConnectionError:
+            # Return None if the football data API could not be reached
+            return None
         except requests.JSONDecodeError:
             # Return None if there was an error decoding the JSON response
             return None
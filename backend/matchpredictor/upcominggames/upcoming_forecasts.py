@@ -0,0 +1,75 @@
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from matchpredictor.forecast.forecaster import Forecast, Forecaster
+from matchpredictor.matchresults.result import Fixture
+from matchpredictor.metrics.registry import CacheStats
+
+
+class UpcomingForecasts:
+    """
+    Forecasts the upcoming fixtures in bulk and caches the forecasts.
+
+    The cache holds the forecasts for the most recent snapshot of upcoming fixtures only; a new snapshot replaces it.
+    The forecasts of a model are keyed by its version too, so that a retrained model does not serve stale ones.
+    """
+
+    def __init__(self, forecaster: Forecaster) -> None:
+        """
+        Initializes UpcomingForecasts with a Forecaster.
+
+        Args:
+            forecaster (Forecaster): The forecaster used to make the forecasts.
+        """
+        self.__forecaster = forecaster
+        self.__snapshot: Tuple[Fixture, ...] = ()
+        self.__forecasts: Dict[Tuple[str, Optional[str]], List[Optional[Forecast]]] = {}
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def forecasts_for(self, fixtures: Sequence[Fixture], model_name: str) -> List[Optional[Forecast]]:
+        """
+        Retrieves the forecasts for the upcoming fixtures, computing them in one batch when they are not cached.
+
+        Args:
+            fixtures (Sequence[Fixture]): The snapshot of upcoming fixtures.
+            model_name (str): The name of the model to use for the forecasts.
+
+        Returns:
+            List[Optional[Forecast]]: One forecast per fixture, or None where the fixture cannot be forecast.
+        """
+        snapshot = tuple(fixtures)
+        key = (model_name, self.__forecaster.model_version(model_name))
+
+        with self.__lock:
+            # Drop the cached forecasts when the upcoming fixtures have changed
+            if snapshot != self.__snapshot:
+                self.__snapshot = snapshot
+                self.__forecasts = {}
+
+            cached = self.__forecasts.get(key)
+            if cached is not None:
+                self.__hits += 1
+                return cached
+            self.__misses += 1
+
+        # Compute the forecasts outside the lock so that other models are not held up
+        forecasts = self.__forecaster.forecast_all(snapshot, model_name)
+
+        with self.__lock:
+            # Only cache the forecasts if the snapshot has not moved on in the meantime
+            if snapshot == self.__snapshot:
+                self.__forecasts[key] = forecasts
+
+        return forecasts
+
+    def stats(self) -> CacheStats:
+        """
+        Retrieves how often the cached forecasts were used.
+
+        Returns:
+            CacheStats: The number of cache hits and misses.
+        """
+        with self.__lock:
+            return CacheStats(hits=self.__hits, misses=self.__misses)
@@ -1,10 +1,15 @@
 from dataclasses import dataclass
 from typing import List
 
-from flask import Blueprint, Response, jsonify
+from flask import Blueprint, Response, jsonify, request
 
+from matchpredictor.forecast.bulkhead import BulkheadFull, model_overloaded
+from matchpredictor.forecast.forecaster import Forecast
+from matchpredictor.matchresults.result import Fixture, Team as FixtureTeam
+from matchpredictor.teams.team_name_resolver import TeamNameResolver
 from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient, FootballDataMatchesResponse, \
     MatchJson
+from matchpredictor.upcominggames.upcoming_forecasts import UpcomingForecasts
 
 
 @dataclass(frozen=True)
@@ -24,13 +29,34 @@ class UpcomingGamesResponse:
     games: List[UpcomingGame]
 
 
-# Converts FootballDataMatchesResponse to UpcomingGamesResponse
-def response_from_football_data_matches(matches_response: FootballDataMatchesResponse) -> UpcomingGamesResponse:
+@dataclass(frozen=True)
+class UpcomingGameWithForecasts:
+    home: Team
+    away: Team
+    forecasts: List[Forecast]
+
+
+@dataclass(frozen=True)
+class UpcomingGamesWithForecastsResponse:
+    games: List[UpcomingGameWithForecasts]
+
+
+# Converts FootballDataMatchesResponse to UpcomingGamesResponse, using the team names known to the predictors
+def response_from_football_data_matches(
+        matches_response: FootballDataMatchesResponse,
+        team_name_resolver: TeamNameResolver,
+) -> UpcomingGamesResponse:
     # Builds an UpcomingGame object from MatchJson
     def build_upcoming_game(match_json: MatchJson) -> UpcomingGame:
         return UpcomingGame(
-            home=Team(name=match_json.homeTeam.name, leagues=[match_json.competition.name]),
-            away=Team(name=match_json.awayTeam.name, leagues=[match_json.competition.name]),
+            home=Team(
+                name=team_name_resolver.resolve_name(match_json.homeTeam.name),
+                leagues=[match_json.competition.name],
+            ),
+            away=Team(
+                name=team_name_resolver.resolve_name(match_json.awayTeam.name),
+                leagues=[match_json.competition.name],
+            ),
         )
 
     # Builds a list of UpcomingGame objects by applying build_upcoming_game to each match in matches_response
@@ -42,10 +68,50 @@ def response_from_football_data_matches(matches_response: FootballDataMatchesRes
     return UpcomingGamesResponse(games)
 
 
-def upcoming_games_api(api_client: FootballDataApiClient) -> Blueprint:
+# Converts an UpcomingGame to the Fixture that the forecaster predicts
+def fixture_from_upcoming_game(game: UpcomingGame) -> Fixture:
+    return Fixture(
+        home_team=FixtureTeam(name=game.home.name),
+        away_team=FixtureTeam(name=game.away.name),
+        league=game.home.leagues[0],
+    )
+
+
+# Attaches the forecasts of the given models to each upcoming game
+def response_with_forecasts(
+        games_response: UpcomingGamesResponse,
+        upcoming_forecasts: UpcomingForecasts,
+        model_names: List[str],
+) -> UpcomingGamesWithForecastsResponse:
+    fixtures = [fixture_from_upcoming_game(game) for game in games_response.games]
+
+    # Forecasts every fixture in one batch per model
+    forecasts_by_model = [upcoming_forecasts.forecasts_for(fixtures, model_name) for model_name in model_names]
+
+    # Collects the forecasts for each game, skipping the ones that could not be made
+    games = [
+        UpcomingGameWithForecasts(
+            home=game.home,
+            away=game.away,
+            forecasts=[f for f in (forecasts[index] for forecasts in forecasts_by_model) if f is not None],
+        )
+        for index, game in enumerate(games_response.games)
+    ]
+
+    return UpcomingGamesWithForecastsResponse(games)
+
+
+def upcoming_games_api(
+        api_client: FootballDataApiClient,
+        team_name_resolver: TeamNameResolver,
+        upcoming_forecasts: UpcomingForecasts,
+) -> Blueprint:
     # Creates a Blueprint for the upcoming games API
     api = Blueprint("upcoming_games_api", __name__)
 
+    # Rejects requests that need forecasts from an overloaded model
+    api.register_error_handler(BulkheadFull, model_overloaded)
+
     # Handles GET requests to the "/upcoming-games" endpoint
     @api.route('/upcoming-games', methods=["GET"])
     def list_upcoming_games() -> Response:
@@ -58,7 +124,12 @@ def upcoming_games_api(api_client: FootballDataApiClient) -> Blueprint:
 
         matches = maybe_football_data_api_matches
         # Converts matches to UpcomingGamesResponse
-        upcoming_games_response = response_from_football_data_matches(matches)
+        upcoming_games_response = response_from_football_data_matches(matches, team_name_resolver)
+
+        # Attaches forecasts when models are requested, e.g. ?model_name=Home&model_name=Points
+        model_names = request.args.getlist('model_name')
+        if len(model_names) > 0:
+            return jsonify(response_with_forecasts(upcoming_games_response, upcoming_forecasts, model_names))
 
         # Returns the upcoming games response as JSON
         return jsonify(upcoming_games_response)
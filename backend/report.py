@@ -1,5 +1,10 @@
-from matchpredictor.league_predictor_report import predictor_report_for
+import os
 
-predictor_report_for('Barclays Premier League', 2021)
-predictor_report_for('English League Championship', 2021)
-predictor_report_for('Italy Serie A', 2021)
+from matchpredictor.league_predictor_report import CSV_LOCATION, predictor_reports_for
+from matchpredictor.matchresults.results_store import open_results_store
+
+# Keep the results in a local store, shared with the app and the backtest, if RESULTS_STORE is set
+store = open_results_store(os.environ['RESULTS_STORE']) if os.environ.get('RESULTS_STORE') else None
+
+predictor_reports_for(['Barclays Premier League', 'English League Championship', 'Italy Serie A'], 2021,
+                      CSV_LOCATION, store=store)
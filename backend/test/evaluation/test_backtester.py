@@ -0,0 +1,56 @@
+from typing import List
+from unittest import TestCase
+
+from matchpredictor.app import MODEL_TRAINERS
+from matchpredictor.evaluation.backtester import backtest
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.predictors.past_results_predictor import IncrementalResultsTrainer, calculate_table
+
+
+def result(league: str, season: int, home: str, away: str, home_goals: int, away_goals: int) -> Result:
+    outcome = Outcome.HOME if home_goals > away_goals else Outcome.AWAY if away_goals > home_goals else Outcome.DRAW
+    return Result(Fixture(Team(home), Team(away), league), outcome, home_goals, away_goals, season)
+
+
+results: List[Result] = [
+    result('League A', 2018, 'Strong', 'Weak', 2, 0),
+    result('League A', 2019, 'Weak', 'Strong', 0, 1),
+    result('League A', 2020, 'Strong', 'Weak', 1, 1),
+    result('League A', 2021, 'Weak', 'Strong', 3, 0),
+    result('League B', 2020, 'Home', 'Away', 1, 0),
+    result('League B', 2021, 'Home', 'Away', 0, 0),
+]
+
+
+class TestBacktester(TestCase):
+    def test_backtest(self) -> None:
+        trainers = [trainer for trainer in MODEL_TRAINERS if trainer.name in ('Home', 'Points')]
+
+        reports = backtest(results, ['League A', 'League B'], [2019, 2020, 2021], window=2, trainers=trainers,
+                           processes=2)
+
+        self.assertEqual([(r.league, r.season, r.model, r.training_matches, r.accuracy) for r in reports], [
+            ('League A', 2019, 'Home', 1, 0.0),
+            ('League A', 2019, 'Points', 1, 1.0),
+            ('League A', 2020, 'Home', 2, 0.0),
+            ('League A', 2020, 'Points', 2, 0.0),
+            ('League A', 2021, 'Home', 2, 1.0),
+            ('League A', 2021, 'Points', 2, 0.0),
+            # League B has no results in 2019
+            ('League B', 2020, 'Home', 0, 1.0),
+            ('League B', 2020, 'Points', 0, 0.0),
+            ('League B', 2021, 'Home', 1, 0.0),
+            ('League B', 2021, 'Points', 1, 0.0),
+        ])
+        self.assertEqual([r.incremental for r in reports[:2]], [False, True])
+
+    def test_incremental_training_matches_training_from_scratch(self) -> None:
+        trainer = IncrementalResultsTrainer()
+        trainer.add(results[:3])
+        trainer.remove(results[:1])
+        trainer.add(results[3:])
+
+        self.assertEqual(
+            {team: points for team, points in trainer.table.points_dict.items() if points != 0},
+            calculate_table(results[1:]).points_dict,
+        )
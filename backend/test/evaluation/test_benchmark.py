@@ -0,0 +1,64 @@
+import os
+import tempfile
+from dataclasses import replace
+from unittest import TestCase
+
+from matchpredictor.app import MODEL_TRAINERS
+from matchpredictor.evaluation.benchmark import BenchmarkResult, Regression, benchmark_dataset, find_regressions, \
+    load_baseline, run_benchmarks, save_baseline
+
+baseline = BenchmarkResult(
+    model='Points',
+    size=1_000,
+    training_seconds=0.5,
+    training_peak_memory_bytes=1_000_000,
+    latency_p50_ms=2.0,
+    latency_p95_ms=4.0,
+    throughput=1_000.0,
+    prediction_peak_memory_bytes=200_000,
+)
+
+
+class TestBenchmark(TestCase):
+    def test_benchmark_dataset_is_fixed(self) -> None:
+        dataset = benchmark_dataset(500)
+
+        self.assertEqual(dataset, benchmark_dataset(500))
+        self.assertEqual(dataset[:100], benchmark_dataset(100))
+        self.assertEqual(len({result.fixture.home_team for result in dataset}), 20)
+        self.assertEqual((dataset[0].season, dataset[-1].season), (2000, 2001))
+
+    def test_run_benchmarks(self) -> None:
+        trainers = [trainer for trainer in MODEL_TRAINERS if trainer.name in ('Home', 'Points')]
+
+        results = run_benchmarks([100, 200], trainers)
+
+        self.assertEqual([(r.model, r.size) for r in results], [
+            ('Home', 100), ('Points', 100), ('Home', 200), ('Points', 200),
+        ])
+        self.assertTrue(all(r.throughput > 0 and r.latency_p50_ms <= r.latency_p95_ms for r in results))
+
+    def test_find_regressions(self) -> None:
+        current = replace(baseline, training_seconds=0.75, latency_p95_ms=4.4, throughput=500.0,
+                          prediction_peak_memory_bytes=250_000)
+
+        self.assertEqual(find_regressions([baseline], [current], threshold=0.25), [
+            Regression('Points', 1_000, 'training_seconds', 0.5, 0.75, 0.5),
+            Regression('Points', 1_000, 'throughput', 1_000.0, 500.0, -0.5),
+        ])
+
+    def test_find_regressions__ignores_noise_and_improvements(self) -> None:
+        current = replace(baseline, training_seconds=0.1, latency_p50_ms=2.9, training_peak_memory_bytes=1_010_000)
+        tiny = replace(baseline, model='Home', training_seconds=0.0001)
+
+        self.assertEqual(find_regressions([baseline, tiny], [current, replace(tiny, training_seconds=0.0005)]), [])
+
+    def test_find_regressions__skips_results_missing_from_the_baseline(self) -> None:
+        self.assertEqual(find_regressions([], [baseline]), [])
+
+    def test_baseline_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            save_baseline(path, [baseline])
+
+            self.assertEqual(load_baseline(path), [baseline])
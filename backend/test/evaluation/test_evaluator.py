@@ -0,0 +1,54 @@
+from typing import List, Sequence
+from unittest import TestCase
+
+from matchpredictor.evaluation.evaluator import Evaluator, percentile
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.predictors.home_predictor import HomePredictor
+from matchpredictor.predictors.predictor import Prediction
+
+
+class BatchCountingPredictor(HomePredictor):
+    def __init__(self) -> None:
+        self.batches: List[int] = []
+
+    def predict_all(self, fixtures: Sequence[Fixture]) -> List[Prediction]:
+        self.batches.append(len(fixtures))
+        return super().predict_all(fixtures)
+
+
+def result(outcome: Outcome) -> Result:
+    return Result(Fixture(Team('Home'), Team('Away'), 'League'), outcome, 0, 0, 2021)
+
+
+class TestEvaluator(TestCase):
+    def test_evaluate(self) -> None:
+        predictor = BatchCountingPredictor()
+        validation_data = [result(Outcome.HOME)] * 3 + [result(Outcome.AWAY)]
+
+        evaluation = Evaluator(predictor, latency_sample_size=2).evaluate(iter(validation_data))
+
+        self.assertEqual(evaluation.accuracy, 0.75)
+        self.assertEqual(evaluation.matches, 4)
+        self.assertGreater(evaluation.throughput, 0)
+        self.assertLessEqual(evaluation.latency_p50_ms, evaluation.latency_p99_ms)
+        self.assertGreaterEqual(evaluation.peak_memory_bytes, 0)
+        # All matches are predicted in one batch, then the sample again under tracemalloc
+        self.assertEqual(predictor.batches, [4, 2])
+
+    def test_measure_accuracy(self) -> None:
+        predictor = BatchCountingPredictor()
+        accuracy, time_elapsed = Evaluator(predictor).measure_accuracy([result(Outcome.DRAW)])
+
+        self.assertEqual(accuracy, 0)
+        self.assertGreaterEqual(time_elapsed, 0)
+        # Only the accuracy is measured, without the latency and memory passes
+        self.assertEqual(predictor.batches, [])
+
+    def test_percentile(self) -> None:
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(percentile([], 50), 0)
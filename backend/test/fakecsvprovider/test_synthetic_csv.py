@@ -0,0 +1,58 @@
+import csv
+from collections import Counter
+from unittest import TestCase
+
+import responses
+
+from fakecsvprovider.synthetic_csv import CHUNK_ROWS, COLUMNS, SyntheticDataset, synthetic_csv
+from matchpredictor.matchresults.results_provider import load_results
+
+
+class TestSyntheticCsv(TestCase):
+    def test_generates_full_seasons(self) -> None:
+        dataset = SyntheticDataset(leagues=2, teams=5, seasons=2)
+
+        rows = list(csv.DictReader("".join(synthetic_csv(dataset)).splitlines()))
+
+        self.assertEqual(list(rows[0].keys()), COLUMNS)
+        # A double round robin of 5 teams is 20 matches per league and season
+        self.assertEqual(len(rows), 2 * 2 * 20)
+        self.assertEqual(Counter((r['season'], r['league']) for r in rows), {
+            ('2016', 'Synthetic League 1'): 20,
+            ('2016', 'Synthetic League 2'): 20,
+            ('2017', 'Synthetic League 1'): 20,
+            ('2017', 'Synthetic League 2'): 20,
+        })
+        # Every pairing is played once per season
+        pairings = Counter((r['team1'], r['team2']) for r in rows if r['season'] == '2016')
+        self.assertEqual(set(pairings.values()), {1})
+
+    def test_is_deterministic(self) -> None:
+        dataset = SyntheticDataset(teams=6, seed=7)
+
+        self.assertEqual("".join(synthetic_csv(dataset)), "".join(synthetic_csv(dataset)))
+        self.assertNotEqual("".join(synthetic_csv(dataset)), "".join(synthetic_csv(SyntheticDataset(teams=6, seed=8))))
+
+    def test_streams_in_chunks(self) -> None:
+        chunks = list(synthetic_csv(SyntheticDataset(leagues=3, seasons=2, rows=CHUNK_ROWS * 2 + 1)))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(sum(chunk.count("\n") for chunk in chunks), CHUNK_ROWS * 2 + 2)
+
+    def test_has_realistic_goals(self) -> None:
+        rows = list(csv.DictReader("".join(synthetic_csv(SyntheticDataset(seasons=5))).splitlines()))
+
+        home_goals = sum(int(r['score1']) for r in rows) / len(rows)
+        away_goals = sum(int(r['score2']) for r in rows) / len(rows)
+        self.assertAlmostEqual(home_goals, 1.55, delta=0.3)
+        self.assertAlmostEqual(away_goals, 1.2, delta=0.3)
+        self.assertTrue(all(
+            abs(float(r['prob1']) + float(r['prob2']) + float(r['probtie']) - 1) < 0.001 for r in rows
+        ))
+
+    def test_is_loaded_as_results(self) -> None:
+        with responses.RequestsMock() as mock:
+            mock.add('GET', 'https://example.com/synthetic.csv', body="".join(synthetic_csv(SyntheticDataset())))
+            results = load_results('https://example.com/synthetic.csv')
+
+        self.assertEqual(len(results), 380)
@@ -0,0 +1,73 @@
+import time
+from typing import Any, Dict, cast
+from unittest import TestCase
+
+from fakefootballdata.fake_server import FakeSettings, create_fake_server
+
+headers = {'X-Auth-Token': 'key'}
+
+
+class TestFakeServer(TestCase):
+    def test_lists_matches(self) -> None:
+        client = create_fake_server(FakeSettings(matches=500, leagues=3, seed=4)).test_client()
+
+        response = client.get('/v4/matches', headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        matches = cast(Dict[str, Any], response.get_json())['matches']
+        self.assertEqual(len(matches), 500)
+        self.assertEqual({m['competition']['name'] for m in matches},
+                         {'Synthetic League 1', 'Synthetic League 2', 'Synthetic League 3'})
+        self.assertTrue(all(m['homeTeam']['name'].startswith(m['competition']['name']) for m in matches))
+        self.assertEqual(client.get('/v4/matches', headers=headers).get_json(), response.get_json())
+
+    def test_requires_a_token(self) -> None:
+        response = create_fake_server().test_client().get('/v4/matches')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_injects_faults(self) -> None:
+        client = create_fake_server(FakeSettings(rate_limit_rate=1)).test_client()
+
+        limited = client.get('/v4/matches', headers=headers)
+        client.put('/admin/settings', json={'rate_limit_rate': 0, 'error_rate': 1})
+        failed = client.get('/v4/matches', headers=headers)
+
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(limited.headers['X-RequestCounter-Reset'], '60')
+        self.assertEqual(failed.status_code, 500)
+
+    def test_injects_latency(self) -> None:
+        client = create_fake_server().test_client()
+
+        settings = client.put('/admin/settings', json={'latency_ms': 50, 'matches': 2})
+        started = time.perf_counter()
+        response = client.get('/v4/matches', headers=headers)
+
+        self.assertEqual(cast(Dict[str, Any], settings.get_json())['latency_ms'], 50)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+        self.assertEqual(len(cast(Dict[str, Any], response.get_json())['matches']), 2)
+
+    def test_rejects_unknown_settings(self) -> None:
+        response = create_fake_server().test_client().put('/admin/settings', json={'latency': 50})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_settings_that_are_not_an_object(self) -> None:
+        client = create_fake_server().test_client()
+
+        for body in [5, [1], 'latency_ms']:
+            self.assertEqual(client.put('/admin/settings', json=body).status_code, 400)
+
+    def test_rejects_invalid_settings(self) -> None:
+        client = create_fake_server(FakeSettings(matches=3)).test_client()
+        before = client.get('/v4/matches', headers=headers).get_json()
+
+        wrong_type = client.put('/admin/settings', json={'matches': 'many'})
+        too_few_teams = client.put('/admin/settings', json={'matches': 5, 'teams': 1})
+
+        self.assertEqual(wrong_type.status_code, 400)
+        self.assertEqual(too_few_teams.status_code, 400)
+        # The settings and the matches are left as they were
+        self.assertEqual(cast(Dict[str, Any], client.get('/admin/settings').get_json())['matches'], 3)
+        self.assertEqual(client.get('/v4/matches', headers=headers).get_json(), before)
@@ -0,0 +1,113 @@
+from threading import Event, Thread
+from unittest import TestCase
+
+from matchpredictor.forecast.bulkhead import Bulkhead, BulkheadFull, BulkheadLimit, Bulkheads, model_overloaded, \
+    parse_bulkhead_limits
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.model.model_provider import Model, ModelCost, ModelProvider
+from matchpredictor.predictors.predictor import Prediction, Predictor
+
+
+class BlockingPredictor(Predictor):
+    def __init__(self) -> None:
+        self.started = Event()
+        self.release = Event()
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return Prediction(outcome=Outcome.HOME)
+
+
+class Home(Predictor):
+    def predict(self, fixture: Fixture) -> Prediction:
+        return Prediction(outcome=Outcome.HOME)
+
+
+fixture = Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')
+
+
+class TestBulkhead(TestCase):
+    def test_admit__rejects_when_slots_and_queue_are_full(self) -> None:
+        bulkhead = Bulkhead("Simulator", BulkheadLimit(max_concurrent=1, max_queued=0))
+
+        with bulkhead.admit():
+            with self.assertRaises(BulkheadFull):
+                with bulkhead.admit():
+                    pass
+
+        with bulkhead.admit():
+            pass
+
+        stats = bulkhead.stats()
+        self.assertEqual(stats.in_flight, 0)
+        self.assertEqual(stats.rejected, 1)
+
+    def test_admit__rejects_after_queue_timeout(self) -> None:
+        bulkhead = Bulkhead("Simulator", BulkheadLimit(max_concurrent=1, max_queued=1, queue_timeout=0.01))
+
+        with bulkhead.admit():
+            with self.assertRaises(BulkheadFull):
+                with bulkhead.admit():
+                    pass
+
+        self.assertEqual(bulkhead.stats().queued, 0)
+
+    def test_bulkheads__by_name_then_cost(self) -> None:
+        bulkheads = Bulkheads({
+            "expensive": BulkheadLimit(max_concurrent=2, max_queued=4),
+            "Fast simulator": BulkheadLimit(max_concurrent=8, max_queued=0),
+        })
+
+        full = bulkheads.bulkhead_for(Model("Full simulator", Home(), cost=ModelCost.EXPENSIVE))
+        fast = bulkheads.bulkhead_for(Model("Fast simulator", Home(), cost=ModelCost.EXPENSIVE))
+
+        self.assertEqual(full.limit.max_concurrent if full else None, 2)
+        self.assertEqual(fast.limit.max_concurrent if fast else None, 8)
+        self.assertIsNone(bulkheads.bulkhead_for(Model("Home", Home())))
+
+    def test_parse_bulkhead_limits(self) -> None:
+        self.assertEqual(parse_bulkhead_limits(" expensive=4/16/250, Home=64 , Away=8/32"), {
+            "expensive": BulkheadLimit(max_concurrent=4, max_queued=16, queue_timeout=0.25),
+            "Home": BulkheadLimit(max_concurrent=64, max_queued=0),
+            "Away": BulkheadLimit(max_concurrent=8, max_queued=32),
+        })
+        self.assertEqual(parse_bulkhead_limits(""), {})
+
+    def test_parse_bulkhead_limits__malformed(self) -> None:
+        for spec in ["4/16", "=4/16", "expensive=many", "expensive=4/16/soon"]:
+            with self.assertRaises(ValueError):
+                parse_bulkhead_limits(spec)
+
+    def test_model_overloaded(self) -> None:
+        response = model_overloaded(BulkheadFull("Simulator"))
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual("1", response.headers["Retry-After"])
+        self.assertEqual(b"Model Simulator is overloaded", response.get_data())
+
+    def test_forecaster__overloaded_model_does_not_block_others(self) -> None:
+        blocking = BlockingPredictor()
+        forecaster = Forecaster(
+            ModelProvider([
+                Model("Simulator", blocking, cost=ModelCost.EXPENSIVE),
+                Model("Home", Home()),
+            ]),
+            bulkheads=Bulkheads({"expensive": BulkheadLimit(max_concurrent=1, max_queued=0)}),
+        )
+
+        thread = Thread(target=forecaster.forecast, args=(fixture, "Simulator"))
+        thread.start()
+        self.assertTrue(blocking.started.wait(timeout=5))
+
+        # A different fixture, so that the forecast is not coalesced with the one in flight
+        with self.assertRaises(BulkheadFull):
+            forecaster.forecast(Fixture(Team('Arsenal'), Team('Everton'), 'Premier League'), "Simulator")
+        forecast = forecaster.forecast(fixture, "Home")
+
+        blocking.release.set()
+        thread.join()
+
+        self.assertEqual(forecast.outcome if forecast else None, Outcome.HOME)
+        self.assertEqual(forecaster.bulkhead_stats()["Simulator"].rejected, 1)
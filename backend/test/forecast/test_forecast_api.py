@@ -101,3 +101,55 @@ class TestForecastApi(TestCase):
         )
 
         self.assertEqual(response.status_code, 400)
+
+    def test_bulkheads(self) -> None:
+        response = self.test_client.get('/bulkheads')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'bulkheads': {}})
+
+    def test_forecast_with_latency_budget(self) -> None:
+        response = self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Full+simulator'
+            '&budget_ms=10000'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        forecast = response.get_json()
+        self.assertEqual(forecast['outcome'], 'away')
+        self.assertEqual(forecast['simulations'], 10_000)
+        self.assertEqual(len(forecast['confidence_interval']), 2)
+
+    def test_forecast_in_progress_with_latency_budget_header(self) -> None:
+        response = self.test_client.get(
+            '/forecast-in-progress'
+            '?home_name=Rarely+Scores'
+            '&away_name=Always+Scores'
+            '&league=Test+League'
+            '&model_name=Offense+simulator'
+            '&minutes_elapsed=80'
+            '&home_goals=1',
+            headers={'X-Latency-Budget-Ms': '0'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['simulations'], 100)
+
+    def test_forecast_with_latency_budget_for_unbudgeted_model(self) -> None:
+        response = self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home'
+            '&budget_ms=50'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('simulations', response.get_json())
+
+    def test_coalescing(self) -> None:
+        self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Full+simulator'
+        )
+
+        response = self.test_client.get('/coalescing')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'coalescing': {'computations': 1, 'coalesced': 0, 'in_flight': 0}})
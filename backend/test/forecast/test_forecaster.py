@@ -97,6 +97,28 @@ class TestForecaster(TestCase):
 
         self.assertIsNone(forecast)
 
+    def test_forecast_all(self) -> None:
+        chelsea_burnley = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+        chelsea_chelsea = Fixture(Team(name='Chelsea'), Team(name='Chelsea'), 'UEFA Champions League')
+
+        forecasts = self.forecaster.forecast_all([chelsea_burnley, chelsea_chelsea, chelsea_burnley], 'Away')
+
+        expected_forecast = Forecast(
+            fixture=chelsea_burnley,
+            model_name='Away',
+            outcome=Outcome.AWAY,
+            confidence=None
+        )
+        self.assertEqual(forecasts, [expected_forecast, None, expected_forecast])
+
+    def test_forecast_all__when_model_cannot_be_found(self) -> None:
+        forecasts = self.forecaster.forecast_all(
+            [Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')],
+            'This model name does not exist'
+        )
+
+        self.assertEqual(forecasts, [None])
+
     def test_forecast_in_progress__with_away_model(self) -> None:
         forecast = self.forecaster.forecast_in_progress(
             Fixture(
@@ -0,0 +1,49 @@
+import os
+from unittest import TestCase
+
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.forecast.prediction_pool import PredictionPool
+from matchpredictor.matchresults.result import Fixture, Outcome, Scenario, Team
+from matchpredictor.model.model_provider import Model, ModelCost, ModelProvider
+from matchpredictor.predictors.predictor import InProgressPredictor, Prediction
+
+
+class ProcessIdPredictor(InProgressPredictor):
+    """Reports the process it predicted in as its confidence."""
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return Prediction(outcome=Outcome.HOME, confidence=os.getpid())
+
+    def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
+        return Prediction(outcome=Outcome.AWAY, confidence=os.getpid())
+
+
+class TestPredictionPool(TestCase):
+    fixture = Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')
+
+    def setUp(self) -> None:
+        model_provider = ModelProvider([
+            Model("Cheap", ProcessIdPredictor()),
+            Model("Expensive", ProcessIdPredictor(), ModelCost.EXPENSIVE),
+        ])
+        self.pool = PredictionPool(model_provider, processes=1)
+        self.forecaster = Forecaster(model_provider, self.pool)
+
+    def tearDown(self) -> None:
+        self.pool.shutdown()
+
+    def test_expensive_models_predict_in_the_pool(self) -> None:
+        forecast = self.forecaster.forecast(self.fixture, "Expensive")
+        in_progress = self.forecaster.forecast_in_progress(self.fixture, Scenario(10, 0, 0), "Expensive")
+        batch = self.forecaster.forecast_all([self.fixture], "Expensive")
+
+        self.assertIsNotNone(forecast)
+        self.assertNotEqual(os.getpid(), forecast.confidence if forecast else None)
+        self.assertEqual(Outcome.AWAY, in_progress.outcome if in_progress else None)
+        self.assertNotEqual(os.getpid(), in_progress.confidence if in_progress else None)
+        self.assertNotEqual(os.getpid(), batch[0].confidence if batch[0] else None)
+
+    def test_cheap_models_predict_inline(self) -> None:
+        forecast = self.forecaster.forecast(self.fixture, "Cheap")
+
+        self.assertEqual(os.getpid(), forecast.confidence if forecast else None)
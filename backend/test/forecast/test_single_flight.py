@@ -0,0 +1,99 @@
+import time
+from threading import Event, Thread
+from typing import List
+from unittest import TestCase
+
+from matchpredictor.forecast.forecaster import Forecaster, Forecast
+from matchpredictor.forecast.single_flight import SingleFlight, SingleFlightStats
+from matchpredictor.matchresults.result import Fixture, Outcome, Scenario, Team
+from matchpredictor.model.model_provider import Model, ModelCost, ModelProvider
+from matchpredictor.predictors.predictor import InProgressPredictor, Prediction
+
+
+class CountingPredictor(InProgressPredictor):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = Event()
+        self.release = Event()
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return self.predict_in_progress(fixture, Scenario(0, 0, 0))
+
+    def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return Prediction(outcome=Outcome.HOME, confidence=0.5)
+
+
+class TestSingleFlight(TestCase):
+    def test_run__coalesces_concurrent_calls(self) -> None:
+        single_flight = SingleFlight()
+        started = Event()
+        release = Event()
+        results: List[int] = []
+
+        def compute() -> int:
+            started.set()
+            release.wait(timeout=5)
+            return 42
+
+        leader = Thread(target=lambda: results.append(single_flight.run("key", compute)))
+        leader.start()
+        self.assertTrue(started.wait(timeout=5))
+
+        followers = [Thread(target=lambda: results.append(single_flight.run("key", lambda: 0))) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        while single_flight.stats().coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        self.assertEqual(results, [42, 42, 42, 42])
+        self.assertEqual(single_flight.stats(), SingleFlightStats(computations=1, coalesced=3, in_flight=0))
+
+    def test_run__computes_again_once_done(self) -> None:
+        single_flight = SingleFlight()
+
+        self.assertEqual(single_flight.run("key", lambda: 1), 1)
+        self.assertEqual(single_flight.run("key", lambda: 2), 2)
+        self.assertEqual(single_flight.stats().computations, 2)
+
+    def test_run__shares_errors(self) -> None:
+        single_flight = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError("no")
+
+        with self.assertRaises(ValueError):
+            single_flight.run("key", fail)
+        self.assertEqual(single_flight.stats().in_flight, 0)
+
+    def test_forecaster__coalesces_identical_in_progress_forecasts(self) -> None:
+        predictor = CountingPredictor()
+        forecaster = Forecaster(ModelProvider([Model("Simulator", predictor, cost=ModelCost.EXPENSIVE)]))
+        fixture = Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')
+        scenario = Scenario(minutes_elapsed=10, home_goals=1, away_goals=0)
+        forecasts: List[Forecast] = []
+
+        def forecast() -> None:
+            result = forecaster.forecast_in_progress(fixture, scenario, "Simulator")
+            if result is not None:
+                forecasts.append(result)
+
+        threads = [Thread(target=forecast) for _ in range(4)]
+        threads[0].start()
+        self.assertTrue(predictor.started.wait(timeout=5))
+        for thread in threads[1:]:
+            thread.start()
+        while forecaster.coalescing_stats().coalesced < 3:
+            time.sleep(0.001)
+        predictor.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(predictor.calls, 1)
+        self.assertEqual(len(forecasts), 4)
+        self.assertEqual(len(set(forecasts)), 1)
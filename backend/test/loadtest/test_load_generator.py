@@ -0,0 +1,79 @@
+import time
+from threading import Thread
+from unittest import TestCase
+
+from flask import Flask, Response
+from werkzeug.serving import make_server
+
+from matchpredictor.loadtest.load_generator import RequestTiming, run_load, summarize
+from matchpredictor.loadtest.request_mix import LoadRequest
+
+
+class TestLoadGenerator(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        app = Flask(__name__)
+
+        @app.route("/forecast")
+        def forecast() -> Response:
+            time.sleep(0.01)
+            return Response("{}", 200)
+
+        @app.route("/teams")
+        def teams() -> Response:
+            return Response("Broken", 500)
+
+        self.server = make_server('127.0.0.1', 0, app, threaded=True)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        super().tearDown()
+
+    def test_run_load(self) -> None:
+        load_requests = [
+            LoadRequest("GET", "/forecast?model_name=Home"),
+            LoadRequest("GET", "/forecast?model_name=Points"),
+            LoadRequest("GET", "/teams"),
+        ]
+
+        timings, elapsed = run_load(self.base_url, load_requests, total=30, concurrency=4)
+        reports = summarize(timings, elapsed)
+
+        self.assertEqual([(r.endpoint, r.model, r.requests, r.errors) for r in reports], [
+            ("/forecast", "Home", 10, 0),
+            ("/forecast", "Points", 10, 0),
+            ("/teams", "-", 10, 10),
+            ("All", "All", 30, 10),
+        ])
+        self.assertAlmostEqual(reports[-1].error_rate, 1 / 3)
+        self.assertGreaterEqual(reports[0].latency_p50_ms, 10)
+        self.assertGreater(reports[-1].throughput, 0)
+
+    def test_run_load__at_a_rate(self) -> None:
+        timings, elapsed = run_load(self.base_url, [LoadRequest("GET", "/forecast")], total=10, rate=100)
+
+        self.assertEqual(len(timings), 10)
+        # The last request is due after 90ms, however fast the app answers
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_run_load__unreachable(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+        timings, _ = run_load(self.base_url, [LoadRequest("GET", "/forecast")], total=2, timeout=1)
+
+        self.assertEqual([timing.status for timing in timings], [0, 0])
+
+    def test_summarize(self) -> None:
+        reports = summarize([
+            RequestTiming("/models", "-", 200, 1_000_000),
+            RequestTiming("/models", "-", 503, 3_000_000),
+        ], elapsed=0.5)
+
+        self.assertEqual(reports[0].throughput, 4)
+        self.assertEqual(reports[0].errors, 1)
+        self.assertEqual(reports[0].latency_p50_ms, 1)
+        self.assertEqual(reports[0].latency_p99_ms, 3)
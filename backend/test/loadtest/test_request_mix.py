@@ -0,0 +1,77 @@
+import json
+from unittest import TestCase
+
+from matchpredictor.loadtest.request_mix import LoadRequest, parse_http_file, parse_mix, parse_request_log, \
+    synthetic_requests
+from matchpredictor.model.models_api import ModelInfo
+from matchpredictor.teams.teams_provider import TeamWithLeagues
+
+
+class TestRequestMix(TestCase):
+    def test_parse_http_file(self) -> None:
+        load_requests = parse_http_file(
+            "GET http://localhost:5001/teams\n"
+            "Accept: application/json\n"
+            "\n"
+            "###\n"
+            "\n"
+            "# A forecast\n"
+            "GET http://localhost:5001/forecast?home_name=Chelsea&away_name=Burnley&model_name=Full+simulator\n"
+            "\n"
+            "###\n"
+        )
+
+        self.assertEqual(load_requests, [
+            LoadRequest("GET", "/teams", {"Accept": "application/json"}),
+            LoadRequest("GET", "/forecast?home_name=Chelsea&away_name=Burnley&model_name=Full+simulator"),
+        ])
+        self.assertEqual(load_requests[1].endpoint(), "/forecast")
+        self.assertEqual(load_requests[1].model(), "Full simulator")
+        self.assertEqual(load_requests[0].model(), "-")
+
+    def test_parse_request_log(self) -> None:
+        load_requests = parse_request_log("\n".join([
+            json.dumps({"method": "get", "path": "/models"}),
+            json.dumps({"url": "http://example.com/upcoming-games?model_name=Home&model_name=Points"}),
+        ]))
+
+        self.assertEqual(load_requests, [
+            LoadRequest("GET", "/models"),
+            LoadRequest("GET", "/upcoming-games?model_name=Home&model_name=Points"),
+        ])
+        self.assertEqual(load_requests[1].model(), "Home,Points")
+
+    def test_parse_mix(self) -> None:
+        self.assertEqual(parse_mix("forecast=6, /teams=1"), {"/forecast": 6.0, "/teams": 1.0})
+
+        with self.assertRaisesRegex(ValueError, "Unknown endpoint in mix: health"):
+            parse_mix("health=1")
+        with self.assertRaisesRegex(ValueError, "Negative weight"):
+            parse_mix("teams=-1")
+
+    def test_synthetic_requests(self) -> None:
+        teams = [
+            TeamWithLeagues("Chelsea", ["Premier League"]),
+            TeamWithLeagues("Burnley", ["Premier League"]),
+            TeamWithLeagues("Lonely", ["Solo League"]),
+        ]
+        models = [ModelInfo("Home", False), ModelInfo("Full simulator", True)]
+
+        load_requests = synthetic_requests(200, teams, models, seed=1)
+
+        self.assertEqual(load_requests, synthetic_requests(200, teams, models, seed=1))
+        self.assertEqual({r.endpoint() for r in load_requests},
+                         {"/forecast", "/forecast-in-progress", "/upcoming-games", "/teams", "/models"})
+        for load_request in load_requests:
+            # A league with a single team cannot host a forecast
+            self.assertNotIn("Lonely", load_request.path)
+            if load_request.endpoint() == "/forecast-in-progress":
+                self.assertEqual(load_request.model(), "Full simulator")
+
+    def test_synthetic_requests__leaves_out_endpoints_it_cannot_request(self) -> None:
+        load_requests = synthetic_requests(50, [], [ModelInfo("Home", False)], {"/forecast": 1, "/models": 1})
+
+        self.assertEqual({r.endpoint() for r in load_requests}, {"/models"})
+
+        with self.assertRaisesRegex(ValueError, "No endpoint"):
+            synthetic_requests(50, [], [], {"/forecast-in-progress": 1})
@@ -0,0 +1,112 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from datetime import date
+from typing import Callable, List, Optional
+from unittest import TestCase
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv, team_name
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_delta import ResultsCursor, ResultsDelta
+from matchpredictor.matchresults.results_provider import load_results, training_results
+from matchpredictor.matchresults.result_timeline import ResultTimeline
+from matchpredictor.matchresults.results_store import DEFAULT_MAX_AGE, ResultsStore
+
+SOURCE = 'https://example.com/some.csv'
+
+
+def result(season: int, league: str = 'Premier League', home: str = 'Chelsea', away: str = 'Burnley') -> Result:
+    return Result(Fixture(Team(home), Team(away), league), Outcome.HOME, 1, 0, season)
+
+
+# The behavior every results store shares. Test modules subclass it once per store, referring to it through this
+# module, so that it is not collected as a test case of its own
+class ResultsStoreContract(TestCase, ABC):
+    def setUp(self) -> None:
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'results')
+
+    @abstractmethod
+    def open_store(self, max_age: float = DEFAULT_MAX_AGE) -> ResultsStore:
+        pass
+
+    def test_ingest_once_while_fresh(self) -> None:
+        store = self.open_store()
+        store.ingest(SOURCE, lambda: [result(2020)])
+
+        # Another process, sharing the store, finds the results fresh
+        self.assertFalse(self.open_store().ingest(SOURCE, lambda: [result(2021)]))
+        self.assertEqual(store.select(SOURCE), [result(2020)])
+
+        # Once they are stale, they are replaced, unless nothing loads
+        stale = self.open_store(max_age=0)
+        self.assertFalse(stale.ingest(SOURCE, lambda: []))
+        self.assertEqual(store.select(SOURCE), [result(2020)])
+        self.assertTrue(stale.ingest(SOURCE, lambda: [result(2021)]))
+        self.assertEqual(store.select(SOURCE), [result(2021)])
+
+    def test_update(self) -> None:
+        store = self.open_store(max_age=0)
+        cursor = ResultsCursor(('season',), 'utf-8', 10, 'season\n')
+        cursors: List[Optional[ResultsCursor]] = []
+
+        def fetch(delta: Optional[ResultsDelta]) -> Callable[[Optional[ResultsCursor]], Optional[ResultsDelta]]:
+            def fetch_delta(stored: Optional[ResultsCursor]) -> Optional[ResultsDelta]:
+                cursors.append(stored)
+                return delta
+            return fetch_delta
+
+        self.assertFalse(store.update(SOURCE, fetch(None)))
+        self.assertTrue(store.update(SOURCE, fetch(ResultsDelta([result(2020), result(2021)], True, cursor))))
+        self.assertTrue(store.update(SOURCE, fetch(ResultsDelta(
+            [result(2021, 'Serie A', 'Roma', 'Lazio'), result(2021)], False, replace(cursor, offset=20)))))
+        # Nothing loaded keeps the results
+        self.assertFalse(store.update(SOURCE, fetch(ResultsDelta([], True, cursor))))
+
+        self.assertEqual(cursors, [None, None, cursor, replace(cursor, offset=20)])
+        self.assertEqual(store.select(SOURCE),
+                         [result(2020), result(2021), result(2021, 'Serie A', 'Roma', 'Lazio'), result(2021)])
+        self.assertEqual(store.select(SOURCE, ResultFilter(first_season=2021, leagues=frozenset(['Premier League']))),
+                         [result(2021), result(2021)])
+
+        # Ingesting all results forgets the cursor
+        store.ingest(SOURCE, lambda: [result(2022)])
+        store.update(SOURCE, fetch(None))
+        self.assertIsNone(cursors[-1])
+
+    @responses.activate
+    def test_load_results_with_store(self) -> None:
+        responses.add(method='GET', url=SOURCE, body="".join(synthetic_csv(SyntheticDataset(leagues=2, seasons=3))))
+        store = self.open_store()
+        result_filter = ResultFilter(leagues=frozenset(['Synthetic League 2']), teams=frozenset([team_name(1, 3)]))
+
+        expected = [r for r in load_results(SOURCE) if result_filter(r) and r.season < 2018]
+
+        self.assertEqual(training_results(SOURCE, 2018, result_filter, store=store), expected)
+        self.assertEqual(load_results(SOURCE, lambda r: r.season == 2018, store=store),
+                         [r for r in load_results(SOURCE) if r.season == 2018])
+        # The CSV was downloaded once for the store, and once for each of the expected results
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_load_results_as_of_a_day_with_store(self) -> None:
+        responses.add(method='GET', url=SOURCE, body="".join(synthetic_csv(SyntheticDataset(leagues=2, seasons=2))))
+        store = self.open_store()
+        all_results = load_results(SOURCE)
+        day = date(2017, 10, 1)
+
+        as_of = load_results(SOURCE, ResultFilter(before_day=day), store=store)
+
+        self.assertEqual(as_of, [r for r in all_results if r.date is not None and r.date < day])
+        self.assertEqual(sorted(as_of, key=lambda r: r.date or date.min), ResultTimeline(all_results).as_of(day))
+        self.assertTrue(0 < len(as_of) < len(all_results))
+        # The day combines with the other conditions
+        self.assertEqual(store.select(SOURCE, ResultFilter(first_season=2017, leagues=frozenset(['Synthetic League 1']),
+                                                           before_day=day)),
+                         [r for r in as_of if r.season == 2017 and r.fixture.league == 'Synthetic League 1'])
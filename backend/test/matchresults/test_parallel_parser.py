@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+from matchpredictor.matchresults.parallel_parser import parse_in_parallel
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.results_provider import load_results
+
+
+class TestParallelParser(TestCase):
+    def test_parses_like_the_serial_parser(self) -> None:
+        body = "".join(synthetic_csv(SyntheticDataset(leagues=2, seasons=3))).encode()
+        chunks = [body[i:i + 1000] for i in range(0, len(body), 1000)]
+
+        # Blocks far smaller than the file, so that many are parsed, some of them concurrently
+        results = parse_in_parallel(chunks, result_filter=lambda r: r.season > 2016, processes=2, block_size=20_000)
+
+        with responses.RequestsMock() as mock:
+            mock.add('GET', 'https://example.com/some.csv', body=body)
+            serial = load_results('https://example.com/some.csv', lambda r: r.season > 2016)
+        self.assertEqual(results, serial)
+        self.assertEqual([r.date for r in results], [r.date for r in serial])
+        self.assertEqual(len(results), 2 * 2 * 380)
+        # Results of the same team share its Team
+        self.assertIs(results[0].fixture.home_team, next(
+            r.fixture.away_team for r in results[1:] if r.fixture.away_team == results[0].fixture.home_team))
+
+    def test_skips_invalid_rows(self) -> None:
+        chunks = [
+            b'season,league,team1,team2,score1,score2\r\n',
+            b'2022,Premier League,Chelsea,Burnley,2,0\r\n',
+            b'2023,Premier League,Chelsea,Arsenal,,\r\n',
+            b'2023,Premier League,Burn',
+        ]
+
+        self.assertEqual(parse_in_parallel(chunks, processes=2), [
+            Result(Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League'), Outcome.HOME, 2, 0, 2022),
+        ])
+
+    def test_missing_columns(self) -> None:
+        self.assertEqual(parse_in_parallel([b'some error message\n', b'with multiple lines'], processes=2), [])
+        self.assertEqual(parse_in_parallel([], processes=2), [])
+
+    @responses.activate
+    def test_load_results_in_parallel(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv',
+                      body="".join(synthetic_csv(SyntheticDataset(seasons=2))))
+
+        results = load_results('https://example.com/some.csv', lambda r: r.season == 2017, processes=2)
+
+        self.assertEqual(len(results), 380)
+        self.assertTrue(all(result.season == 2017 for result in results))
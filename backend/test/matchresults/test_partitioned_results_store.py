@@ -0,0 +1,97 @@
+import csv
+import json
+import os
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+
+from matchpredictor.matchresults.partitioned_results_store import PartitionedResultsStore
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.results_store import DEFAULT_MAX_AGE, open_results_store
+from matchpredictor.matchresults.sqlite_results_store import SqliteResultsStore
+from test.matchresults import results_store_contract
+from test.matchresults.results_store_contract import SOURCE, result
+
+
+class TestPartitionedResultsStore(results_store_contract.ResultsStoreContract):
+    def open_store(self, max_age: float = DEFAULT_MAX_AGE) -> PartitionedResultsStore:
+        return PartitionedResultsStore(self.path, max_age)
+
+    def test_ingest_and_select(self) -> None:
+        store = self.open_store()
+        # Interleave the partitions, to check the order of the file is restored
+        results = [
+            result(2020), result(2021, 'Serie A', 'Roma', 'Lazio'), result(2022, away='Arsenal'),
+            result(2021, 'Serie A/B', 'Lazio', 'Roma'), result(2022, home='Arsenal', away='Chelsea'), result(2020),
+        ]
+
+        self.assertFalse(store.is_fresh(SOURCE))
+        self.assertTrue(store.ingest(SOURCE, lambda: results))
+        self.assertTrue(store.is_fresh(SOURCE))
+
+        self.assertEqual(store.select(SOURCE), results)
+        for result_filter in [
+            ResultFilter(first_season=2021),
+            ResultFilter(last_season=2021, leagues=frozenset(['Serie A'])),
+            ResultFilter(teams=frozenset(['Arsenal'])),
+            ResultFilter(teams=frozenset()),
+            ResultFilter(2022, 2022, frozenset(['Premier League']), frozenset(['Burnley', 'Arsenal'])),
+        ]:
+            self.assertEqual(store.select(SOURCE, result_filter), [r for r in results if result_filter(r)])
+        # Arbitrary filters are checked against every result of the source
+        self.assertEqual(store.select(SOURCE, lambda r: r.season == 2020), [result(2020), result(2020)])
+        self.assertEqual(store.select('https://example.com/other.csv'), [])
+
+    def test_select_reads_only_the_partitions_needed(self) -> None:
+        store = self.open_store()
+        store.ingest(SOURCE, lambda: [result(2020), result(2021), result(2021, 'Serie A', 'Roma', 'Lazio')])
+
+        # Remove every partition but the one of the 2021 Premier League
+        for directory, _, files in os.walk(self.path):
+            for file in files:
+                if file.endswith('.csv') and not (directory.endswith('2021') and file.startswith('premier-league')):
+                    os.remove(os.path.join(directory, file))
+
+        self.assertEqual(store.select(SOURCE, ResultFilter(2021, 2021, frozenset(['Premier League']))),
+                         [result(2021)])
+        with self.assertRaises(FileNotFoundError):
+            store.select(SOURCE, ResultFilter(first_season=2021))
+
+    def test_ingest_keeps_the_previous_version(self) -> None:
+        stale = self.open_store(max_age=0)
+        for season in [2020, 2021, 2022]:
+            self.assertTrue(stale.ingest(SOURCE, lambda: [result(season)]))
+
+        # Only the current and the previous versions of the partitions are kept
+        source_directory, = os.listdir(self.path)
+        versions = [name for name in os.listdir(os.path.join(self.path, source_directory)) if name.startswith('v')]
+        self.assertEqual(len(versions), 2)
+
+    def test_open_results_store(self) -> None:
+        self.assertIsInstance(open_results_store(f'{self.path}.sqlite'), SqliteResultsStore)
+        self.assertIsInstance(open_results_store(self.path), PartitionedResultsStore)
+
+    @responses.activate
+    def test_load_dates_into_a_store_created_without_them(self) -> None:
+        responses.add(method='GET', url=SOURCE, body="".join(synthetic_csv(SyntheticDataset(rows=50))))
+        load_results(SOURCE, store=self.open_store())
+        # Turn the store into one created before the days were kept: partitions without them, in a manifest
+        # without a format
+        source_directory = os.path.join(self.path, os.listdir(self.path)[0])
+        with open(os.path.join(source_directory, 'manifest.json')) as manifest_file:
+            manifest = json.load(manifest_file)
+        for entry in manifest['partitions']:
+            with open(os.path.join(source_directory, entry['file']), newline='') as partition_file:
+                rows = [row[:-1] for row in csv.reader(partition_file)]
+            with open(os.path.join(source_directory, entry['file']), 'w', newline='') as partition_file:
+                csv.writer(partition_file).writerows(rows)
+        del manifest['format']
+        with open(os.path.join(source_directory, 'manifest.json'), 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        results = load_results(SOURCE, store=self.open_store())
+
+        self.assertEqual(results, load_results(SOURCE))
+        self.assertTrue(all(r.date is not None for r in results))
@@ -0,0 +1,89 @@
+from datetime import date
+from unittest import TestCase
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv, team_name
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.result_filter import ResultFilter, ResultIndex, combine_filters
+from matchpredictor.matchresults.results_provider import load_results, training_results
+
+
+def result(season: int, league: str = 'Premier League', home: str = 'Chelsea', away: str = 'Burnley') -> Result:
+    return Result(Fixture(Team(home), Team(away), league), Outcome.HOME, 1, 0, season)
+
+
+class TestResultFilter(TestCase):
+    def test_matches(self) -> None:
+        result_filter = ResultFilter(2020, 2021, frozenset(['Premier League']), frozenset(['Burnley']))
+
+        self.assertTrue(result_filter(result(2020)))
+        self.assertTrue(result_filter(result(2021, home='Burnley', away='Arsenal')))
+        self.assertFalse(result_filter(result(2019)))
+        self.assertFalse(result_filter(result(2022)))
+        self.assertFalse(result_filter(result(2020, league='Serie A')))
+        self.assertFalse(result_filter(result(2020, away='Arsenal')))
+        self.assertTrue(ResultFilter()(result(1990)))
+
+    def test_matches_before_day(self) -> None:
+        result_filter = ResultFilter(before_day=date(2020, 9, 12))
+        played = result(2020)
+
+        self.assertTrue(result_filter(Result(played.fixture, played.outcome, 1, 0, 2020, date(2020, 9, 11))))
+        self.assertFalse(result_filter(Result(played.fixture, played.outcome, 1, 0, 2020, date(2020, 9, 12))))
+        # Results without a date are not known to have been played before the day
+        self.assertFalse(result_filter(played))
+
+    def test_and(self) -> None:
+        combined = ResultFilter(first_season=2018, leagues=frozenset(['A', 'B'])) \
+            & ResultFilter(2016, 2020, frozenset(['B', 'C']))
+
+        self.assertEqual(combined, ResultFilter(2018, 2020, frozenset(['B'])))
+        self.assertEqual(ResultFilter(before_day=date(2020, 9, 12)) & ResultFilter(before_day=date(2020, 8, 1)),
+                         ResultFilter(before_day=date(2020, 8, 1)))
+
+    def test_combine_filters(self) -> None:
+        self.assertEqual(combine_filters(ResultFilter(first_season=2018), ResultFilter(last_season=2020)),
+                         ResultFilter(2018, 2020))
+
+        opaque = combine_filters(lambda r: r.fixture.home_team.name == 'Chelsea', ResultFilter(last_season=2020))
+        self.assertNotIsInstance(opaque, ResultFilter)
+        self.assertTrue(opaque(result(2020)))
+        self.assertFalse(opaque(result(2021)))
+        self.assertFalse(opaque(result(2020, home='Arsenal')))
+
+    def test_index_select(self) -> None:
+        results = [result(season, league) for season in range(2015, 2023) for league in ('A', 'B', 'C')]
+        index = ResultIndex(results)
+
+        for result_filter in [
+            ResultFilter(),
+            ResultFilter(first_season=2020),
+            ResultFilter(last_season=2016, leagues=frozenset(['B', 'D'])),
+            ResultFilter(2017, 2019, frozenset(['A', 'C'])),
+            ResultFilter(leagues=frozenset(['C']), teams=frozenset(['Arsenal'])),
+        ]:
+            self.assertEqual(index.select(result_filter), [r for r in results if result_filter(r)])
+
+        # Arbitrary filters are checked against every result
+        self.assertEqual(index.select(lambda r: r.season == 2018), [r for r in results if r.season == 2018])
+
+    @responses.activate
+    def test_pushed_down_when_loading(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv',
+                      body="".join(synthetic_csv(SyntheticDataset(leagues=2, seasons=3))))
+        result_filter = ResultFilter(first_season=2017, leagues=frozenset(['Synthetic League 2']),
+                                     teams=frozenset([team_name(1, 0)]))
+
+        expected = [r for r in load_results('https://example.com/some.csv') if result_filter(r)]
+
+        self.assertEqual(len(expected), 2 * 2 * 19)
+        self.assertEqual(load_results('https://example.com/some.csv', result_filter), expected)
+        self.assertEqual(load_results('https://example.com/some.csv', result_filter, processes=2), expected)
+        self.assertEqual(training_results('https://example.com/some.csv', 2018, result_filter),
+                         [r for r in expected if r.season < 2018])
+
+        as_of = ResultFilter(before_day=date(2017, 10, 1))
+        expected_as_of = [r for r in load_results('https://example.com/some.csv') if as_of(r)]
+        self.assertEqual(load_results('https://example.com/some.csv', as_of), expected_as_of)
+        self.assertEqual(load_results('https://example.com/some.csv', as_of, processes=2), expected_as_of)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+from matchpredictor.matchresults.partitioned_results_store import PartitionedResultsStore
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.result_timeline import NO_DAY, ResultTimeline, day_date, parse_day
+from matchpredictor.matchresults.results_delta import fetch_delta
+from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.sqlite_results_store import SqliteResultsStore
+
+SOURCE = 'https://example.com/some.csv'
+
+
+def result(day: date, home: str = 'Chelsea') -> Result:
+    return Result(Fixture(Team(home), Team('Burnley'), 'Premier League'), Outcome.HOME, 1, 0, day.year, day)
+
+
+class TestResultTimeline(TestCase):
+    def test_parse_day(self) -> None:
+        self.assertEqual(day_date(parse_day('2022-08-05')), date(2022, 8, 5))
+        for text in ['', None, '05/08/2022']:
+            self.assertEqual(parse_day(text), NO_DAY)
+        self.assertIsNone(day_date(NO_DAY))
+
+    def test_as_of(self) -> None:
+        results = [
+            result(date(2022, 8, 6)), result(date(2022, 8, 5), 'Arsenal'), result(date(2022, 8, 6), 'Everton'),
+            Result(Fixture(Team('Roma'), Team('Lazio'), 'Serie A'), Outcome.DRAW, 0, 0, 2022),
+            result(date(2022, 8, 13)),
+        ]
+        timeline = ResultTimeline(results)
+
+        self.assertEqual(timeline.as_of(date(2022, 8, 5)), [])
+        self.assertEqual(timeline.as_of(date(2022, 8, 6)), [results[1]])
+        # Results without a date are not indexed, and those of a day keep their order
+        self.assertEqual([r.fixture.home_team.name for r in timeline.as_of(date(2022, 8, 7))],
+                         ['Arsenal', 'Chelsea', 'Everton'])
+        self.assertEqual(len(timeline.as_of(date(2023, 1, 1))), 4)
+        self.assertEqual(timeline.on(date(2022, 8, 6)), [results[0], results[2]])
+        self.assertEqual(timeline.match_days(), [date(2022, 8, 5), date(2022, 8, 6), date(2022, 8, 13)])
+
+    @responses.activate
+    def test_dates_are_kept(self) -> None:
+        responses.add(method='GET', url=SOURCE, body="".join(synthetic_csv(SyntheticDataset(rows=100))))
+        expected = [r.date for r in load_results(SOURCE)]
+        self.assertEqual(expected[0], date(2016, 8, 1))
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for store in [SqliteResultsStore(os.path.join(directory.name, 'results.sqlite')),
+                      PartitionedResultsStore(os.path.join(directory.name, 'results'))]:
+            self.assertEqual([r.date for r in load_results(SOURCE, store=store)], expected)
+
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+        self.assertEqual([r.date for r in delta.results], expected)
+        self.assertEqual([r.date for r in load_results(SOURCE, processes=2)], expected)
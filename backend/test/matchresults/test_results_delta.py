@@ -0,0 +1,157 @@
+import hashlib
+import os
+import tempfile
+from typing import Dict, List, Tuple
+from unittest import TestCase
+
+import responses
+from requests import PreparedRequest
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+from matchpredictor.matchresults.results_delta import ResultsCursor, ResultsDelta, fetch_delta
+from matchpredictor.matchresults.results_provider import load_results, results_version
+from matchpredictor.matchresults.sqlite_results_store import SqliteResultsStore
+
+SOURCE = 'https://example.com/some.csv'
+
+HEADER = 'season,date,league,team1,team2,score1,score2\n'
+
+
+def synthetic(rows: int) -> str:
+    return "".join(synthetic_csv(SyntheticDataset(rows=rows)))
+
+
+class TestResultsDelta(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.body = ''
+        self.supports_ranges = True
+        self.ranges: List[str] = []
+        responses.start()
+        self.addCleanup(responses.stop)
+        self.addCleanup(responses.reset)
+        responses.add_callback(responses.GET, SOURCE, callback=self.serve)
+
+    def serve(self, request: PreparedRequest) -> Tuple[int, Dict[str, str], bytes]:
+        # Serves the body as a static file server does, with an entity tag and byte ranges
+        body = self.body.encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:8]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return 304, {}, b''
+
+        requested = request.headers.get('Range')
+        if requested is None or not self.supports_ranges:
+            return 200, {'ETag': etag}, body
+        self.ranges.append(requested)
+        start = int(requested[len('bytes='):-1])
+        if start >= len(body):
+            return 416, {}, b''
+        return 206, {'ETag': etag}, body[start:]
+
+    def fetch(self, cursor: ResultsCursor) -> ResultsDelta:
+        delta = fetch_delta(SOURCE, cursor)
+        assert delta is not None
+        return delta
+
+    def test_fetch_added_results(self) -> None:
+        self.body = synthetic(50)
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+        self.assertTrue(delta.reset)
+        self.assertEqual(delta.results, load_results(SOURCE))
+        self.assertEqual(delta.cursor.offset, len(self.body))
+
+        self.body = synthetic(80)
+        added = self.fetch(delta.cursor)
+        self.assertFalse(added.reset)
+        self.assertEqual(len(added.results), 30)
+        self.assertEqual(added.apply(delta.results), load_results(SOURCE))
+        # Only the last line loaded and what follows it were fetched
+        self.assertEqual(self.ranges, [f'bytes={len(synthetic(49))}-'])
+
+    def test_fetch_added_results_without_ranges(self) -> None:
+        self.supports_ranges = False
+        self.body = synthetic(50)
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+
+        self.body = synthetic(80)
+        added = self.fetch(delta.cursor)
+        self.assertFalse(added.reset)
+        self.assertEqual(added.apply(delta.results), load_results(SOURCE))
+
+    def test_fetch_unmodified(self) -> None:
+        self.body = synthetic(50)
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+
+        unmodified = self.fetch(delta.cursor)
+        self.assertEqual(unmodified, ResultsDelta([], False, delta.cursor))
+        self.assertEqual(self.ranges, [])
+
+    def test_fetch_rewritten(self) -> None:
+        self.body = synthetic(50)
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+
+        # A file that changed before the cursor, or that is shorter, is loaded again from the start
+        for body in ["".join(synthetic_csv(SyntheticDataset(rows=60, seed=1))), synthetic(10)]:
+            self.body = body
+            rewritten = self.fetch(delta.cursor)
+            self.assertTrue(rewritten.reset)
+            self.assertEqual(rewritten.apply(delta.results), load_results(SOURCE))
+
+    def test_fetch_results_of_matches_played_since(self) -> None:
+        self.body = HEADER + '2022,2022-08-01,L,A,B,1,0\n2022,2022-08-02,L,C,D,,\n2022,2022-08-03,L,E,F,2,2\n'
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+        self.assertEqual(len(delta.results), 2)
+        # The cursor stops at the match not played yet
+        self.assertEqual(delta.cursor.offset, len(HEADER + '2022,2022-08-01,L,A,B,1,0\n'))
+
+        self.body = HEADER + '2022,2022-08-01,L,A,B,1,0\n2022,2022-08-02,L,C,D,0,3\n2022,2022-08-03,L,E,F,2,2\n' \
+                             '2022,2022-08-04,L,G,H,1,1\n'
+        played = self.fetch(delta.cursor)
+        self.assertFalse(played.reset)
+        self.assertEqual([r.fixture.home_team.name for r in played.results], ['C', 'G'])
+        # The results of matches played late follow those already loaded
+        self.assertCountEqual(played.apply(delta.results), load_results(SOURCE))
+        self.assertEqual(played.cursor.offset, len(self.body))
+        self.assertEqual(played.cursor.pending, frozenset())
+
+    def test_load_results_with_store(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = SqliteResultsStore(os.path.join(directory.name, 'results.sqlite'), max_age=0)
+
+        self.body = synthetic(50)
+        self.assertEqual(load_results(SOURCE, store=store), load_results(SOURCE))
+        self.body = synthetic(80)
+        self.assertEqual(load_results(SOURCE, store=store), load_results(SOURCE))
+        self.assertEqual(self.ranges, [f'bytes={len(synthetic(49))}-'])
+
+    def test_load_results_played_late_with_store(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = SqliteResultsStore(os.path.join(directory.name, 'results.sqlite'), max_age=0)
+
+        self.body = HEADER + '2022,2022-08-01,L,A,B,1,0\n2022,2022-08-02,L,C,D,,\n2022,2022-08-03,L,E,F,2,2\n'
+        load_results(SOURCE, store=store)
+        self.body = HEADER + '2022,2022-08-01,L,A,B,1,0\n2022,2022-08-02,L,C,D,0,3\n2022,2022-08-03,L,E,F,2,2\n'
+        loaded = load_results(SOURCE, store=store)
+
+        # The result played late follows those loaded before it, but the models trained on the results are the
+        # same as if they were loaded at once
+        self.assertNotEqual(loaded, load_results(SOURCE))
+        self.assertEqual(results_version(loaded), results_version(load_results(SOURCE)))
+
+    def test_fetch_missing(self) -> None:
+        self.body = 'not found\n'
+        self.assertIsNone(fetch_delta(SOURCE))
+
+    def test_cursor_to_json(self) -> None:
+        self.body = HEADER + '2022,2022-08-01,L,A,B,,\n2022,2022-08-03,L,É,F,2,2'
+        delta = fetch_delta(SOURCE)
+        assert delta is not None
+        self.assertEqual(len(delta.cursor.pending), 1)
+        self.assertEqual(ResultsCursor.from_json(delta.cursor.to_json()), delta.cursor)
@@ -1,9 +1,12 @@
+from typing import List
 from unittest import TestCase
 
 import responses
 
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+from matchpredictor.evaluation.evaluator import traced_peak_memory
 from matchpredictor.matchresults.result import Result, Fixture, Team, Outcome
-from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.results_provider import csv_lines, load_results, results_version
 
 
 class TestResultsProvider(TestCase):
@@ -64,3 +67,36 @@ class TestResultsProvider(TestCase):
 
         self.assertEqual(0, len(results))
 
+    @responses.activate
+    def test_load_results_streams(self) -> None:
+        body = "".join(synthetic_csv(SyntheticDataset(seasons=40))).encode()
+        responses.add(method='GET', url='https://example.com/some.csv', body=body, content_type='text/csv')
+        responses.add(method='GET', url='https://example.com/small.csv', body=body[:2000], content_type='text/csv')
+
+        # Load a small CSV first, so that the one-off allocations of the first request are not measured
+        load_results('https://example.com/small.csv')
+        results: List[Result] = []
+        peak = traced_peak_memory(lambda: results.extend(
+            load_results('https://example.com/some.csv', lambda r: r.season == 2016)))
+
+        # Reading the whole body, then splitting it into lines, took several times the size of the CSV
+        self.assertEqual(len(results), 380)
+        self.assertLess(peak, len(body) / 2)
+
+    def test_csv_lines(self) -> None:
+        # A line, a character and a quoted field split across chunks
+        accented = 'ético'.encode()
+        chunks = [b'season,team1\r\n2016,Atl', accented[:1], accented[1:] + b'\n2017,"Split', b'\nName"']
+
+        self.assertEqual(list(csv_lines(chunks)), [
+            'season,team1\r\n', '2016,Atlético\n', '2017,"Split\n', 'Name"',
+        ])
+
+    def test_results_version(self) -> None:
+        result = Result(Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League'), Outcome.HOME, 2, 0, 2021)
+        other = Result(Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League'), Outcome.DRAW, 1, 1, 2021)
+
+        self.assertEqual(len(results_version([result])), 12)
+        self.assertEqual(results_version([result]), results_version([result]))
+        self.assertNotEqual(results_version([result]), results_version([other]))
+        self.assertEqual(results_version([result, other]), results_version([other, result]))
@@ -0,0 +1,65 @@
+import sqlite3
+from contextlib import closing
+
+import responses
+
+from fakecsvprovider.synthetic_csv import SyntheticDataset, synthetic_csv
+from matchpredictor.matchresults.results_provider import load_results
+
+from matchpredictor.matchresults.result_filter import ResultFilter
+from matchpredictor.matchresults.results_store import DEFAULT_MAX_AGE
+from matchpredictor.matchresults.sqlite_results_store import SqliteResultsStore
+from test.matchresults import results_store_contract
+from test.matchresults.results_store_contract import SOURCE, result
+
+
+class TestSqliteResultsStore(results_store_contract.ResultsStoreContract):
+    def open_store(self, max_age: float = DEFAULT_MAX_AGE) -> SqliteResultsStore:
+        return SqliteResultsStore(f'{self.path}.sqlite', max_age)
+
+    def test_ingest_and_select(self) -> None:
+        store = self.open_store()
+        results = [
+            result(2020), result(2021, 'Serie A', 'Roma', 'Lazio'), result(2022, away='Arsenal'),
+            result(2022, home='Arsenal', away='Chelsea'),
+        ]
+
+        self.assertFalse(store.is_fresh(SOURCE))
+        self.assertTrue(store.ingest(SOURCE, lambda: results))
+        self.assertTrue(store.is_fresh(SOURCE))
+
+        self.assertEqual(store.select(SOURCE), results)
+        for result_filter in [
+            ResultFilter(first_season=2021),
+            ResultFilter(last_season=2021, leagues=frozenset(['Serie A'])),
+            ResultFilter(teams=frozenset(['Arsenal'])),
+            ResultFilter(2022, 2022, frozenset(['Premier League']), frozenset(['Burnley', 'Arsenal'])),
+        ]:
+            self.assertEqual(store.select(SOURCE, result_filter), [r for r in results if result_filter(r)])
+        # Arbitrary filters are checked against every result of the source
+        self.assertEqual(store.select(SOURCE, lambda r: r.home_goals > 0 and r.season == 2020), [result(2020)])
+        self.assertEqual(store.select('https://example.com/other.csv'), [])
+
+    def test_queries_use_the_indexes(self) -> None:
+        self.open_store()
+
+        with closing(sqlite3.connect(f'{self.path}.sqlite')) as connection:
+            for condition in ["season >= 2020", "league IN ('Serie A')", "home_team = 'Roma' OR away_team = 'Roma'",
+                              "day < 737000"]:
+                plan = connection.execute(
+                    f"EXPLAIN QUERY PLAN SELECT * FROM results WHERE source = 'x' AND ({condition})").fetchall()
+                self.assertIn('USING INDEX', ' '.join(row[-1] for row in plan))
+
+    @responses.activate
+    def test_load_dates_into_a_store_created_without_them(self) -> None:
+        responses.add(method='GET', url=SOURCE, body="".join(synthetic_csv(SyntheticDataset(rows=50))))
+        load_results(SOURCE, store=self.open_store())
+        # Turn the store into one created before the days were kept
+        with closing(sqlite3.connect(f'{self.path}.sqlite')) as connection:
+            connection.execute("DROP INDEX results_day")
+            connection.execute("ALTER TABLE results DROP COLUMN day")
+
+        results = load_results(SOURCE, store=self.open_store())
+
+        self.assertEqual(results, load_results(SOURCE))
+        self.assertTrue(all(r.date is not None for r in results))
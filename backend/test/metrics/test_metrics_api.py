@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.app import create_app
+from test.test_builders import build_app_environment
+
+
+class TestMetricsApi(TestCase):
+    @responses.activate
+    def setUp(self) -> None:
+        super().setUp()
+
+        responses.add(
+            method='GET',
+            url='https://example.com/some.csv',
+            status=200,
+            body="""season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2021,2020-11-13,0000,Test League,Always Scores,Rarely Scores,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,90,0,0.49,0.45,1.05,0.75,3.15,0.0
+2021,2020-11-14,0000,Test League,Other,Another,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,1,1,0.49,0.45,1.05,0.75,3.15,0.0"""
+        )
+
+        app = create_app(build_app_environment())
+        self.test_client = app.test_client()
+
+    def test_metrics(self) -> None:
+        self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home'
+        )
+
+        response = self.test_client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        metrics = response.get_data(as_text=True).splitlines()
+        self.assertIn('http_requests_total{endpoint="/forecast",method="GET",status="200"} 1', metrics)
+        self.assertIn('forecast_duration_seconds_count{model="Home",kind="forecast"} 1', metrics)
+        self.assertIn('dataset_rows{dataset="training"} 2', metrics)
+        self.assertIn('cache_hits_total{cache="upcoming_forecasts"} 0', metrics)
+        self.assertTrue(any(line.startswith('model_training_duration_seconds{model="Full simulator"}')
+                            for line in metrics))
+        self.assertTrue(any(line.startswith('process_resident_memory_bytes ') for line in metrics))
+
+    def test_metrics__counter_families_are_named_as_their_samples(self) -> None:
+        metrics = self.test_client.get('/metrics').get_data(as_text=True).splitlines()
+
+        self.assertIn('# TYPE http_requests_total counter', metrics)
+        self.assertIn('# TYPE cache_hits_total counter', metrics)
+        self.assertIn('# TYPE process_cpu_seconds_total counter', metrics)
+        # In the text format, the samples of a counter are named exactly as its family
+        family = ''
+        for line in metrics:
+            if line.startswith('# TYPE '):
+                family = line.split()[2] if line.endswith(' counter') else ''
+            elif family and not line.startswith('#'):
+                self.assertEqual(line.split('{')[0].split(' ')[0], family)
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from matchpredictor.metrics.registry import MetricFamily, MetricsRegistry, Sample
+
+
+class TestMetricsRegistry(TestCase):
+    def test_render__counter_and_gauge(self) -> None:
+        registry = MetricsRegistry()
+        requests = registry.counter("http_requests", "Requests served", ("endpoint",))
+        rows = registry.gauge("dataset_rows", "Rows loaded")
+
+        requests.inc(endpoint="/forecast")
+        requests.inc(2, endpoint="/forecast")
+        rows.set(1234)
+
+        self.assertEqual(registry.render(), "\n".join([
+            '# HELP http_requests_total Requests served',
+            '# TYPE http_requests_total counter',
+            'http_requests_total{endpoint="/forecast"} 3',
+            '# HELP dataset_rows Rows loaded',
+            '# TYPE dataset_rows gauge',
+            'dataset_rows 1234',
+        ]) + "\n")
+
+    def test_render__histogram(self) -> None:
+        registry = MetricsRegistry()
+        durations = registry.histogram("duration_seconds", "Durations", ("model",), buckets=(0.1, 1))
+
+        durations.observe(0.05, model="Home")
+        durations.observe(0.5, model="Home")
+        durations.observe(5, model="Home")
+
+        self.assertEqual(registry.render().splitlines()[2:], [
+            'duration_seconds_bucket{model="Home",le="0.1"} 1',
+            'duration_seconds_bucket{model="Home",le="1"} 2',
+            'duration_seconds_bucket{model="Home",le="+Inf"} 3',
+            'duration_seconds_sum{model="Home"} 5.55',
+            'duration_seconds_count{model="Home"} 3',
+        ])
+
+    def test_render__collector_and_escaping(self) -> None:
+        registry = MetricsRegistry()
+        registry.collector(lambda: [
+            MetricFamily("model_info", "gauge", "Models", [Sample("model_info", {"model": 'Say "hi"'}, 1)])
+        ])
+
+        self.assertIn('model_info{model="Say \\"hi\\""} 1', registry.render())
@@ -55,3 +55,18 @@ class TestScoringRates(TestCase):
 
         self.assertEqual(1, rates.defensive_factor(Team("Not in the results")))
         self.assertEqual(1 / 90, rates.goals_scored_per_minute(Team("Not in the results")))
+
+    def test_remove_result(self) -> None:
+        kept = Result(Fixture(Team("Chelsea"), Team("Liverpool"), "England"), Outcome.HOME, 4, 2, 2022)
+        removed = Result(Fixture(Team("Chelsea"), Team("Burnley"), "England"), Outcome.DRAW, 3, 3, 2021)
+
+        rates = ScoringRates([removed, kept])
+        copy = rates.copy()
+        rates.remove_result(removed)
+
+        expected = ScoringRates([kept])
+        self.assertEqual(rates.scoring_dict, expected.scoring_dict)
+        self.assertEqual((rates.total_goals, rates.total_matches), (expected.total_goals, expected.total_matches))
+        self.assertEqual(1, rates.defensive_factor(Team("Burnley")))
+        # Copies are not affected
+        self.assertEqual(3 / 90, copy.goals_scored_per_minute(Team("Burnley")))
@@ -0,0 +1,52 @@
+import time
+from itertools import cycle
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Scenario, Team
+from matchpredictor.predictors.simulation_predictor import SimulationPredictor, SIMULATION_BATCH, wilson_interval
+
+fixture = Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')
+scenario = Scenario(minutes_elapsed=0, home_goals=0, away_goals=0)
+
+
+class TestSimulationPredictor(TestCase):
+    def test_predict_in_progress_within__runs_all_simulations_within_a_generous_budget(self) -> None:
+        outcomes = cycle([Outcome.HOME, Outcome.HOME, Outcome.AWAY, Outcome.DRAW])
+        predictor = SimulationPredictor(lambda f, s: next(outcomes), 1_000)
+
+        prediction = predictor.predict_in_progress_within(fixture, scenario, time.monotonic() + 60)
+
+        self.assertEqual(prediction.outcome, Outcome.HOME)
+        self.assertEqual(prediction.confidence, 0.5)
+        self.assertEqual(prediction.simulations, 1_000)
+        assert prediction.confidence_interval is not None
+        lower, upper = prediction.confidence_interval
+        self.assertLess(lower, 0.5)
+        self.assertGreater(upper, 0.5)
+
+    def test_predict_in_progress_within__runs_one_batch_past_the_deadline(self) -> None:
+        predictor = SimulationPredictor(lambda f, s: Outcome.AWAY, 10_000)
+
+        prediction = predictor.predict_in_progress_within(fixture, scenario, time.monotonic() - 1)
+
+        self.assertEqual(prediction.outcome, Outcome.AWAY)
+        self.assertEqual(prediction.simulations, SIMULATION_BATCH)
+
+    def test_predict_in_progress__matches_the_budgeted_prediction(self) -> None:
+        def predictor() -> SimulationPredictor:
+            outcomes = cycle([Outcome.AWAY, Outcome.DRAW, Outcome.AWAY, Outcome.HOME, Outcome.AWAY])
+            return SimulationPredictor(lambda f, s: next(outcomes), 500)
+
+        prediction = predictor().predict_in_progress(fixture, scenario)
+        budgeted = predictor().predict_in_progress_within(fixture, scenario, time.monotonic() + 60)
+
+        self.assertEqual(budgeted.simulations, 500)
+        self.assertEqual(prediction.outcome, budgeted.outcome)
+        self.assertEqual(prediction.confidence, budgeted.confidence)
+        self.assertEqual(predictor().predict(fixture), prediction)
+
+    def test_wilson_interval(self) -> None:
+        lower, upper = wilson_interval(50, 100)
+        self.assertAlmostEqual(lower, 0.4038, places=4)
+        self.assertAlmostEqual(upper, 0.5962, places=4)
+        self.assertEqual(wilson_interval(10, 10)[1], 1.0)
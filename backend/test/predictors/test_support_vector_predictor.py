@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.predictors.support_vector_predictor import train_random_support_vector_predictor
+
+
+def result(home: str, away: str, home_goals: int, away_goals: int) -> Result:
+    if home_goals > away_goals:
+        outcome = Outcome.HOME
+    elif away_goals > home_goals:
+        outcome = Outcome.AWAY
+    else:
+        outcome = Outcome.DRAW
+
+    return Result(
+        fixture=Fixture(Team(home), Team(away), 'Some league'),
+        outcome=outcome,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        season=2022,
+    )
+
+
+class TestSupportVectorPredictor(TestCase):
+    predictor = train_random_support_vector_predictor([
+        result('Strong', 'Weak', 3, 0),
+        result('Weak', 'Strong', 0, 2),
+        result('Strong', 'Middling', 2, 1),
+        result('Middling', 'Weak', 1, 1),
+        result('Weak', 'Middling', 0, 1),
+    ])
+
+    def test_predict_all__matches_predict(self) -> None:
+        fixtures = [
+            Fixture(Team('Strong'), Team('Weak'), 'Some league'),
+            Fixture(Team('Weak'), Team('Strong'), 'Some league'),
+            Fixture(Team('Unknown'), Team('Strong'), 'Some league'),
+            Fixture(Team('Middling'), Team('Unknown'), 'Some league'),
+            Fixture(Team('Middling'), Team('Strong'), 'Some league'),
+        ]
+
+        predictions = self.predictor.predict_all(fixtures)
+
+        self.assertEqual([self.predictor.predict(f) for f in fixtures], predictions)
+        self.assertEqual(Outcome.AWAY, predictions[2].outcome)
+        self.assertEqual(Outcome.HOME, predictions[3].outcome)
+
+    def test_predict_all__no_fixtures(self) -> None:
+        self.assertEqual([], self.predictor.predict_all([]))
@@ -0,0 +1,102 @@
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.app import create_app
+from test.test_builders import build_app_environment
+
+CSV = """season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2021,2020-11-13,0000,Test League,Always Scores,Rarely Scores,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,90,0,0.49,0.45,1.05,0.75,3.15,0.0
+2021,2020-11-14,0000,Test League,Other,Another,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,1,1,0.49,0.45,1.05,0.75,3.15,0.0"""
+
+
+class TestProfilingApi(TestCase):
+    @responses.activate
+    def setUp(self) -> None:
+        super().setUp()
+
+        responses.add(
+            method='GET',
+            url='https://example.com/some.csv',
+            status=200,
+            body=CSV,
+        )
+
+        app = create_app(build_app_environment(profiling_token='secret'))
+        self.test_client = app.test_client()
+
+    def test_forecast_without_token(self) -> None:
+        response = self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home',
+            headers={'X-Profile-Token': 'wrong', 'X-Profile': 'cprofile'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response.headers)
+        self.assertNotIn('X-Profile-Id', response.headers)
+
+    def test_forecast_span_timings(self) -> None:
+        response = self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home',
+            headers={'X-Profile-Token': 'secret'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        stages = [timing.split(';')[0] for timing in response.headers['Server-Timing'].split(', ')]
+        self.assertEqual(stages, ['parse', 'forecast', 'model_lookup', 'predict', 'serialize'])
+
+    def test_forecast_cprofile(self) -> None:
+        response = self.test_client.get(
+            '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home',
+            headers={'X-Profile-Token': 'secret', 'X-Profile': 'cprofile'},
+        )
+
+        profile = self.test_client.get(
+            f"/admin/profiles/{response.headers['X-Profile-Id']}",
+            headers={'X-Profile-Token': 'secret'},
+        )
+
+        self.assertEqual(profile.status_code, 200)
+        self.assertIn('forecast', profile.get_data(as_text=True))
+
+    def test_admin_requires_token(self) -> None:
+        self.assertEqual(self.test_client.get('/admin/profiles/1').status_code, 403)
+        self.assertEqual(self.test_client.post('/admin/profile?seconds=0').status_code, 403)
+        self.assertEqual(self.test_client.get('/admin/tracemalloc').status_code, 403)
+
+    def test_sampling_window(self) -> None:
+        response = self.test_client.post('/admin/profile?seconds=0.05', headers={'X-Profile-Token': 'secret'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/plain')
+
+    def test_tracemalloc(self) -> None:
+        headers = {'X-Profile-Token': 'secret'}
+        self.assertEqual(self.test_client.get('/admin/tracemalloc', headers=headers).status_code, 409)
+
+        started = self.test_client.post('/admin/tracemalloc', headers=headers)
+        try:
+            self.assertEqual(started.get_json(), {'tracing': True})
+            snapshot = self.test_client.get('/admin/tracemalloc?limit=5', headers=headers)
+            self.assertEqual(snapshot.status_code, 200)
+            self.assertLessEqual(len(snapshot.get_json()['top']), 5)
+        finally:
+            stopped = self.test_client.delete('/admin/tracemalloc', headers=headers)
+
+        self.assertEqual(stopped.get_json(), {'tracing': False})
+
+    def test_tracemalloc__invalid_frames(self) -> None:
+        headers = {'X-Profile-Token': 'secret'}
+
+        for frames in ['0', '-1', '65536']:
+            response = self.test_client.post(f'/admin/tracemalloc?frames={frames}', headers=headers)
+            self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.test_client.get('/admin/tracemalloc', headers=headers).status_code, 409)
+
+    def test_disabled_without_token(self) -> None:
+        with responses.RequestsMock() as mock:
+            mock.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+            app = create_app(build_app_environment())
+
+        self.assertEqual(app.test_client().get('/admin/tracemalloc').status_code, 404)
@@ -0,0 +1,40 @@
+import threading
+from unittest import TestCase
+
+from matchpredictor.profiling.sampling_profiler import collapsed_stacks, sample_stacks
+from matchpredictor.profiling.spans import SpanTiming, recording_spans, server_timing, span
+
+
+class TestSpans(TestCase):
+    def test_span__records_only_when_recording(self) -> None:
+        with span("ignored"):
+            pass
+
+        with recording_spans() as spans:
+            with span("outer"):
+                with span("inner"):
+                    pass
+
+        with span("ignored"):
+            pass
+
+        self.assertEqual([s.name for s in spans], ["inner", "outer"])
+
+    def test_server_timing(self) -> None:
+        self.assertEqual(
+            server_timing([SpanTiming("predict", 2.0, 0.0125), SpanTiming("parse", 1.0, 0.001)]),
+            "parse;dur=1.000, predict;dur=12.500",
+        )
+
+    def test_sample_stacks(self) -> None:
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait, name="waiting")
+        thread.start()
+        try:
+            stacks = sample_stacks(0.05, interval=0.001)
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertTrue(any("wait (" in stack for stack in stacks))
+        self.assertTrue(collapsed_stacks(stacks).endswith("\n"))
@@ -0,0 +1,78 @@
+import subprocess
+import sys
+from typing import Any, Dict, cast
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.app import create_app
+from matchpredictor.profiling.spans import SpanTiming
+from matchpredictor.profiling.startup_timeline import StartupPhase, startup_timeline
+from test.test_builders import build_app_environment
+
+CSV = """season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2021,2020-11-13,0000,Test League,Always Scores,Rarely Scores,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,90,0,0.49,0.45,1.05,0.75,3.15,0.0
+2021,2020-11-14,0000,Test League,Other,Another,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,1,1,0.49,0.45,1.05,0.75,3.15,0.0"""
+
+
+class TestStartupApi(TestCase):
+    @responses.activate
+    def test_startup(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+        app = create_app(build_app_environment(model_names=['Home', 'Points']))
+
+        response = app.test_client().get('/startup')
+
+        self.assertEqual(response.status_code, 200)
+        startup = cast(Dict[str, Any], response.get_json())['startup']
+        phases = [(phase['name'], phase['attributes'].get('model')) for phase in startup['phases']]
+        self.assertEqual(phases, [
+            ('import', None),
+            ('load_results', None),
+            ('fetch_results', None),
+            ('parse_results', None),
+            ('train', 'Home'),
+            ('train', 'Points'),
+            ('register_blueprints', None),
+        ])
+        self.assertGreaterEqual(startup['total_ms'], sum(phase['duration_ms'] for phase in startup['phases'][:2]))
+
+    @responses.activate
+    def test_only_serves_the_selected_models(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+        app = create_app(build_app_environment(model_names=['Home']))
+
+        response = app.test_client().get('/models')
+
+        self.assertEqual([model['name'] for model in cast(Dict[str, Any], response.get_json())['models']], ['Home'])
+
+    @responses.activate
+    def test_unknown_models(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+
+        with self.assertRaisesRegex(ValueError, 'Unknown models: Nope'):
+            create_app(build_app_environment(model_names=['Home', 'Nope']))
+
+    def test_defers_scikit_learn(self) -> None:
+        # A fresh interpreter, as the tests of the support vector predictor import scikit-learn in this one
+        imported = subprocess.run(
+            [sys.executable, '-c', 'import sys, matchpredictor.app; print("sklearn" in sys.modules)'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+        self.assertEqual(imported, 'False')
+
+
+class TestStartupTimeline(TestCase):
+    def test_startup_timeline(self) -> None:
+        timeline = startup_timeline(10.0, 10.5, 13.0, [
+            SpanTiming('train', 11.0, 1.5, {'model': 'Home'}),
+            SpanTiming('load_results', 10.5, 0.5),
+        ])
+
+        self.assertEqual(timeline.total_ms, 3000.0)
+        self.assertEqual(timeline.phases, [
+            StartupPhase('import', 0.0, 500.0),
+            StartupPhase('load_results', 500.0, 500.0),
+            StartupPhase('train', 1000.0, 1500.0, {'model': 'Home'}),
+        ])
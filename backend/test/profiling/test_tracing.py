@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.app import AppEnvironment, create_app
+from matchpredictor.profiling.spans import span
+from matchpredictor.profiling.tracing import JsonLinesExporter, SpanContext, Tracer, current_tracer, exporter_for, \
+    format_traceparent, parse_traceparent, using_tracer
+from test.profiling.test_profiling_api import CSV
+
+
+def exported(stream: io.StringIO) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestTracing(TestCase):
+    def test_parse_traceparent(self) -> None:
+        header = '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+
+        self.assertEqual(
+            parse_traceparent(header),
+            SpanContext('4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7', sampled=True),
+        )
+        self.assertEqual(format_traceparent(SpanContext('4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7')),
+                         header)
+        unsampled = parse_traceparent(header[:-1] + '0')
+        self.assertFalse(unsampled is None or unsampled.sampled)
+        self.assertIsNone(parse_traceparent('00-00000000000000000000000000000000-00f067aa0ba902b7-01'))
+        self.assertIsNone(parse_traceparent('garbage'))
+        self.assertIsNone(parse_traceparent(None))
+
+    def test_spans_nest_and_export(self) -> None:
+        stream = io.StringIO()
+        with using_tracer(Tracer(JsonLinesExporter(stream))):
+            with span("outer"):
+                with span("inner", model="Home"):
+                    pass
+
+        inner, outer = exported(stream)
+        self.assertEqual((inner['name'], outer['name']), ('inner', 'outer'))
+        self.assertEqual(inner['trace_id'], outer['trace_id'])
+        self.assertEqual(inner['parent_id'], outer['span_id'])
+        self.assertIsNone(outer['parent_id'])
+        self.assertEqual(inner['attributes'], {'model': 'Home'})
+
+    def test_spans_record_errors(self) -> None:
+        stream = io.StringIO()
+        with using_tracer(Tracer(JsonLinesExporter(stream))), self.assertRaises(ValueError):
+            with span("failing"):
+                raise ValueError("no")
+
+        self.assertEqual(exported(stream)[0]['error'], 'ValueError: no')
+
+    def test_unsampled_traces_are_not_exported(self) -> None:
+        stream = io.StringIO()
+        with using_tracer(Tracer(JsonLinesExporter(stream), sample_ratio=0)):
+            with span("outer"):
+                with span("inner"):
+                    pass
+
+        self.assertEqual(exported(stream), [])
+
+    def test_exporter_closes_the_file_it_opened(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            trace_file = os.path.join(directory, 'spans.jsonl')
+            tracer = Tracer(exporter_for(trace_file))
+
+            with using_tracer(tracer):
+                with span("before"):
+                    pass
+                tracer.close()
+                # Spans that end once the exporter is closed are dropped
+                with span("after"):
+                    pass
+
+            with open(trace_file) as spans_file:
+                self.assertEqual([json.loads(line)['name'] for line in spans_file], ['before'])
+
+        exporter_for('stdout').close()
+        self.assertFalse(sys.stdout.closed)
+
+    @responses.activate
+    def test_requests_continue_incoming_traces(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+        with tempfile.TemporaryDirectory() as directory:
+            trace_file = os.path.join(directory, 'spans.jsonl')
+            app = create_app(AppEnvironment('https://example.com/some.csv', 2023, 'key', trace_export=trace_file))
+
+            app.test_client().get(
+                '/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Home',
+                headers={'traceparent': '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'},
+            )
+
+            with open(trace_file) as spans_file:
+                spans = [json.loads(line) for line in spans_file]
+
+        startup = next(s for s in spans if s['name'] == 'startup')
+        trainings = [s for s in spans if s['name'] == 'train']
+        self.assertEqual(len(trainings), 8)
+        self.assertTrue(all(s['trace_id'] == startup['trace_id'] for s in trainings))
+        self.assertIn('load_results', [s['name'] for s in spans if s['trace_id'] == startup['trace_id']])
+
+        request = next(s for s in spans if s['name'] == 'GET /forecast')
+        self.assertEqual(request['trace_id'], '4bf92f3577b34da6a3ce929d0e0e4736')
+        self.assertEqual(request['parent_id'], '00f067aa0ba902b7')
+        self.assertEqual(request['attributes']['http.status_code'], '200')
+        self.assertEqual(
+            {s['name'] for s in spans if s['trace_id'] == request['trace_id']},
+            {'GET /forecast', 'parse', 'forecast', 'model_lookup', 'predict', 'serialize'},
+        )
+
+    @responses.activate
+    def test_apps_trace_with_their_own_tracer(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+        with tempfile.TemporaryDirectory() as directory:
+            trace_file = os.path.join(directory, 'spans.jsonl')
+            create_app(AppEnvironment('https://example.com/some.csv', 2023, 'key', trace_export=trace_file))
+            # Creating a traced app does not turn on tracing outside of it
+            self.assertIsNone(current_tracer())
+
+            untraced = create_app(AppEnvironment('https://example.com/some.csv', 2023, 'key'))
+            untraced.test_client().get('/teams')
+
+            with open(trace_file) as spans_file:
+                names = [json.loads(line)['name'] for line in spans_file]
+
+        self.assertIn('startup', names)
+        self.assertNotIn('GET /teams', names)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from flask import Flask, jsonify, request, Response
+
+from matchpredictor.serving.asgi import AsgiAdapter, requests_model_in
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/echo", methods=["GET", "POST"])
+    def echo() -> Response:
+        return jsonify({
+            "method": request.method,
+            "args": request.args.getlist("name"),
+            "body": request.get_data(as_text=True),
+            "header": request.headers.get("X-Something"),
+        })
+
+    return app
+
+
+def receive_body(body_chunks: List[bytes]) -> Any:
+    incoming = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(body_chunks) - 1}
+        for i, chunk in enumerate(body_chunks)
+    ]
+
+    async def receive() -> Dict[str, Any]:
+        return incoming.pop(0)
+
+    return receive
+
+
+def call(adapter: AsgiAdapter, scope: Dict[str, Any], body_chunks: List[bytes]) -> List[Dict[str, Any]]:
+    sent: List[Dict[str, Any]] = []
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(adapter(scope, receive_body(body_chunks), send))
+    return sent
+
+
+class TestAsgiAdapter(TestCase):
+    adapter = AsgiAdapter(build_app(), threads=2)
+
+    def test_get(self) -> None:
+        sent = call(self.adapter, {
+            "type": "http",
+            "method": "GET",
+            "path": "/echo",
+            "query_string": b"name=Chelsea&name=Burnley",
+            "headers": [(b"x-something", b"a"), (b"x-something", b"b")],
+        }, [b""])
+
+        self.assertEqual("http.response.start", sent[0]["type"])
+        self.assertEqual(200, sent[0]["status"])
+        self.assertIn((b"content-type", b"application/json"), sent[0]["headers"])
+        self.assertEqual(
+            b'{"args":["Chelsea","Burnley"],"body":"","header":"a,b","method":"GET"}\n',
+            sent[1]["body"],
+        )
+
+    def test_post_with_chunked_body(self) -> None:
+        sent = call(self.adapter, {
+            "type": "http",
+            "method": "POST",
+            "path": "/echo",
+            "headers": [(b"content-type", b"text/plain")],
+        }, [b"hello ", b"world"])
+
+        self.assertEqual(200, sent[0]["status"])
+        self.assertIn(b'"body":"hello world"', sent[1]["body"])
+
+    def test_not_found(self) -> None:
+        sent = call(self.adapter, {"type": "http", "method": "GET", "path": "/missing"}, [b""])
+
+        self.assertEqual(404, sent[0]["status"])
+
+    def test_expensive_requests_do_not_hold_up_cheap_ones(self) -> None:
+        simulated = threading.Event()
+        app = Flask(__name__)
+
+        @app.route("/forecast")
+        def forecast() -> Response:
+            if request.args["model_name"] == "Simulator":
+                simulated.wait(timeout=5)
+            return jsonify({"model": request.args["model_name"]})
+
+        adapter = AsgiAdapter(app, threads=1, expensive_threads=1, is_expensive=requests_model_in({"Simulator"}))
+        statuses: List[int] = []
+
+        async def forecast_with(model_name: str) -> None:
+            async def send(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            scope = {"type": "http", "method": "GET", "path": "/forecast",
+                     "query_string": f"model_name={model_name}".encode()}
+            await adapter(scope, receive_body([b""]), send)
+
+        async def forecast_both() -> None:
+            simulation = asyncio.ensure_future(forecast_with("Simulator"))
+            # The only thread for the cheap models is free while the simulation waits
+            await asyncio.wait_for(forecast_with("Home"), timeout=2)
+            self.assertFalse(simulation.done())
+            simulated.set()
+            await simulation
+
+        asyncio.run(forecast_both())
+        self.assertEqual([200, 200], statuses)
+
+    def test_requests_model_in(self) -> None:
+        requests_model = requests_model_in({"Simulator"})
+
+        self.assertTrue(requests_model({"QUERY_STRING": "model_name=Home&model_name=Simulator"}))
+        self.assertFalse(requests_model({"QUERY_STRING": "model_name=Home"}))
+        self.assertFalse(requests_model({"QUERY_STRING": ""}))
@@ -0,0 +1,113 @@
+import multiprocessing
+import os
+import signal
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+from typing import Dict
+from unittest import TestCase
+
+import requests
+from flask import Flask, jsonify, Response
+
+from matchpredictor.serving.prefork_server import ServerSettings, ThreadPoolWSGIServer, serve, \
+    server_settings_from_env
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/pid")
+    def pid() -> Response:
+        return jsonify({"pid": os.getpid()})
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port: int = s.getsockname()[1]
+        return port
+
+
+def wait_until_serving(port: int) -> None:
+    for _ in range(100):
+        try:
+            requests.get(f"http://127.0.0.1:{port}/pid", timeout=1)
+            return
+        except requests.ConnectionError:
+            multiprocessing.Event().wait(0.05)
+    raise AssertionError("server did not start")
+
+
+class TestPreforkServer(TestCase):
+    def test_server_settings_from_env(self) -> None:
+        environ: Dict[str, str] = {"PORT": "5010", "WORKERS": "3", "THREADS": "16", "GRACEFUL_TIMEOUT": "2.5",
+                                   "QUEUE": "8"}
+
+        self.assertEqual(
+            ServerSettings(host="0.0.0.0", port=5010, workers=3, threads=16, keep_alive=5, graceful_timeout=2.5,
+                           queue=8),
+            server_settings_from_env(environ),
+        )
+
+    def test_thread_pool_server(self) -> None:
+        server = ThreadPoolWSGIServer("127.0.0.1", 0, build_app(), threads=2, keep_alive=1)
+        Thread(target=server.serve_forever).start()
+
+        try:
+            with requests.Session() as session:
+                responses = [session.get(f"http://127.0.0.1:{server.port}/pid", timeout=5) for _ in range(3)]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual([200, 200, 200], [r.status_code for r in responses])
+        self.assertEqual({os.getpid()}, {r.json()["pid"] for r in responses})
+
+    def test_thread_pool_server__sheds_connections_past_the_queue(self) -> None:
+        app = build_app()
+        release = Event()
+
+        @app.route("/slow")
+        def slow() -> str:
+            release.wait(10)
+            return "done"
+
+        server = ThreadPoolWSGIServer("127.0.0.1", 0, app, threads=1, keep_alive=1, queue=1)
+        Thread(target=server.serve_forever).start()
+        url = f"http://127.0.0.1:{server.port}/slow"
+
+        try:
+            # One request is handled and one waits for the thread, so the third is shed
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                in_flight = [executor.submit(requests.get, url, timeout=10) for _ in range(2)]
+                multiprocessing.Event().wait(0.5)
+                shed = requests.get(url, timeout=5)
+                release.set()
+                handled = [future.result() for future in in_flight]
+        finally:
+            release.set()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(503, shed.status_code)
+        self.assertEqual([200, 200], [r.status_code for r in handled])
+
+    def test_serve__forks_workers_and_stops_gracefully(self) -> None:
+        port = free_port()
+        settings = ServerSettings(host="127.0.0.1", port=port, workers=2, threads=2, keep_alive=0.1,
+                                  graceful_timeout=5)
+        master = multiprocessing.get_context("fork").Process(target=serve, args=(build_app(), settings))
+        master.start()
+
+        try:
+            wait_until_serving(port)
+            pids = {requests.get(f"http://127.0.0.1:{port}/pid", timeout=5).json()["pid"] for _ in range(20)}
+        finally:
+            os.kill(master.pid or 0, signal.SIGTERM)
+            master.join(10)
+
+        self.assertNotIn(master.pid, pids)
+        self.assertEqual(0, master.exitcode)
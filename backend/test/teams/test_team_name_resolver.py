@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Team
+from matchpredictor.teams.team_name_resolver import TeamNameResolver, normalize_team_name
+
+
+class TestTeamNameResolver(TestCase):
+    resolver = TeamNameResolver([
+        Team("Manchester United"),
+        Team("Manchester City"),
+        Team("Brighton and Hove Albion"),
+        Team("Wolverhampton"),
+        Team("Bayern Munich"),
+        Team("AS Roma"),
+        Team("Borussia Monchengladbach"),
+    ])
+
+    def test_normalize_team_name(self) -> None:
+        self.assertEqual("brighton and hove albion", normalize_team_name("Brighton & Hove Albion FC"))
+        self.assertEqual("borussia monchengladbach", normalize_team_name("Borussia Mönchengladbach"))
+        self.assertEqual("roma", normalize_team_name("AS Roma"))
+
+    def test_resolve__exact(self) -> None:
+        self.assertEqual(Team("Manchester City"), self.resolver.resolve("Manchester City"))
+
+    def test_resolve__normalized(self) -> None:
+        self.assertEqual(Team("Manchester United"), self.resolver.resolve("Manchester United FC"))
+        self.assertEqual(Team("Brighton and Hove Albion"), self.resolver.resolve("Brighton & Hove Albion FC"))
+        self.assertEqual(Team("AS Roma"), self.resolver.resolve("Roma"))
+
+    def test_resolve__alias(self) -> None:
+        self.assertEqual(Team("Bayern Munich"), self.resolver.resolve("FC Bayern München"))
+
+    def test_resolve__fuzzy(self) -> None:
+        self.assertEqual(Team("Wolverhampton"), self.resolver.resolve("Wolverhampton Wanderers"))
+        self.assertEqual(Team("Borussia Monchengladbach"), self.resolver.resolve("Borussia M'gladbach"))
+
+    def test_resolve__unknown(self) -> None:
+        self.assertIsNone(self.resolver.resolve("CDP Curicó Unido"))
+        self.assertIsNone(self.resolver.resolve("Manchester"))
+        self.assertEqual("CDP Curicó Unido", self.resolver.resolve_name("CDP Curicó Unido"))
+
+    def test_resolve__ambiguous_normalized_names(self) -> None:
+        resolver = TeamNameResolver([Team("Roma"), Team("AS Roma")])
+
+        self.assertEqual(Team("Roma"), resolver.resolve("Roma"))
+        self.assertIsNone(resolver.resolve("Roma FC"))
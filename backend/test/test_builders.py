@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from matchpredictor.app import AppEnvironment
 
 
@@ -5,5 +7,13 @@ def build_app_environment(
         csv_location: str = 'https://example.com/some.csv',
         season: int = 2023,
         football_data_api_key: str = 'football-data-key-100',
+        profiling_token: Optional[str] = None,
+        model_names: Optional[List[str]] = None,
 ) -> AppEnvironment:
-    return AppEnvironment(csv_location, season, football_data_api_key)
\ No newline at end of file
+    return AppEnvironment(
+        csv_location,
+        season,
+        football_data_api_key,
+        profiling_token=profiling_token,
+        model_names=model_names,
+    )
\ No newline at end of file
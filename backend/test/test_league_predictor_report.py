@@ -0,0 +1,32 @@
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.league_predictor_report import predictor_reports_for
+
+CSV = """season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2020,2020-11-13,0000,League A,Always Scores,Rarely Scores,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,3,0,0.49,0.45,1.05,0.75,3.15,0.0
+2021,2021-11-13,0000,League A,Always Scores,Rarely Scores,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,0,2,0.49,0.45,1.05,0.75,3.15,0.0
+2020,2020-11-14,0000,League B,Other,Another,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,1,1,0.49,0.45,1.05,0.75,3.15,0.0
+2021,2021-11-14,0000,League B,Other,Another,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,2,0,0.49,0.45,1.05,0.75,3.15,0.0"""
+
+
+class TestLeaguePredictorReport(TestCase):
+    @responses.activate
+    def test_predictor_reports_for(self) -> None:
+        responses.add(method='GET', url='https://example.com/some.csv', status=200, body=CSV)
+
+        with redirect_stdout(io.StringIO()) as output:
+            league_reports = predictor_reports_for(
+                ['League A', 'League B'], 2021, 'https://example.com/some.csv',
+                processes=2, model_names=['Home', 'Points'],
+            )
+
+        self.assertEqual([(title, [(r.label, r.accuracy) for r in reports]) for title, reports in league_reports], [
+            ('League A 2021', [('Home', 0.0), ('Points', 0.0)]),
+            ('League B 2021', [('Home', 1.0), ('Points', 0.0)]),
+        ])
+        self.assertLess(output.getvalue().index('League A 2021'), output.getvalue().index('League B 2021'))
+        self.assertEqual(len(responses.calls), 1)
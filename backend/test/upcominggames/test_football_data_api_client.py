@@ -0,0 +1,45 @@
+from threading import Thread
+from unittest import TestCase
+
+from werkzeug.serving import make_server
+
+from fakefootballdata.fake_server import FakeSettings, create_fake_server
+from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient
+
+
+class TestFootballDataApiClient(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        # Serve the fake football-data API over HTTP, so that timeouts are real
+        self.fake = create_fake_server(FakeSettings(matches=3))
+        self.server = make_server('127.0.0.1', 0, self.fake, threaded=True)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}/v4'
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        super().tearDown()
+
+    def test_fetch_matches(self) -> None:
+        response = FootballDataApiClient('key', self.base_url).fetch_matches()
+
+        assert response is not None
+        self.assertEqual(len(response.matches), 3)
+        self.assertEqual(response.matches[0].competition.name, 'Synthetic League 1')
+
+    def test_fetch_matches__times_out(self) -> None:
+        self.fake.test_client().put('/admin/settings', json={'latency_ms': 500})
+
+        self.assertIsNone(FootballDataApiClient('key', self.base_url, timeout=0.05).fetch_matches())
+
+    def test_fetch_matches__rate_limited(self) -> None:
+        self.fake.test_client().put('/admin/settings', json={'rate_limit_rate': 1})
+
+        self.assertIsNone(FootballDataApiClient('key', self.base_url).fetch_matches())
+
+    def test_fetch_matches__unreachable(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+        self.assertIsNone(FootballDataApiClient('key', self.base_url, timeout=1).fetch_matches())
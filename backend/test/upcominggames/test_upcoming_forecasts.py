@@ -0,0 +1,62 @@
+from typing import List, Sequence
+from unittest import TestCase
+
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.model.model_provider import ModelProvider, Model
+from matchpredictor.predictors.predictor import Prediction, Predictor
+from matchpredictor.upcominggames.upcoming_forecasts import UpcomingForecasts
+
+
+class CountingHome(Predictor):
+    def __init__(self) -> None:
+        self.batches: List[int] = []
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return Prediction(outcome=Outcome.HOME)
+
+    def predict_all(self, fixtures: Sequence[Fixture]) -> List[Prediction]:
+        self.batches.append(len(fixtures))
+        return super().predict_all(fixtures)
+
+
+class TestUpcomingForecasts(TestCase):
+    def setUp(self) -> None:
+        self.predictor = CountingHome()
+        self.models = ModelProvider([Model("Home", self.predictor, version="a")])
+        self.upcoming_forecasts = UpcomingForecasts(Forecaster(self.models))
+
+    def test_forecasts_for__in_one_batch(self) -> None:
+        fixtures = [
+            Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League'),
+            Fixture(Team('Arsenal'), Team('Fulham'), 'Premier League'),
+        ]
+
+        forecasts = self.upcoming_forecasts.forecasts_for(fixtures, 'Home')
+
+        self.assertEqual([Outcome.HOME, Outcome.HOME], [f.outcome for f in forecasts if f is not None])
+        self.assertEqual([2], self.predictor.batches)
+
+    def test_forecasts_for__cached_until_snapshot_changes(self) -> None:
+        fixtures = [Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')]
+
+        first = self.upcoming_forecasts.forecasts_for(fixtures, 'Home')
+        second = self.upcoming_forecasts.forecasts_for(list(fixtures), 'Home')
+
+        self.assertIs(first, second)
+        self.assertEqual([1], self.predictor.batches)
+
+        self.upcoming_forecasts.forecasts_for(fixtures + [Fixture(Team('Arsenal'), Team('Fulham'), 'Premier League')],
+                                              'Home')
+
+        self.assertEqual([1, 2], self.predictor.batches)
+
+    def test_forecasts_for__cached_until_model_version_changes(self) -> None:
+        fixtures = [Fixture(Team('Chelsea'), Team('Burnley'), 'Premier League')]
+
+        self.upcoming_forecasts.forecasts_for(fixtures, 'Home')
+        self.models.replace_model(Model("Home", self.predictor, version="b"))
+        self.upcoming_forecasts.forecasts_for(fixtures, 'Home')
+        self.upcoming_forecasts.forecasts_for(fixtures, 'Home')
+
+        self.assertEqual([1, 1], self.predictor.batches)
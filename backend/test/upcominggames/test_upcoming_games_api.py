@@ -80,6 +80,59 @@ class TestUpcomingGamesApi(TestCase):
         recorded_request = responses.calls[0].request
         self.assertEqual('my-api-key', recorded_request.headers['X-Auth-Token'])
 
+    @responses.activate
+    def test_list__with_forecasts(self) -> None:
+        sample_football_data_response = """{
+            "matches": [
+                {
+                    "competition": {"name": "Premier League"},
+                    "homeTeam": {"name": "Chelsea"},
+                    "awayTeam": {"name": "Manchester United"}
+                },
+                {
+                    "competition": {"name": "Premier League"},
+                    "homeTeam": {"name": "Chelsea"},
+                    "awayTeam": {"name": "Chelsea"}
+                }
+            ]
+        }
+        """
+
+        responses.add(
+            method='GET',
+            url='https://api.football-data.org/v4/matches',
+            status=200,
+            body=sample_football_data_response
+        )
+
+        response = self.test_client.get('/upcoming-games?model_name=Home&model_name=Points&model_name=Bad+model')
+
+        fixture = {
+            'home_team': {'name': 'Chelsea'},
+            'away_team': {'name': 'Manchester United'},
+            'league': 'Premier League',
+        }
+        expected_body = {
+            "games": [
+                {
+                    "home": {"name": "Chelsea", "leagues": ["Premier League"]},
+                    "away": {"name": "Manchester United", "leagues": ["Premier League"]},
+                    "forecasts": [
+                        {'fixture': fixture, 'model_name': 'Home', 'outcome': 'home', 'confidence': None},
+                        {'fixture': fixture, 'model_name': 'Points', 'outcome': 'away', 'confidence': None},
+                    ]
+                },
+                {
+                    "home": {"name": "Chelsea", "leagues": ["Premier League"]},
+                    "away": {"name": "Chelsea", "leagues": ["Premier League"]},
+                    "forecasts": []
+                },
+            ]
+        }
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(expected_body, response.get_json())
+
     @responses.activate
     def test_list__with_unexpected_json_from_football_data(self) -> None:
 